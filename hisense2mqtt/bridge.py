@@ -1,7 +1,6 @@
 """Main bridge class for hisense2mqtt."""
 
 import ipaddress
-import json
 import logging
 import signal
 import sys
@@ -15,10 +14,13 @@ import paho.mqtt.client as mqtt
 sys.path.insert(0, str(__file__).rsplit("/", 2)[0])
 from pyvidaa.client import VidaaTV
 from pyvidaa.wol import wake_tv
-from pyvidaa.keys import ALL_KEYS
+from pyvidaa.keys import ALL_KEYS_SET
 
 from .config import expand_tv_configs, get_device_id, load_config, validate_config
-from .discovery import generate_all_discoveries, remove_all_discoveries
+from .discovery import (
+    generate_serialized_discoveries,
+    remove_all_discoveries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -276,7 +278,7 @@ class VidaaMQTTBridge:
         if not key.startswith("KEY_"):
             key = f"KEY_{key}"
 
-        if key not in ALL_KEYS:
+        if key not in ALL_KEYS_SET:
             logger.warning(f"Unknown key: {payload}")
             return
 
@@ -465,10 +467,10 @@ class VidaaMQTTBridge:
         if self._app_list:
             app_names = [app.get("name") for app in self._app_list if app.get("name")]
 
-        discoveries = generate_all_discoveries(self.config, self.device_id, apps=app_names)
+        discoveries = generate_serialized_discoveries(self.config, self.device_id, apps=app_names)
 
         for topic, payload in discoveries:
-            self._broker_client.publish(topic, json.dumps(payload), qos=0, retain=True)
+            self._broker_client.publish(topic, payload, qos=0, retain=True)
             logger.debug(f"Discovery: {topic}")
 
         logger.info(f"Published {len(discoveries)} discovery messages")
@@ -6,6 +6,11 @@ from typing import Any, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 DEFAULT_CONFIG = {
     "mqtt": {
         "host": "localhost",
@@ -132,7 +137,7 @@ def load_config(config_path: Optional[str] = None) -> dict:
     for path in search_paths:
         if path.exists():
             with open(path) as f:
-                user_config = yaml.safe_load(f) or {}
+                user_config = yaml.load(f, Loader=_Loader) or {}
             config = deep_merge(config, user_config)
             config["_config_path"] = str(path)
             break
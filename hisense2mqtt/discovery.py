@@ -1,10 +1,57 @@
 """Home Assistant MQTT Discovery for hisense2mqtt."""
 
 import json
-from typing import Any, Optional
+from typing import Iterator, Optional
 
 from . import __version__
 
+try:
+    from msgspec.json import Encoder as _MsgspecEncoder
+
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+_SOURCES = ("TV", "HDMI1", "HDMI2", "HDMI3", "HDMI4", "AV", "Component")
+
+# (button_id, name, icon) for the remote navigation buttons
+_NAV_BUTTONS = (
+    ("up", "Up", "mdi:chevron-up"),
+    ("down", "Down", "mdi:chevron-down"),
+    ("left", "Left", "mdi:chevron-left"),
+    ("right", "Right", "mdi:chevron-right"),
+    ("ok", "OK", "mdi:checkbox-marked-circle"),
+    ("back", "Back", "mdi:arrow-left"),
+    ("home", "Home", "mdi:home"),
+    ("menu", "Menu", "mdi:menu"),
+)
+
+_DEFAULT_APPS = ("Netflix", "YouTube", "Amazon", "Disney+", "Hulu", "Tubi")
+
+# Placeholder device id used to render the serialized discovery templates
+_DEVICE_ID_PLACEHOLDER = "@@hisense2mqtt-device-id@@"
+
+# Serialized discovery templates keyed by everything except the device id.
+# Each entry is a (topic parts, payload parts) pair split on the placeholder.
+_template_cache: dict[tuple, list[tuple[list[str], list[bytes]]]] = {}
+_TEMPLATE_CACHE_SIZE = 32
+
+if HAS_MSGSPEC:
+    _encode_payload = _MsgspecEncoder().encode
+else:
+    _encode_payload = None
+
+
+def encode_discovery_payload(payload: dict) -> bytes:
+    """Serialize a discovery payload to compact JSON bytes.
+
+    Uses msgspec's encoder when it is installed, falling back to the
+    standard library json module.
+    """
+    if _encode_payload is not None:
+        return _encode_payload(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
 
 def get_device_info(config: dict, device_id: str) -> dict:
     """Generate Home Assistant device info from config."""
@@ -30,22 +77,39 @@ def get_availability(device_id: str) -> list[dict]:
     ]
 
 
-def generate_media_player_discovery(config: dict, device_id: str, discovery_prefix: str) -> tuple[str, dict]:
+def _shared_parts(
+    config: dict, device_id: str, device_info: Optional[dict], availability: Optional[list[dict]]
+) -> tuple[dict, list[dict]]:
+    """Build whichever of the device block and availability wasn't passed in."""
+    if device_info is None:
+        device_info = get_device_info(config, device_id)
+    if availability is None:
+        availability = get_availability(device_id)
+    return device_info, availability
+
+
+def generate_media_player_discovery(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> tuple[str, dict]:
     """Generate media player discovery payload.
 
     Returns:
         Tuple of (topic, payload)
     """
-    topic = f"{discovery_prefix}/media_player/hisense_{device_id}/config"
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
 
-    sources = ["TV", "HDMI1", "HDMI2", "HDMI3", "HDMI4", "AV", "Component"]
+    topic = f"{discovery_prefix}/media_player/hisense_{device_id}/config"
 
     payload = {
         "name": None,  # Use device name
         "unique_id": f"hisense_{device_id}_media_player",
         "object_id": f"hisense_{device_id}",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         # State - use "on"/"off" for proper logbook events
         "state_topic": f"hisense2mqtt/{device_id}/state/power",
         "state_value_template": "{{ 'on' if value == 'ON' else 'off' }}",
@@ -63,7 +127,7 @@ def generate_media_player_discovery(config: dict, device_id: str, discovery_pref
         "payload_mute_on": "ON",
         "payload_mute_off": "OFF",
         # Source / Current App
-        "source_list": sources,
+        "source_list": list(_SOURCES),
         "source_topic": f"hisense2mqtt/{device_id}/state/source",
         "source_command_topic": f"hisense2mqtt/{device_id}/set/source",
         # Media info - shows current app
@@ -76,16 +140,24 @@ def generate_media_player_discovery(config: dict, device_id: str, discovery_pref
     return topic, payload
 
 
-def generate_power_switch_discovery(config: dict, device_id: str, discovery_prefix: str) -> tuple[str, dict]:
+def generate_power_switch_discovery(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> tuple[str, dict]:
     """Generate switch for power control."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/switch/hisense_{device_id}_power/config"
 
     payload = {
         "name": "Power",
         "unique_id": f"hisense_{device_id}_power",
         "object_id": f"hisense_{device_id}_power",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "state_topic": f"hisense2mqtt/{device_id}/state/power",
         "command_topic": f"hisense2mqtt/{device_id}/set/power",
         "payload_on": "ON",
@@ -98,16 +170,24 @@ def generate_power_switch_discovery(config: dict, device_id: str, discovery_pref
     return topic, payload
 
 
-def generate_app_sensor_discovery(config: dict, device_id: str, discovery_prefix: str) -> tuple[str, dict]:
+def generate_app_sensor_discovery(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> tuple[str, dict]:
     """Generate sensor for current app."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/sensor/hisense_{device_id}_app/config"
 
     payload = {
         "name": "Current App",
         "unique_id": f"hisense_{device_id}_current_app",
         "object_id": f"hisense_{device_id}_current_app",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "state_topic": f"hisense2mqtt/{device_id}/state/app",
         "icon": "mdi:application",
     }
@@ -115,16 +195,24 @@ def generate_app_sensor_discovery(config: dict, device_id: str, discovery_prefix
     return topic, payload
 
 
-def generate_volume_discovery(config: dict, device_id: str, discovery_prefix: str) -> tuple[str, dict]:
+def generate_volume_discovery(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> tuple[str, dict]:
     """Generate number entity for volume control."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/number/hisense_{device_id}_volume/config"
 
     payload = {
         "name": "Volume",
         "unique_id": f"hisense_{device_id}_volume",
         "object_id": f"hisense_{device_id}_volume",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "state_topic": f"hisense2mqtt/{device_id}/state/volume",
         "command_topic": f"hisense2mqtt/{device_id}/set/volume",
         "min": 0,
@@ -137,16 +225,24 @@ def generate_volume_discovery(config: dict, device_id: str, discovery_prefix: st
     return topic, payload
 
 
-def generate_mute_switch_discovery(config: dict, device_id: str, discovery_prefix: str) -> tuple[str, dict]:
+def generate_mute_switch_discovery(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> tuple[str, dict]:
     """Generate switch for mute control."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/switch/hisense_{device_id}_mute/config"
 
     payload = {
         "name": "Mute",
         "unique_id": f"hisense_{device_id}_mute",
         "object_id": f"hisense_{device_id}_mute",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "state_topic": f"hisense2mqtt/{device_id}/state/mute",
         "command_topic": f"hisense2mqtt/{device_id}/set/mute",
         "payload_on": "ON",
@@ -160,17 +256,26 @@ def generate_mute_switch_discovery(config: dict, device_id: str, discovery_prefi
 
 
 def generate_button_discovery(
-    config: dict, device_id: str, discovery_prefix: str, button_id: str, name: str, icon: str
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    button_id: str,
+    name: str,
+    icon: str,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
 ) -> tuple[str, dict]:
     """Generate button discovery payload for remote keys."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/button/hisense_{device_id}_{button_id}/config"
 
     payload = {
         "name": name,
         "unique_id": f"hisense_{device_id}_{button_id}",
         "object_id": f"hisense_{device_id}_{button_id}",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "command_topic": f"hisense2mqtt/{device_id}/set/key",
         "payload_press": button_id.upper(),
         "icon": icon,
@@ -179,18 +284,65 @@ def generate_button_discovery(
     return topic, payload
 
 
+def generate_button_discoveries(
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    buttons: tuple[tuple[str, str, str], ...] = _NAV_BUTTONS,
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
+) -> list[tuple[str, dict]]:
+    """Generate button discovery payloads for several remote keys at once.
+
+    Args:
+        buttons: (button_id, name, icon) tuples, defaults to the navigation buttons
+
+    Returns:
+        List of (topic, payload) tuples
+    """
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
+    common = {
+        "device": device_info,
+        "availability": availability,
+        "command_topic": f"hisense2mqtt/{device_id}/set/key",
+    }
+
+    return [
+        (
+            f"{discovery_prefix}/button/hisense_{device_id}_{button_id}/config",
+            {
+                "name": name,
+                "unique_id": f"hisense_{device_id}_{button_id}",
+                "object_id": f"hisense_{device_id}_{button_id}",
+                **common,
+                "payload_press": button_id.upper(),
+                "icon": icon,
+            },
+        )
+        for button_id, name, icon in buttons
+    ]
+
+
 def generate_select_discovery(
-    config: dict, device_id: str, discovery_prefix: str, apps: list[str]
+    config: dict,
+    device_id: str,
+    discovery_prefix: str,
+    apps: list[str],
+    device_info: Optional[dict] = None,
+    availability: Optional[list[dict]] = None,
 ) -> tuple[str, dict]:
     """Generate select discovery for app launcher."""
+    device_info, availability = _shared_parts(config, device_id, device_info, availability)
+
     topic = f"{discovery_prefix}/select/hisense_{device_id}_app/config"
 
     payload = {
         "name": "Launch App",
         "unique_id": f"hisense_{device_id}_app",
         "object_id": f"hisense_{device_id}_app",
-        "device": get_device_info(config, device_id),
-        "availability": get_availability(device_id),
+        "device": device_info,
+        "availability": availability,
         "command_topic": f"hisense2mqtt/{device_id}/set/app",
         "options": apps,
         "icon": "mdi:apps",
@@ -199,6 +351,47 @@ def generate_select_discovery(
     return topic, payload
 
 
+def iter_all_discoveries(
+    config: dict, device_id: str, apps: Optional[list[str]] = None
+) -> Iterator[tuple[str, dict]]:
+    """Yield all discovery payloads one at a time.
+
+    Args:
+        config: Configuration dictionary
+        device_id: Unique device identifier
+        apps: List of app names from TV (optional, uses defaults if not provided)
+
+    Yields:
+        (topic, payload) tuples
+    """
+    discovery_prefix = config.get("mqtt", {}).get("discovery_prefix", "homeassistant")
+
+    # Every payload shares the same device and availability objects
+    shared = {
+        "device_info": get_device_info(config, device_id),
+        "availability": get_availability(device_id),
+    }
+
+    # App launcher - use provided apps or defaults
+    if apps is None:
+        apps = list(_DEFAULT_APPS)
+
+    # Media player (main entity)
+    yield generate_media_player_discovery(config, device_id, discovery_prefix, **shared)
+    # Power switch (controllable)
+    yield generate_power_switch_discovery(config, device_id, discovery_prefix, **shared)
+    # Volume control
+    yield generate_volume_discovery(config, device_id, discovery_prefix, **shared)
+    # Mute switch
+    yield generate_mute_switch_discovery(config, device_id, discovery_prefix, **shared)
+    # Current app sensor
+    yield generate_app_sensor_discovery(config, device_id, discovery_prefix, **shared)
+    # Navigation buttons
+    yield from generate_button_discoveries(config, device_id, discovery_prefix, **shared)
+    # App launcher
+    yield generate_select_discovery(config, device_id, discovery_prefix, apps, **shared)
+
+
 def generate_all_discoveries(
     config: dict, device_id: str, apps: Optional[list[str]] = None
 ) -> list[tuple[str, dict]]:
@@ -212,46 +405,55 @@ def generate_all_discoveries(
     Returns:
         List of (topic, payload) tuples
     """
-    discovery_prefix = config.get("mqtt", {}).get("discovery_prefix", "homeassistant")
-    discoveries = []
+    return list(iter_all_discoveries(config, device_id, apps=apps))
 
-    # Media player (main entity)
-    discoveries.append(generate_media_player_discovery(config, device_id, discovery_prefix))
-
-    # Power switch (controllable)
-    discoveries.append(generate_power_switch_discovery(config, device_id, discovery_prefix))
 
-    # Volume control
-    discoveries.append(generate_volume_discovery(config, device_id, discovery_prefix))
+def generate_serialized_discoveries(
+    config: dict, device_id: str, apps: Optional[list[str]] = None
+) -> list[tuple[str, bytes]]:
+    """Generate all discovery messages as ready-to-publish JSON bytes.
 
-    # Mute switch
-    discoveries.append(generate_mute_switch_discovery(config, device_id, discovery_prefix))
+    The discovery set is rendered and serialized once with a placeholder
+    device id and cached as byte templates; later calls only splice the
+    device id into them.
 
-    # Current app sensor
-    discoveries.append(generate_app_sensor_discovery(config, device_id, discovery_prefix))
+    Args:
+        config: Configuration dictionary
+        device_id: Unique device identifier
+        apps: List of app names from TV (optional, uses defaults if not provided)
 
-    # Navigation buttons
-    nav_buttons = [
-        ("up", "Up", "mdi:chevron-up"),
-        ("down", "Down", "mdi:chevron-down"),
-        ("left", "Left", "mdi:chevron-left"),
-        ("right", "Right", "mdi:chevron-right"),
-        ("ok", "OK", "mdi:checkbox-marked-circle"),
-        ("back", "Back", "mdi:arrow-left"),
-        ("home", "Home", "mdi:home"),
-        ("menu", "Menu", "mdi:menu"),
+    Returns:
+        List of (topic, payload) tuples
+    """
+    discovery_prefix = config.get("mqtt", {}).get("discovery_prefix", "homeassistant")
+    tv_config = config.get("tv", {})
+    key = (
+        discovery_prefix,
+        tv_config.get("name"),
+        tv_config.get("model"),
+        tv_config.get("sw_version"),
+        tuple(apps) if apps is not None else None,
+    )
+
+    templates = _template_cache.get(key)
+    if templates is None:
+        placeholder = _DEVICE_ID_PLACEHOLDER.encode()
+        rendered = iter_all_discoveries(config, _DEVICE_ID_PLACEHOLDER, apps=apps)
+        templates = [
+            (topic.split(_DEVICE_ID_PLACEHOLDER), encode_discovery_payload(payload).split(placeholder))
+            for topic, payload in rendered
+        ]
+        if len(_template_cache) >= _TEMPLATE_CACHE_SIZE:
+            _template_cache.clear()
+        _template_cache[key] = templates
+
+    # The id lands inside JSON strings, so splice in its escaped form
+    device_id_json = json.dumps(device_id)[1:-1].encode()
+    discoveries = [
+        (device_id.join(topic_parts), device_id_json.join(payload_parts))
+        for topic_parts, payload_parts in templates
     ]
 
-    for button_id, name, icon in nav_buttons:
-        discoveries.append(
-            generate_button_discovery(config, device_id, discovery_prefix, button_id, name, icon)
-        )
-
-    # App launcher - use provided apps or defaults
-    if apps is None:
-        apps = ["Netflix", "YouTube", "Amazon", "Disney+", "Hulu", "Tubi"]
-    discoveries.append(generate_select_discovery(config, device_id, discovery_prefix, apps))
-
     return discoveries
 
 
@@ -262,20 +464,17 @@ def remove_all_discoveries(config: dict, device_id: str) -> list[str]:
         List of topics to publish empty payload to
     """
     discovery_prefix = config.get("mqtt", {}).get("discovery_prefix", "homeassistant")
+    uid = f"hisense_{device_id}"
 
-    topics = [
-        f"{discovery_prefix}/media_player/hisense_{device_id}/config",
-        f"{discovery_prefix}/switch/hisense_{device_id}_power/config",
-        f"{discovery_prefix}/number/hisense_{device_id}_volume/config",
-        f"{discovery_prefix}/switch/hisense_{device_id}_mute/config",
-        f"{discovery_prefix}/sensor/hisense_{device_id}_app/config",
-        f"{discovery_prefix}/select/hisense_{device_id}_app/config",
+    # Same order as iter_all_discoveries, without building any payloads
+    return [
+        f"{discovery_prefix}/media_player/{uid}/config",
+        f"{discovery_prefix}/switch/{uid}_power/config",
+        f"{discovery_prefix}/number/{uid}_volume/config",
+        f"{discovery_prefix}/switch/{uid}_mute/config",
+        f"{discovery_prefix}/sensor/{uid}_app/config",
+        *(f"{discovery_prefix}/button/{uid}_{button_id}/config" for button_id, _, _ in _NAV_BUTTONS),
+        f"{discovery_prefix}/select/{uid}_app/config",
         # Legacy binary_sensor (in case upgrading from old version)
         f"{discovery_prefix}/binary_sensor/hisense_{device_id}_power/config",
     ]
-
-    nav_buttons = ["up", "down", "left", "right", "ok", "back", "home", "menu"]
-    for button_id in nav_buttons:
-        topics.append(f"{discovery_prefix}/button/hisense_{device_id}_{button_id}/config")
-
-    return topics
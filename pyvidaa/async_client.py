@@ -1,47 +1,270 @@
 """Async wrapper for Hisense TV MQTT client.
 
 Provides asyncio-compatible interface for controlling Hisense/Vidaa TVs.
-Uses executor to run sync operations in a thread pool.
+Commands that only publish an MQTT message are issued directly on the event
+loop (paho's publish just queues the packet for its network thread); anything
+that blocks - connecting, or waiting for a reply from the TV - runs on a
+dedicated worker thread per TV.
 
 For Home Assistant integration, use AsyncVidaaTV with hass.async_add_executor_job().
 """
 
 import asyncio
 import logging
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import CancelledError as _FutureCancelledError
+from concurrent.futures import Future as _ConcurrentFuture
 from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import Any, Callable, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List, Tuple, TYPE_CHECKING
 
-from .client import VidaaTV
 from .config import (
     DEFAULT_PORT,
     DEFAULT_MQTT_USERNAME,
     DEFAULT_MQTT_PASSWORD,
     DEFAULT_CLIENT_ID,
-    TokenStorage,
-    get_storage,
 )
-from .protocol import AuthMethod
+from .topics import (
+    APPS,
+    TOPIC_GET_APPS,
+    TOPIC_GET_CAPABILITY,
+    TOPIC_GET_DEVICE_INFO,
+    TOPIC_GET_SOURCES,
+    TOPIC_GET_STATE,
+    TOPIC_GET_TV_INFO,
+    TOPIC_GET_VOLUME,
+)
+
+# The sync client (paho, ssl) and protocol detection are only imported once a
+# client is actually built, so discovery-only users don't pay for them.
+if TYPE_CHECKING:
+    from .client import VidaaTV
+    from .config import TokenStorage
+    from .protocol import AuthMethod
 
 _LOGGER = logging.getLogger(__name__)
 
-# Default thread pool for blocking operations
-_DEFAULT_EXECUTOR: Optional[ThreadPoolExecutor] = None
+# Discovery helpers block on sockets and HTTP, not the CPU, so they share one
+# wide pool; a subnet sweep can then probe every address at once.
+_DISCOVERY_WORKERS = 32
+_DISCOVERY_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_DISCOVERY_EXECUTOR_LOCK = threading.Lock()
+
+# Sync clients shared between handles with identical settings, so short-lived
+# AsyncVidaaTV objects for the same TV reuse one MQTT/TLS session.
+# Maps (host, port, client_id, username) -> (client, init_kwargs, connect_lock);
+# the lock keeps handles from connecting the same client at the same time.
+#
+# The pool, not any one handle, owns a client's lifetime. Every handle holds
+# one reference from its first use until async_disconnect(), disconnect(),
+# async_reset() or its garbage collection, and whichever reference goes last
+# disconnects the client. async_reset() also evicts the client from the pool,
+# so the next handle to connect builds a fresh one while current holders keep
+# the old session until they let go.
+_CLIENT_POOL: Dict[tuple, tuple] = {}
+# Handle count per client, pooled, evicted or private
+_CLIENT_REFS: Dict["VidaaTV", int] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def _get_discovery_executor() -> ThreadPoolExecutor:
+    """Get or create the shared executor used by the discovery helpers."""
+    global _DISCOVERY_EXECUTOR
+    if _DISCOVERY_EXECUTOR is None:
+        with _DISCOVERY_EXECUTOR_LOCK:
+            if _DISCOVERY_EXECUTOR is None:
+                _DISCOVERY_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=_DISCOVERY_WORKERS,
+                    thread_name_prefix="pyvidaa_discovery",
+                )
+    return _DISCOVERY_EXECUTOR
+
+
+def _pool_key(kwargs: dict) -> tuple:
+    return (kwargs["host"], kwargs["port"], kwargs["client_id"], kwargs["username"])
+
+
+def _acquire_client(kwargs: dict) -> Tuple["VidaaTV", threading.Lock]:
+    """Get a sync client for these settings, reusing a pooled one if possible.
+
+    Returns the client and the lock serializing its connects. A pooled client is only shared when every init setting matches, since
+    callbacks and storage belong to the client. Blocking; run in the worker.
+    """
+    key = _pool_key(kwargs)
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(key)
+        if entry is not None and entry[1] == kwargs:
+            client = entry[0]
+            _CLIENT_REFS[client] += 1
+            return client, entry[2]
+
+    from .client import VidaaTV
+
+    # Built outside the lock: VidaaTV.__init__ does blocking SSL setup
+    client = VidaaTV(**kwargs)
+    connect_lock = threading.Lock()
+    with _CLIENT_POOL_LOCK:
+        _CLIENT_REFS[client] = 1
+        # Lost a race or settings differ: the client simply stays private
+        _CLIENT_POOL.setdefault(key, (client, kwargs, connect_lock))
+    return client, connect_lock
+
+
+def _is_shared(client: "VidaaTV") -> bool:
+    """Whether more than one handle currently holds client."""
+    with _CLIENT_POOL_LOCK:
+        return _CLIENT_REFS.get(client, 0) > 1
+
+
+def _release_client(kwargs: dict, client: "VidaaTV", evict: bool = False) -> None:
+    """Drop one handle on a client, disconnecting it when the last one goes.
+
+    With evict, the client also leaves the pool so later handles build a
+    new one; any other current holders keep using it until they release.
+    """
+    key = _pool_key(kwargs)
+    with _CLIENT_POOL_LOCK:
+        entry = _CLIENT_POOL.get(key)
+        if entry is not None and entry[0] is client and evict:
+            del _CLIENT_POOL[key]
+        refs = _CLIENT_REFS.get(client)
+        if refs is not None:
+            if refs > 1:
+                _CLIENT_REFS[client] = refs - 1
+                return
+            del _CLIENT_REFS[client]
+        entry = _CLIENT_POOL.get(key)
+        if entry is not None and entry[0] is client:
+            del _CLIENT_POOL[key]
+    client.disconnect()
+
+
+def _make_async_key(name: str, doc: str) -> Callable[["AsyncVidaaTV"], Awaitable[bool]]:
+    """Build an async remote-key method that forwards to the sync client.
+
+    The simple key methods are all the same publish-only call, so they share
+    this one body instead of being written out individually.
+    """
+    async def method(self: "AsyncVidaaTV") -> bool:
+        return await self._send(name)
+
+    method.__name__ = f"async_{name}"
+    method.__qualname__ = f"AsyncVidaaTV.async_{name}"
+    method.__doc__ = doc
+    return method
+
+
+def _make_sync_alias(name: str) -> Callable[..., Any]:
+    """Build a blocking alias that forwards to the sync client's method.
+
+    All the aliases share this one body; only the name and docstring differ.
+    """
+    def method(self: "AsyncVidaaTV", *args, **kwargs) -> Any:
+        return getattr(self._ensure_client(), name)(*args, **kwargs)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncVidaaTV.{name}"
+    method.__doc__ = f"Sync {name} (blocking)."
+    return method
+
+
+def _transfer_outcome(loop: asyncio.AbstractEventLoop, future: asyncio.Future, done: _ConcurrentFuture) -> None:
+    """Hand an executor job's outcome to its asyncio future.
+
+    Runs in the worker thread as the job's done-callback and reads the
+    outcome with a single result() call, instead of the separate
+    cancelled()/exception()/result() lock round trips asyncio's generic
+    future chaining makes.
+    """
+    try:
+        result = done.result()
+    except BaseException as err:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_set_error, future, err)
+        return
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(_set_result, future, result)
+
+
+def _pump(jobs: deque, wake: threading.Event) -> None:
+    """Worker thread body: run queued (func, args, future, loop) jobs in order.
+
+    A None entry stops the worker once everything queued before it has run.
+    """
+    while True:
+        wake.wait()
+        wake.clear()
+        while jobs:
+            job = jobs.popleft()
+            if job is None:
+                return
+            _run_job(*job)
+            # An idle worker must not keep its handle alive through a bound method
+            job = None
+
+
+def _run_job(func: Callable, args: tuple, future: asyncio.Future, loop: asyncio.AbstractEventLoop) -> None:
+    """Run one queued job and hand its outcome to the loop."""
+    # Cancelled while waiting in the queue
+    if future.cancelled():
+        return
+    try:
+        result = func(*args)
+    except BaseException as err:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(_set_error, future, err)
+        return
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(_set_result, future, result)
+
+
+def _stop_pump(jobs: deque, wake: threading.Event) -> None:
+    """Ask a worker to exit after its queued jobs (also run at collection)."""
+    jobs.append(None)
+    wake.set()
+
 
+def _retrieve_error(future: asyncio.Future) -> None:
+    """Mark a background future's error as seen; its owner retries later."""
+    if not future.cancelled():
+        future.exception()
 
-def _get_executor() -> ThreadPoolExecutor:
-    """Get or create the default thread pool executor."""
-    global _DEFAULT_EXECUTOR
-    if _DEFAULT_EXECUTOR is None:
-        _DEFAULT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pyvidaa")
-    return _DEFAULT_EXECUTOR
+
+def _cancel_job(job: _ConcurrentFuture, future: asyncio.Future) -> None:
+    """Cancel an executor job whose asyncio future was cancelled."""
+    if future.cancelled():
+        job.cancel()
+
+
+def _post_result(loop: asyncio.AbstractEventLoop, future: asyncio.Future, result: Any) -> None:
+    """Hand a result from another thread to its asyncio future."""
+    if not loop.is_closed():
+        loop.call_soon_threadsafe(_set_result, future, result)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> None:
+    """Resolve an asyncio future with a job's result (loop side)."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_error(future: asyncio.Future, error: BaseException) -> None:
+    """Fail (or cancel) an asyncio future with a job's error (loop side)."""
+    if future.done():
+        return
+    if isinstance(error, _FutureCancelledError):
+        future.cancel()
+    else:
+        future.set_exception(error)
 
 
 class AsyncVidaaTV:
     """Async wrapper for VidaaTV client.
 
     Provides asyncio-compatible methods for TV control.
-    All blocking operations are run in a thread pool executor.
+    All blocking operations are run on a dedicated worker thread.
 
     Example usage:
         async with AsyncVidaaTV("192.168.1.50") as tv:
@@ -66,16 +289,17 @@ class AsyncVidaaTV:
         certfile: Optional[str] = None,
         keyfile: Optional[str] = None,
         enable_persistence: bool = True,
-        storage: Optional[TokenStorage] = None,
+        storage: Optional["TokenStorage"] = None,
         on_state_change: Optional[Callable[[dict], None]] = None,
         on_auth_required: Optional[Callable[[], None]] = None,
         mac_address: Optional[str] = None,
         use_dynamic_auth: bool = False,
         brand: str = "his",
-        auth_method: Optional[AuthMethod] = None,
+        auth_method: Optional["AuthMethod"] = None,
         auto_detect_protocol: bool = True,
         executor: Optional[ThreadPoolExecutor] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        prewarm: bool = False,
     ):
         """Initialize async Hisense TV client.
 
@@ -98,11 +322,29 @@ class AsyncVidaaTV:
             brand: TV brand identifier
             auth_method: Authentication method (LEGACY, MIDDLE, MODERN)
             auto_detect_protocol: Auto-detect protocol version
-            executor: Custom ThreadPoolExecutor (uses default if None)
-            loop: Event loop (uses current if None)
+            executor: Custom ThreadPoolExecutor (a dedicated worker thread
+                is started per instance if None)
+            loop: Event loop (uses the running loop on first use if None)
+            prewarm: When created inside a running loop, start building the
+                sync client (SSL context, paho setup, token lookup and any
+                protocol probe) in the background. Off by default, since it
+                starts the worker and takes a pooled client before connect
         """
-        self._executor = executor or _get_executor()
+        # Each TV gets its own worker thread so its commands run in FIFO order
+        # and several TVs never queue behind each other; a caller-supplied
+        # executor is used as-is and left for the caller to shut down.
+        self._executor = executor
         self._loop = loop
+        # Read on every poll; kept outside _init_kwargs for a cheap lookup,
+        # and read-only so they can't drift from the pool key
+        self._host = host
+        self._port = port
+
+        # Worker thread state, started on first use (see _submit)
+        self._jobs: deque = deque()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_finalizer: Optional[weakref.finalize] = None
 
         # Store init params for lazy client creation
         # Client is NOT created here to avoid blocking SSL calls in event loop
@@ -128,35 +370,118 @@ class AsyncVidaaTV:
         }
 
         # Client is created lazily in _ensure_client() to avoid blocking event loop
-        self._client: Optional[VidaaTV] = None
+        self._client: Optional["VidaaTV"] = None
+        # Serializes connects of _client across every handle sharing it
+        self._connect_lock: Optional[threading.Lock] = None
+        # Gives the pool reference back if the handle is dropped while holding it
+        self._client_finalizer: Optional[weakref.finalize] = None
+        # Bound methods of _methods_client used by _send, by method name
+        self._methods: Dict[str, Callable] = {}
+        self._methods_client: Optional["VidaaTV"] = None
+
+        # State-checked key presses waiting for the next batch flush
+        self._pending_keys: deque = deque()
+        self._batch_task: Optional[asyncio.Task] = None
+
+        # Build the client off the event loop right away so the first
+        # async_connect doesn't pay for SSL context and paho setup
+        self._prewarm: Optional[asyncio.Future] = None
+        if prewarm:
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not None and loop in (None, running):
+                self._prewarm = self._submit(self._ensure_client)
+                self._prewarm.add_done_callback(_retrieve_error)
 
     def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get event loop."""
-        if self._loop is not None:
-            return self._loop
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.get_event_loop()
+        """Get the event loop, remembering the running loop on first use.
+
+        Only called from coroutines, so a running loop always exists. The
+        instance stays bound to that loop afterwards.
+        """
+        loop = self._loop
+        if loop is None:
+            loop = self._loop = asyncio.get_running_loop()
+        return loop
 
-    def _ensure_client(self) -> VidaaTV:
+    def _ensure_client(self) -> "VidaaTV":
         """Ensure the sync client is created (for use in executor).
 
         This must be called from within an executor thread, not the event loop,
         because VidaaTV.__init__ performs blocking SSL operations.
         """
         if self._client is None:
-            self._client = VidaaTV(**self._init_kwargs)
+            client, self._connect_lock = _acquire_client(self._init_kwargs)
+            self._client_finalizer = weakref.finalize(
+                self, _release_client, self._init_kwargs, client
+            )
+            self._client = client
         return self._client
 
+    def _release(self, client: "VidaaTV", evict: bool = False) -> None:
+        """Give this handle's pool reference on client back (blocking)."""
+        finalizer, self._client_finalizer = self._client_finalizer, None
+        if finalizer is not None:
+            finalizer.detach()
+        _release_client(self._init_kwargs, client, evict)
+
     async def _async_ensure_client(self) -> None:
         """Ensure client is created, running in executor to avoid blocking."""
         if self._client is None:
             await self._run_in_executor(self._ensure_client)
 
+    def _start_worker(self) -> None:
+        """Start this instance's worker thread with a fresh job queue."""
+        self._jobs = deque()
+        self._wake = threading.Event()
+        self._worker = threading.Thread(
+            target=_pump,
+            args=(self._jobs, self._wake),
+            name=f"pyvidaa_{self.host}",
+            daemon=True,
+        )
+        self._worker.start()
+        # A handle dropped without disconnecting still lets its worker exit
+        self._worker_finalizer = weakref.finalize(self, _stop_pump, self._jobs, self._wake)
+
+    def _stop_worker(self) -> None:
+        """Stop the worker thread after its queued jobs (restarted on next use)."""
+        if self._worker is not None:
+            self._worker_finalizer()
+            self._worker = None
+
+    def _submit(self, func: Callable, *args, **kwargs) -> asyncio.Future:
+        """Queue func(*args, **kwargs) for the worker and return an asyncio future.
+
+        The default path is just a deque append plus an event set; no
+        concurrent future or done-callback is created per call. A
+        caller-supplied executor goes through executor.submit instead, which
+        takes keyword arguments natively.
+        """
+        loop = self._get_loop()
+        future = loop.create_future()
+        if self._executor is not None:
+            job = self._executor.submit(func, *args, **kwargs)
+            job.add_done_callback(partial(_transfer_outcome, loop, future))
+            # Cancelling the awaiting side drops the job if it has not started
+            future.add_done_callback(partial(_cancel_job, job))
+            return future
+        if kwargs:
+            func = partial(func, **kwargs)
+        if self._worker is None:
+            self._start_worker()
+        self._jobs.append((func, args, future, loop))
+        self._wake.set()
+        return future
+
     async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
         """Run a sync function in the executor.
 
+        Keyword arguments cost a partial per call on the worker path, so the
+        command methods pass their arguments positionally.
+
         Args:
             func: Sync function to run
             *args: Positional arguments
@@ -165,10 +490,11 @@ class AsyncVidaaTV:
         Returns:
             Function result
         """
-        loop = self._get_loop()
-        if kwargs:
-            func = partial(func, **kwargs)
-        return await loop.run_in_executor(self._executor, func, *args)
+        return await self._submit(func, *args, **kwargs)
+
+    def _invoke(self, method_name: str, args: tuple, kwargs: dict) -> Any:
+        """Run a client method by name (executor side of _call)."""
+        return getattr(self._ensure_client(), method_name)(*args, **kwargs)
 
     async def _call(self, method_name: str, *args, **kwargs) -> Any:
         """Call a sync client method in the executor, building the client if needed.
@@ -176,47 +502,97 @@ class AsyncVidaaTV:
         Resolving the client inside the executor (rather than reading
         self._client on the event loop) avoids an AttributeError when a command
         is issued before async_connect() or after async_reset() dropped it.
+        The method name and arguments are passed straight through to
+        _invoke, so no closure or partial is allocated per call.
         """
-        def _run():
-            return getattr(self._ensure_client(), method_name)(*args, **kwargs)
+        return await self._submit(self._invoke, method_name, args, kwargs)
 
-        return await self._run_in_executor(_run)
+    async def _send(self, method_name: str, *args) -> Any:
+        """Call a publish-only client method, directly when connected.
+
+        Methods that merely publish a message never block once the client is
+        connected, so skip the executor round trip for them. Before the first
+        connect the call goes through _call() so the client gets built off
+        the event loop. Bound methods are cached per client so repeated key
+        presses don't rebuild them.
+        """
+        client = self._client
+        if client is not None and client.is_connected:
+            methods = self._methods
+            if self._methods_client is not client:
+                methods = self._methods = {}
+                self._methods_client = client
+            method = methods.get(method_name)
+            if method is None:
+                method = methods[method_name] = getattr(client, method_name)
+            return method(*args)
+        return await self._call(method_name, *args)
+
+    async def _query(self, method_name: str, topic_template: str, timeout: float) -> Any:
+        """Request data from the TV and await the reply on the event loop.
+
+        When connected, the request is published directly and the reply is
+        delivered to a loop future by the client's response callback, so no
+        worker thread sits blocked for up to `timeout` seconds. Otherwise the
+        blocking getter `method_name` runs in the executor as before.
+        """
+        client = self._client
+        if client is None or not client.is_connected:
+            return await self._call(method_name, timeout)
+        loop = self._get_loop()
+        future = loop.create_future()
+        callback = partial(_post_result, loop, future)
+        if not client.request_nowait(topic_template, callback):
+            return None
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            client.cancel_request(callback)
 
     # Properties (sync access is safe)
     @property
     def host(self) -> str:
         """TV IP address."""
-        return self._init_kwargs["host"]
+        return self._host
 
     @property
     def port(self) -> int:
         """MQTT port."""
-        return self._init_kwargs["port"]
+        return self._port
 
+    # The client-backed properties read self._client once, as it can be
+    # swapped out from the worker thread between two reads.
     @property
     def is_connected(self) -> bool:
         """Check if connected to TV."""
-        return self._client.is_connected if self._client else False
+        client = self._client
+        return client is not None and client.is_connected
 
     @property
     def is_authenticated(self) -> bool:
         """Check if authenticated."""
-        return self._client.is_authenticated() if self._client else False
+        client = self._client
+        return client is not None and client.is_authenticated()
 
     @property
     def state(self) -> dict:
         """Get last known TV state."""
-        return self._client.state if self._client else {}
+        client = self._client
+        return client.state if client is not None else {}
 
     @property
     def is_muted(self) -> bool:
         """Get mute status from broadcasts."""
-        return self._client.is_muted if self._client else False
+        client = self._client
+        return client is not None and client.is_muted
 
     @property
     def cached_volume(self) -> Optional[int]:
         """Get last known volume from broadcasts."""
-        return self._client.cached_volume if self._client else None
+        client = self._client
+        return client.cached_volume if client is not None else None
 
     # Connection methods
     async def async_connect(
@@ -239,19 +615,37 @@ class AsyncVidaaTV:
         """
         def _connect():
             client = self._ensure_client()
-            return client.connect(
-                timeout=timeout,
-                auto_auth=auto_auth,
-                auto_refresh=auto_refresh,
-                try_fallback=try_fallback,
-            )
-
+            with self._connect_lock:
+                # Another handle already holds this session (possibly one
+                # that connected while we waited); don't tear it down
+                if client.is_connected and _is_shared(client):
+                    return True
+                return client.connect(
+                    timeout=timeout,
+                    auto_auth=auto_auth,
+                    auto_refresh=auto_refresh,
+                    try_fallback=try_fallback,
+                )
+
+        prewarm, self._prewarm = self._prewarm, None
+        if prewarm is not None:
+            try:
+                await prewarm
+            except Exception:
+                pass  # _connect builds the client again and reports the error
         return await self._run_in_executor(_connect)
 
     async def async_disconnect(self) -> None:
-        """Disconnect from the TV asynchronously."""
-        if self._client:
-            await self._run_in_executor(self._client.disconnect)
+        """Disconnect from the TV asynchronously.
+
+        A client shared with other handles stays connected until the last
+        of them disconnects.
+        """
+        client = self._client
+        if client:
+            self._client = None
+            await self._run_in_executor(self._release, client)
+        self._stop_worker()
 
     # Authentication
     async def async_start_pairing(self) -> bool:
@@ -282,14 +676,14 @@ class AsyncVidaaTV:
         Returns:
             True if authentication successful
         """
-        if not self._client:
+        client = self._client
+        if not client:
             return False
-        return await self._run_in_executor(
-            self._client.authenticate,
-            pin,
-            wait_for_response=wait_for_response,
-            timeout=timeout,
-        )
+        if not wait_for_response or not client.is_connected:
+            return await self._run_in_executor(
+                client.authenticate, pin, wait_for_response, timeout
+            )
+        return await self._await_token(client, partial(client.authenticate_nowait, pin), timeout)
 
     async def async_refresh_token(self, timeout: float = 10.0) -> bool:
         """Refresh access token.
@@ -297,27 +691,51 @@ class AsyncVidaaTV:
         Returns:
             True if token refreshed successfully
         """
-        if not self._client:
+        client = self._client
+        if not client:
             return False
-        return await self._run_in_executor(
-            self._client.refresh_token,
-            timeout=timeout,
-        )
+        if not client.is_connected:
+            return await self._run_in_executor(client.refresh_token, timeout)
+        return await self._await_token(client, client.refresh_token_nowait, timeout)
+
+    async def _await_token(
+        self, client: "VidaaTV", start: Callable[[Callable[[bool], None]], bool], timeout: float
+    ) -> bool:
+        """Start a token exchange and await its outcome on the event loop.
+
+        Like _query(), the TV's answer resolves a loop future from the MQTT
+        network thread, so no worker thread blocks on the auth events while
+        the user reads the PIN off the screen.
+        """
+        loop = self._get_loop()
+        future = loop.create_future()
+        callback = partial(_post_result, loop, future)
+        if not start(callback):
+            return False
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            client.cancel_token_wait(callback)
 
     async def async_reset(self) -> None:
         """Drop the underlying client so the next connect rebuilds it.
 
         Rebuilding re-reads saved-token status from storage, so an expired
         access token is refreshed from the still-valid refresh token instead
-        of being replayed on reconnect.
+        of being replayed on reconnect. The old client is evicted from the
+        shared pool; other handles still holding it keep it until they
+        disconnect.
         """
         def _reset():
-            if self._client is not None:
+            client = self._client
+            if client is not None:
+                self._client = None
                 try:
-                    self._client.disconnect()
+                    self._release(client, evict=True)
                 except Exception:
                     pass
-                self._client = None
 
         await self._run_in_executor(_reset)
 
@@ -331,8 +749,8 @@ class AsyncVidaaTV:
             from .config import get_storage
 
             return get_storage().get_token_status(
-                host=self._init_kwargs["host"],
-                port=self._init_kwargs["port"],
+                host=self.host,
+                port=self.port,
             )
 
         return await self._run_in_executor(_status)
@@ -361,11 +779,53 @@ class AsyncVidaaTV:
         Returns:
             True if sent successfully
         """
-        return await self._call("send_key", key, check_state=check_state)
-
-    async def async_power(self) -> bool:
-        """Toggle power."""
-        return await self._call("power")
+        if check_state:
+            return await self._queue_checked_key(key)
+        return await self._send("send_key", key)
+
+    async def _queue_checked_key(self, key: str) -> bool:
+        """Queue a state-checked key press, flushing right away if none is in flight."""
+        future = self._get_loop().create_future()
+        self._pending_keys.append((key, future))
+        if self._batch_task is None:
+            self._batch_task = asyncio.ensure_future(self._flush_key_batches())
+        return await future
+
+    async def _flush_key_batches(self) -> None:
+        """Send queued key presses, one state check and executor job per batch.
+
+        A lone press goes out on the next loop pass. Presses queued while a
+        batch is in flight (e.g. holding volume up) are sent together as the
+        next batch instead of each paying for their own state query and
+        thread-pool round trip. Every caller gets its own key's result.
+        """
+        batch: list = []
+        try:
+            while self._pending_keys:
+                batch = list(self._pending_keys)
+                self._pending_keys.clear()
+                try:
+                    results = await self._call("send_keys_each", [key for key, _ in batch], True)
+                except Exception as err:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(err)
+                else:
+                    for (_, future), sent in zip(batch, results):
+                        if not future.done():
+                            future.set_result(sent)
+                batch = []
+        except BaseException:
+            # Cancelled: every caller still gets an outcome
+            batch.extend(self._pending_keys)
+            self._pending_keys.clear()
+            for _, future in batch:
+                future.cancel()
+            raise
+        finally:
+            self._batch_task = None
+
+    async_power = _make_async_key("power", "Toggle power.")
 
     async def async_power_on(self) -> bool:
         """Turn TV on (only if off)."""
@@ -375,65 +835,21 @@ class AsyncVidaaTV:
         """Turn TV off (only if on)."""
         return await self._call("power_off")
 
-    async def async_volume_up(self) -> bool:
-        """Increase volume."""
-        return await self._call("volume_up")
-
-    async def async_volume_down(self) -> bool:
-        """Decrease volume."""
-        return await self._call("volume_down")
-
-    async def async_mute(self) -> bool:
-        """Toggle mute."""
-        return await self._call("mute")
-
-    async def async_up(self) -> bool:
-        """Navigate up."""
-        return await self._call("up")
-
-    async def async_down(self) -> bool:
-        """Navigate down."""
-        return await self._call("down")
-
-    async def async_left(self) -> bool:
-        """Navigate left."""
-        return await self._call("left")
-
-    async def async_right(self) -> bool:
-        """Navigate right."""
-        return await self._call("right")
-
-    async def async_ok(self) -> bool:
-        """Press OK/Enter."""
-        return await self._call("ok")
-
-    async def async_back(self) -> bool:
-        """Go back."""
-        return await self._call("back")
-
-    async def async_menu(self) -> bool:
-        """Open menu."""
-        return await self._call("menu")
-
-    async def async_home(self) -> bool:
-        """Go to home screen."""
-        return await self._call("home")
-
-    async def async_exit(self) -> bool:
-        """Exit current screen."""
-        return await self._call("exit")
-
-    async def async_play(self) -> bool:
-        """Play."""
-        return await self._call("play")
-
-    async def async_pause(self) -> bool:
-        """Pause."""
-        return await self._call("pause")
-
-    async def async_stop(self) -> bool:
-        """Stop."""
-        return await self._call("stop")
+    async_volume_up = _make_async_key("volume_up", "Increase volume.")
+    async_volume_down = _make_async_key("volume_down", "Decrease volume.")
+    async_mute = _make_async_key("mute", "Toggle mute.")
+    async_up = _make_async_key("up", "Navigate up.")
+    async_down = _make_async_key("down", "Navigate down.")
+    async_left = _make_async_key("left", "Navigate left.")
+    async_right = _make_async_key("right", "Navigate right.")
+    async_ok = _make_async_key("ok", "Press OK/Enter.")
+    async_back = _make_async_key("back", "Go back.")
+    async_menu = _make_async_key("menu", "Open menu.")
+    async_home = _make_async_key("home", "Go to home screen.")
+    async_exit = _make_async_key("exit", "Exit current screen.")
+    async_play = _make_async_key("play", "Play.")
+    async_pause = _make_async_key("pause", "Pause.")
+    async_stop = _make_async_key("stop", "Stop.")
 
     # Volume control
     async def async_get_volume(self, timeout: float = 5.0) -> Optional[int]:
@@ -442,7 +858,11 @@ class AsyncVidaaTV:
         Returns:
             Volume (0-100) or None if failed
         """
-        return await self._call("get_volume", timeout=timeout)
+        client = self._client
+        if client is None or not client.is_connected:
+            return await self._call("get_volume", timeout)
+        response = await self._query("get_volume", TOPIC_GET_VOLUME, timeout)
+        return client.parse_volume(response)
 
     async def async_set_volume(
         self, level: int, check_state: bool = False
@@ -456,7 +876,9 @@ class AsyncVidaaTV:
         Returns:
             True if sent successfully
         """
-        return await self._call("set_volume", level, check_state=check_state)
+        if check_state:
+            return await self._call("set_volume", level, True)
+        return await self._send("set_volume", level)
 
     # Source control
     async def async_get_sources(self, timeout: float = 5.0) -> Optional[List[dict]]:
@@ -465,7 +887,7 @@ class AsyncVidaaTV:
         Returns:
             List of source dicts or None
         """
-        return await self._call("get_sources", timeout=timeout)
+        return await self._query("get_sources", TOPIC_GET_SOURCES, timeout)
 
     async def async_set_source(
         self, source: str, check_state: bool = False
@@ -479,7 +901,9 @@ class AsyncVidaaTV:
         Returns:
             True if sent successfully
         """
-        return await self._call("set_source", source, check_state=check_state)
+        if check_state:
+            return await self._call("set_source", source, True)
+        return await self._send("set_source", source)
 
     # State
     async def async_get_state(self, timeout: float = 5.0) -> Optional[dict]:
@@ -488,7 +912,11 @@ class AsyncVidaaTV:
         Returns:
             State dict or None
         """
-        return await self._call("get_state", timeout=timeout)
+        state = await self._query("get_state", TOPIC_GET_STATE, timeout)
+        if state is None:
+            # Like the sync getter, fall back to the last known state
+            return self.state
+        return state
 
     async def async_is_on(self) -> bool:
         """Check if TV is powered on.
@@ -505,7 +933,7 @@ class AsyncVidaaTV:
         Returns:
             TV info dict or None
         """
-        return await self._call("get_tv_info", timeout=timeout)
+        return await self._query("get_tv_info", TOPIC_GET_TV_INFO, timeout)
 
     async def async_get_device_info(self, timeout: float = 5.0) -> Optional[dict]:
         """Get device info (model, name, version, etc).
@@ -513,7 +941,7 @@ class AsyncVidaaTV:
         Returns:
             Device info dict or None
         """
-        return await self._call("get_device_info", timeout=timeout)
+        return await self._query("get_device_info", TOPIC_GET_DEVICE_INFO, timeout)
 
     async def async_get_capability(self, timeout: float = 5.0) -> Optional[dict]:
         """Get TV capabilities.
@@ -521,7 +949,7 @@ class AsyncVidaaTV:
         Returns:
             Capability dict or None
         """
-        return await self._call("get_capability", timeout=timeout)
+        return await self._query("get_capability", TOPIC_GET_CAPABILITY, timeout)
 
     # Apps
     async def async_get_apps(self, timeout: float = 5.0) -> Optional[List[dict]]:
@@ -530,7 +958,8 @@ class AsyncVidaaTV:
         Returns:
             List of app dicts or None
         """
-        return await self._call("get_apps", timeout=timeout)
+        apps = await self._query("get_apps", TOPIC_GET_APPS, timeout)
+        return apps if isinstance(apps, list) else None
 
     async def async_launch_app(
         self, app_name: str, check_state: bool = False
@@ -544,7 +973,10 @@ class AsyncVidaaTV:
         Returns:
             True if sent successfully
         """
-        return await self._call("launch_app", app_name, check_state=check_state)
+        # Unknown app names need a blocking app-list lookup on the TV
+        if check_state or not (isinstance(app_name, dict) or app_name.lower() in APPS):
+            return await self._call("launch_app", app_name, check_state)
+        return await self._send("launch_app", app_name)
 
     # Async context manager
     async def __aenter__(self) -> "AsyncVidaaTV":
@@ -557,67 +989,144 @@ class AsyncVidaaTV:
         await self.async_disconnect()
 
     # Sync method aliases (for backwards compatibility or when blocking is OK)
-    def connect(self, *args, **kwargs) -> bool:
-        """Sync connect (blocking)."""
-        return self._ensure_client().connect(*args, **kwargs)
+    connect = _make_sync_alias("connect")
 
     def disconnect(self) -> None:
         """Sync disconnect (blocking)."""
-        if self._client:
-            return self._client.disconnect()
+        client = self._client
+        if client:
+            self._client = None
+            self._release(client)
+        self._stop_worker()
 
-    def send_key(self, *args, **kwargs) -> bool:
-        """Sync send_key (blocking)."""
-        return self._ensure_client().send_key(*args, **kwargs)
+    send_key = _make_sync_alias("send_key")
+    power = _make_sync_alias("power")
+    get_volume = _make_sync_alias("get_volume")
+    set_volume = _make_sync_alias("set_volume")
+    get_state = _make_sync_alias("get_state")
+    get_apps = _make_sync_alias("get_apps")
+    launch_app = _make_sync_alias("launch_app")
 
-    def power(self) -> bool:
-        """Sync power toggle (blocking)."""
-        return self._ensure_client().power()
 
-    def get_volume(self, *args, **kwargs) -> Optional[int]:
-        """Sync get_volume (blocking)."""
-        return self._ensure_client().get_volume(*args, **kwargs)
+# Async discovery functions
+def _get_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> asyncio.AbstractEventLoop:
+    """Return the given loop, or look up the running one."""
+    return loop if loop is not None else asyncio.get_running_loop()
+
 
-    def set_volume(self, *args, **kwargs) -> bool:
-        """Sync set_volume (blocking)."""
-        return self._ensure_client().set_volume(*args, **kwargs)
+def _submit_discovery(
+    loop: Optional[asyncio.AbstractEventLoop],
+    executor: Optional[ThreadPoolExecutor],
+    func: Callable,
+    *args,
+    **kwargs,
+) -> asyncio.Future:
+    """Run a blocking discovery call in the executor and wrap its future.
 
-    def get_state(self, *args, **kwargs) -> Optional[dict]:
-        """Sync get_state (blocking)."""
-        return self._ensure_client().get_state(*args, **kwargs)
+    executor.submit takes keyword arguments itself, so no partial is built.
+    """
+    job = (executor or _get_discovery_executor()).submit(func, *args, **kwargs)
+    return asyncio.wrap_future(job, loop=_get_loop(loop))
 
-    def get_apps(self, *args, **kwargs) -> Optional[List[dict]]:
-        """Sync get_apps (blocking)."""
-        return self._ensure_client().get_apps(*args, **kwargs)
 
-    def launch_app(self, *args, **kwargs) -> bool:
-        """Sync launch_app (blocking)."""
-        return self._ensure_client().launch_app(*args, **kwargs)
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Collect discovery replies into a dict keyed by sender IP."""
+
+    def __init__(self, parse: Callable[[bytes, str], Any], source: str):
+        self.parse = parse
+        self.source = source
+        self.found: dict = {}
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        ip = addr[0]
+        if ip in self.found:
+            return
+        try:
+            device = self.parse(data, ip)
+        except Exception as e:
+            _LOGGER.debug("Error parsing %s response from %s: %s", self.source, ip, e)
+            return
+        if device is not None:
+            self.found[ip] = device
+            _LOGGER.info("Found device via %s: %s", self.source, ip)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.debug("%s discovery socket error: %s", self.source, exc)
+
+
+async def _listen_for_replies(
+    sock: Any,
+    parse: Callable[[bytes, str], Any],
+    source: str,
+    packets: List[bytes],
+    dest: tuple,
+    timeout: float,
+    retries: int,
+    executor: Optional[ThreadPoolExecutor],
+    loop: Optional[asyncio.AbstractEventLoop],
+) -> dict:
+    """Send discovery packets on sock and collect replies on the event loop.
+
+    The socket is driven by the loop's selector, so no thread waits on
+    recvfrom. Only the local-address lookup (which shells out to
+    `hostname -I`) runs in the executor, overlapped with the listen.
+    """
+    from .discovery import get_local_ips
+
+    loop = _get_loop(loop)
+    local_ips = _submit_discovery(loop, executor, get_local_ips)
+    try:
+        transport, protocol = await loop.create_datagram_endpoint(
+            partial(_DiscoveryProtocol, parse, source), sock=sock
+        )
+    except BaseException:
+        sock.close()
+        local_ips.cancel()
+        raise
+    try:
+        for _ in range(retries):
+            for packet in packets:
+                transport.sendto(packet, dest)
+            await asyncio.sleep(timeout / retries)
+    finally:
+        transport.close()
+    exclude = await local_ips
+    return {ip: device for ip, device in protocol.found.items() if ip not in exclude}
 
 
-# Async discovery functions
 async def async_discover_ssdp(
     timeout: float = 5.0,
     interface: Optional[str] = None,
     executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> dict:
     """Discover devices via SSDP M-SEARCH (async).
 
     Args:
         timeout: Discovery timeout in seconds
         interface: Interface IP to bind to
-        executor: Custom executor (uses default if None)
+        executor: Custom executor for the local-address lookup (uses the
+            shared discovery executor if None)
+        loop: Event loop (the running loop if None)
 
     Returns:
         Dict mapping IP addresses to DiscoveredTV objects
     """
-    from .discovery import discover_ssdp
+    from .config import SSDP_ADDR, SSDP_PORT
+    from .discovery import (
+        SSDP_MSEARCH,
+        SSDP_SEARCH_TARGETS,
+        _open_msearch_socket,
+        _parse_msearch_response,
+    )
 
-    loop = asyncio.get_running_loop()
-    exec = executor or _get_executor()
-    return await loop.run_in_executor(
-        exec,
-        partial(discover_ssdp, timeout=timeout, interface=interface),
+    sock = _open_msearch_socket(interface)
+    if sock is None:
+        return {}
+    packets = [SSDP_MSEARCH.format(st=st).encode() for st in SSDP_SEARCH_TARGETS]
+    return await _listen_for_replies(
+        sock, _parse_msearch_response, "SSDP M-SEARCH", packets,
+        (SSDP_ADDR, SSDP_PORT), timeout, 1, executor, loop,
     )
 
 
@@ -626,6 +1135,7 @@ async def async_discover_udp(
     retries: int = 3,
     interface: Optional[str] = None,
     executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> dict:
     """Discover devices via UDP broadcast (async).
 
@@ -633,18 +1143,22 @@ async def async_discover_udp(
         timeout: Discovery timeout in seconds
         retries: Number of discovery attempts
         interface: Interface IP to bind to
-        executor: Custom executor (uses default if None)
+        executor: Custom executor for the local-address lookup (uses the
+            shared discovery executor if None)
+        loop: Event loop (the running loop if None)
 
     Returns:
         Dict mapping IP addresses to DiscoveredTV objects
     """
-    from .discovery import discover_udp
-
-    loop = asyncio.get_running_loop()
-    exec = executor or _get_executor()
-    return await loop.run_in_executor(
-        exec,
-        partial(discover_udp, timeout=timeout, retries=retries, interface=interface),
+    from .config import BROADCAST_ADDR, DISCOVERY_PORT
+    from .discovery import DISCOVERY_MESSAGES, _open_udp_socket, _parse_udp_response
+
+    sock = _open_udp_socket(interface)
+    if sock is None:
+        return {}
+    return await _listen_for_replies(
+        sock, _parse_udp_response, "UDP broadcast", DISCOVERY_MESSAGES,
+        (BROADCAST_ADDR, DISCOVERY_PORT), timeout, max(retries, 1), executor, loop,
     )
 
 
@@ -653,6 +1167,7 @@ async def async_probe_ip(
     port: Optional[int] = None,
     timeout: float = 3.0,
     executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Optional[Any]:
     """Probe a specific IP for a TV (async).
 
@@ -661,19 +1176,46 @@ async def async_probe_ip(
         port: UPnP port. If None (default), each candidate in UPNP_PORTS is
             tried in order (some VIDAA OS versions use 18400 instead of 38400).
         timeout: Probe timeout
-        executor: Custom executor
+        executor: Custom executor (uses the shared discovery executor if None)
+        loop: Event loop (the running loop if None)
 
     Returns:
         DiscoveredTV if found, None otherwise
     """
     from .discovery import probe_ip
 
-    loop = asyncio.get_running_loop()
-    exec = executor or _get_executor()
-    return await loop.run_in_executor(
-        exec,
-        partial(probe_ip, ip, port=port, timeout=timeout),
+    return await _submit_discovery(loop, executor, probe_ip, ip, port=port, timeout=timeout)
+
+
+async def async_probe_subnet(
+    ips: List[str],
+    port: Optional[int] = None,
+    timeout: float = 3.0,
+    executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> dict:
+    """Probe many IPs for TVs concurrently (async).
+
+    All probes are submitted at once, so a /24 sweep takes roughly one probe
+    timeout per batch of discovery workers rather than one per address.
+
+    Args:
+        ips: Target IP addresses
+        port: UPnP port (see async_probe_ip)
+        timeout: Probe timeout per address
+        executor: Custom executor (uses the shared discovery executor if None)
+        loop: Event loop (the running loop if None)
+
+    Returns:
+        Dict mapping IP addresses to DiscoveredTV objects for those that answered
+    """
+    # Resolve the loop and executor once instead of in every probe
+    loop = _get_loop(loop)
+    executor = executor or _get_discovery_executor()
+    results = await asyncio.gather(
+        *(async_probe_ip(ip, port, timeout, executor, loop) for ip in ips)
     )
+    return {ip: device for ip, device in zip(ips, results) if device is not None}
 
 
 async def async_discover_all(
@@ -681,6 +1223,7 @@ async def async_discover_all(
     interface: Optional[str] = None,
     methods: Optional[list] = None,
     executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> dict:
     """Run multiple discovery methods (async).
 
@@ -688,18 +1231,16 @@ async def async_discover_all(
         timeout: Timeout per method in seconds
         interface: Interface IP to bind to
         methods: List of methods ["ssdp", "ssdp_listen", "udp"]
-        executor: Custom executor
+        executor: Custom executor (uses the shared discovery executor if None)
+        loop: Event loop (the running loop if None)
 
     Returns:
         Dict mapping IP addresses to DiscoveredTV objects
     """
     from .discovery import discover_all
 
-    loop = asyncio.get_running_loop()
-    exec = executor or _get_executor()
-    return await loop.run_in_executor(
-        exec,
-        partial(discover_all, timeout=timeout, interface=interface, methods=methods),
+    return await _submit_discovery(
+        loop, executor, discover_all, timeout=timeout, interface=interface, methods=methods
     )
 
 
@@ -708,6 +1249,7 @@ async def async_detect_protocol(
     port: Optional[int] = None,
     timeout: float = 5.0,
     executor: Optional[ThreadPoolExecutor] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
 ) -> Optional[int]:
     """Detect TV protocol version (async).
 
@@ -716,17 +1258,16 @@ async def async_detect_protocol(
         port: HTTP port. If None (default), each candidate in UPNP_PORTS is
             tried in order (some VIDAA OS versions use 18400 instead of 38400).
         timeout: Request timeout
+        executor: Custom executor (uses the shared discovery executor if None)
+        loop: Event loop (the running loop if None)
 
     Returns:
         Protocol version integer or None
     """
     from .protocol import detect_protocol
 
-    loop = asyncio.get_running_loop()
-    exec = executor or _get_executor()
-    return await loop.run_in_executor(
-        exec,
-        partial(detect_protocol, host, port=port, timeout=timeout),
+    return await _submit_discovery(
+        loop, executor, detect_protocol, host, port=port, timeout=timeout
     )
 
 
@@ -15,8 +15,12 @@ Resolution precedence (first existing pair wins):
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import ssl
 
 from .config.constants import DEFAULT_CERT_FILENAME, DEFAULT_KEY_FILENAME
 
@@ -46,6 +50,12 @@ MISSING_CERT_HELP = (
 )
 
 
+# Pairs found by the directory search, keyed by the directories searched, so
+# every client (and reconnect) in the process doesn't stat them again. Misses
+# aren't cached: certs installed while a long-running process waits are found.
+_SEARCH_HITS: Dict[Tuple[Path, ...], Tuple[str, str]] = {}
+
+
 def cert_search_dirs() -> List[Path]:
     """Return the directories searched for the client cert, in priority order."""
     dirs: List[Path] = []
@@ -72,9 +82,102 @@ def resolve_client_certs(
             return str(certfile), str(keyfile)
         return None
 
-    for directory in cert_search_dirs():
+    dirs = tuple(cert_search_dirs())
+    found = _SEARCH_HITS.get(dirs)
+    if found is not None:
+        return found
+
+    for directory in dirs:
         cert = directory / DEFAULT_CERT_FILENAME
         key = directory / DEFAULT_KEY_FILENAME
         if cert.is_file() and key.is_file():
-            return str(cert), str(key)
+            found = _SEARCH_HITS[dirs] = (str(cert), str(key))
+            return found
     return None
+
+
+@lru_cache(maxsize=1)
+def _resuming_context_class() -> type:
+    """Return the SSLContext subclass used for TV connections.
+
+    Built on first use so importing this module doesn't import ssl.
+    """
+    import ssl
+
+    class ResumingSSLContext(ssl.SSLContext):
+        """SSLContext that offers the last TLS session seen for each server.
+
+        paho wraps its socket itself, so the session is injected here rather
+        than passed to wrap_socket by the caller. Sessions live only as long
+        as the context (i.e. the process); ssl.SSLSession can't be persisted.
+        """
+
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+            self.sessions = {}
+
+        def wrap_socket(self, sock, *args, server_hostname=None, session=None, **kwargs):
+            if session is None and server_hostname is not None:
+                session = self.sessions.get(server_hostname)
+            return super().wrap_socket(
+                sock, *args, server_hostname=server_hostname, session=session, **kwargs
+            )
+
+        def remember_session(self, server_hostname: str, sock) -> None:
+            """Keep sock's session so the next handshake with the server can resume it."""
+            session = getattr(sock, "session", None)
+            if session is not None:
+                self.sessions[server_hostname] = session
+
+    return ResumingSSLContext
+
+
+def remember_tls_session(context, server_hostname: str, sock) -> None:
+    """Record sock's TLS session on a context from this module, if it is one."""
+    remember = getattr(context, "remember_session", None)
+    if remember is not None:
+        remember(server_hostname, sock)
+
+
+@lru_cache(maxsize=8)
+def client_tls_context(
+    certfile: str,
+    keyfile: str,
+    ca_certs: Optional[str] = None,
+) -> "ssl.SSLContext":
+    """Return a mutual-TLS context for the given client cert/key pair.
+
+    Contexts are cached per (certfile, keyfile, ca_certs), so the PEM files are
+    parsed once per process and shared by every client. Hostname checking is
+    always off (the TV's cert CN is "RemoteCA", not its IP); the server chain
+    is verified only when ``ca_certs`` is given. Reconnects resume the previous
+    TLS session when the TV allows it.
+    """
+    import ssl
+
+    context = _resuming_context_class()(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    if ca_certs:
+        context.load_verify_locations(ca_certs)
+    else:
+        context.verify_mode = ssl.CERT_NONE
+    context.load_cert_chain(certfile, keyfile)
+    return context
+
+
+@lru_cache(maxsize=2)
+def server_tls_context(verify: bool = False) -> "ssl.SSLContext":
+    """Return a plain (no client cert) TLS context, cached per ``verify``.
+
+    Used when no client certificate is available. Without ``verify`` the
+    server certificate and hostname are not checked.
+    """
+    import ssl
+
+    context = _resuming_context_class()(ssl.PROTOCOL_TLS_CLIENT)
+    if verify:
+        context.load_default_certs()
+    else:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
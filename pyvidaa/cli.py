@@ -2,16 +2,12 @@
 """Command-line interface for Hisense TV control."""
 
 import argparse
-import json
-import ssl
 import sys
 import threading
 import time
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
-from .certs import MISSING_CERT_HELP, resolve_client_certs
-from .client import VidaaTV
-from .discovery import discover_all, discover_ssdp, discover_udp, probe_ip
+from .certs import MISSING_CERT_HELP, client_tls_context, resolve_client_certs
 from .config import (
     load_config,
     get_tv_config,
@@ -24,8 +20,11 @@ from .config import (
     get_storage,
     DEFAULT_PORT,
 )
-from .keys import KEY_NAME_MAP, ALL_KEYS
-from .wol import wake_tv, get_mac_from_ip
+
+# The client (paho, ssl), discovery and Wake-on-LAN modules are imported by
+# the commands that use them, so `tv --help` or `tv keys` doesn't load them.
+if TYPE_CHECKING:
+    from .client import VidaaTV
 
 
 def _looks_like_mac(value: Optional[str]) -> bool:
@@ -55,6 +54,8 @@ def _resolve_mac_for_ip(ip: str) -> Optional[str]:
                 return mac
 
     # Fall back to a live probe of the UPnP descriptor
+    from .discovery import probe_ip
+
     try:
         device = probe_ip(ip, timeout=3.0)
         if device and device.mac:
@@ -75,6 +76,8 @@ def _resolve_brand_for_ip(ip: str) -> str:
         if cfg.get("host") == ip and cfg.get("brand"):
             return cfg["brand"]
 
+    from .discovery import probe_ip
+
     try:
         device = probe_ip(ip, timeout=3.0)
         if device and device.brand:
@@ -84,16 +87,45 @@ def _resolve_brand_for_ip(ip: str) -> str:
     return "his"
 
 
-def create_tv_client(tv_id: Optional[str] = None, ip: Optional[str] = None) -> VidaaTV:
+def _lookup_tv_config(tv_id: Optional[str]) -> Optional[Dict]:
+    """Return the config for tv_id, or the default TV when tv_id is None."""
+    return get_tv_config(tv_id) if tv_id else get_default_tv()
+
+
+def _resolve_tv(args) -> Tuple[Optional[str], Optional[Dict], Optional[str], int]:
+    """Resolve the target TV from --tv/--ip and the config.
+
+    Returns:
+        (tv_id, tv_config, host, port). --ip wins over the configured host;
+        host is None when neither gives one.
+    """
+    tv_id = getattr(args, 'tv', None)
+    tv_config = _lookup_tv_config(tv_id)
+    if args.ip:
+        return tv_id, tv_config, args.ip, DEFAULT_PORT
+    if tv_config:
+        return tv_id, tv_config, tv_config.get("host"), tv_config.get("port", DEFAULT_PORT)
+    return tv_id, None, None, DEFAULT_PORT
+
+
+def create_tv_client(
+    tv_id: Optional[str] = None,
+    ip: Optional[str] = None,
+    tv_config: Optional[Dict] = None,
+) -> "VidaaTV":
     """Create TV client with config settings.
 
     Args:
         tv_id: TV identifier (device_id or alias). Uses default TV if not provided.
         ip: Override IP address (takes precedence over tv_id)
+        tv_config: Config already looked up for tv_id by the caller, to skip a
+            second lookup
 
     Returns:
         Configured VidaaTV client
     """
+    from .client import VidaaTV
+
     if ip:
         # Direct IP override - still resolve the MAC so dynamic auth can build a
         # valid client_id (otherwise we silently fall back to static creds -> rc=5).
@@ -107,7 +139,8 @@ def create_tv_client(tv_id: Optional[str] = None, ip: Optional[str] = None) -> V
         )
 
     # Get TV config by ID or use default
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
+    if tv_config is None:
+        tv_config = _lookup_tv_config(tv_id)
 
     if not tv_config:
         if tv_id:
@@ -143,7 +176,7 @@ def cmd_power(args):
     tv = create_tv_client(getattr(args, 'tv', None), args.ip)
     if tv.connect(timeout=5):
         tv.power()
-        time.sleep(0.5)
+        tv.flush_publishes()
         tv.disconnect()
         print("Power command sent")
     else:
@@ -152,33 +185,34 @@ def cmd_power(args):
     return 0
 
 
+# Volume action -> (VidaaTV method, passes the amount, message); "get" prints
+# the reading instead and is handled separately
+_VOLUME_ACTIONS = {
+    "up": ("volume_up", True, "Volume up x{amount}"),
+    "down": ("volume_down", True, "Volume down x{amount}"),
+    "mute": ("mute", False, "Mute toggled"),
+    "set": ("set_volume", True, "Volume set to {amount}"),
+}
+
+
 def cmd_volume(args):
     """Control volume."""
     tv = create_tv_client(getattr(args, 'tv', None), args.ip)
     if tv.connect(timeout=5):
-        if args.action == "up":
-            for _ in range(args.amount):
-                tv.volume_up()
-                time.sleep(0.1)
-            print(f"Volume up x{args.amount}")
-        elif args.action == "down":
-            for _ in range(args.amount):
-                tv.volume_down()
-                time.sleep(0.1)
-            print(f"Volume down x{args.amount}")
-        elif args.action == "mute":
-            tv.mute()
-            print("Mute toggled")
-        elif args.action == "set":
-            tv.set_volume(args.amount)
-            print(f"Volume set to {args.amount}")
-        elif args.action == "get":
+        if args.action == "get":
             vol = tv.get_volume()
             if vol is not None:
                 print(f"Volume: {vol}")
             else:
                 print("Could not get volume")
-        time.sleep(0.3)
+        else:
+            method, takes_amount, message = _VOLUME_ACTIONS[args.action]
+            if takes_amount:
+                getattr(tv, method)(args.amount)
+            else:
+                getattr(tv, method)()
+            print(message.format(amount=args.amount))
+        tv.flush_publishes()
         tv.disconnect()
     else:
         print("Failed to connect to TV", file=sys.stderr)
@@ -188,13 +222,14 @@ def cmd_volume(args):
 
 def cmd_key(args):
     """Send a key press."""
-    key = args.key.upper()
-    if not key.startswith("KEY_"):
-        key = f"KEY_{key}"
+    from .keys import ALL_KEYS, ALL_KEYS_SET
+
+    wanted = args.key.upper()
+    key = wanted if wanted.startswith("KEY_") else f"KEY_{wanted}"
 
-    if key not in ALL_KEYS:
-        # Try to find closest match
-        matches = [k for k in ALL_KEYS if args.key.upper() in k]
+    if key not in ALL_KEYS_SET:
+        # Try to find closest match (ALL_KEYS keeps the suggestions ordered)
+        matches = [k for k in ALL_KEYS if wanted in k]
         if matches:
             print(f"Unknown key '{args.key}'. Did you mean: {', '.join(matches)}", file=sys.stderr)
         else:
@@ -204,7 +239,7 @@ def cmd_key(args):
     tv = create_tv_client(getattr(args, 'tv', None), args.ip)
     if tv.connect(timeout=5):
         tv.send_key(key)
-        time.sleep(0.3)
+        tv.flush_publishes()
         tv.disconnect()
         print(f"Sent: {key}")
     else:
@@ -213,38 +248,41 @@ def cmd_key(args):
     return 0
 
 
+# Key groups shown first by 'tv keys'; everything else is listed under Other
+_KEY_CATEGORIES = (
+    ("Power", ("KEY_POWER",)),
+    ("Navigation", ("KEY_UP", "KEY_DOWN", "KEY_LEFT", "KEY_RIGHT", "KEY_OK", "KEY_ENTER")),
+    ("Menu", ("KEY_MENU", "KEY_HOME", "KEY_BACK", "KEY_RETURNS", "KEY_EXIT")),
+    ("Volume", ("KEY_VOLUMEUP", "KEY_VOLUMEDOWN", "KEY_MUTE")),
+    ("Playback", ("KEY_PLAY", "KEY_PAUSE", "KEY_STOP", "KEY_FAST_FORWARD", "KEY_REWIND")),
+    ("Numbers", ("KEY_0", "KEY_1", "KEY_2", "KEY_3", "KEY_4", "KEY_5", "KEY_6", "KEY_7", "KEY_8", "KEY_9")),
+    ("Channels", ("KEY_CHANNELUP", "KEY_CHANNELDOWN")),
+    ("Colors", ("KEY_RED", "KEY_GREEN", "KEY_YELLOW", "KEY_BLUE")),
+)
+_CATEGORIZED_KEYS = frozenset(k for _, keys in _KEY_CATEGORIES for k in keys)
+
+
 def cmd_keys(args):
     """List available keys."""
-    print("Available keys:")
-    print()
-
-    categories = {
-        "Power": ["KEY_POWER"],
-        "Navigation": ["KEY_UP", "KEY_DOWN", "KEY_LEFT", "KEY_RIGHT", "KEY_OK", "KEY_ENTER"],
-        "Menu": ["KEY_MENU", "KEY_HOME", "KEY_BACK", "KEY_RETURNS", "KEY_EXIT"],
-        "Volume": ["KEY_VOLUMEUP", "KEY_VOLUMEDOWN", "KEY_MUTE"],
-        "Playback": ["KEY_PLAY", "KEY_PAUSE", "KEY_STOP", "KEY_FAST_FORWARD", "KEY_REWIND"],
-        "Numbers": ["KEY_0", "KEY_1", "KEY_2", "KEY_3", "KEY_4", "KEY_5", "KEY_6", "KEY_7", "KEY_8", "KEY_9"],
-        "Channels": ["KEY_CHANNELUP", "KEY_CHANNELDOWN"],
-        "Colors": ["KEY_RED", "KEY_GREEN", "KEY_YELLOW", "KEY_BLUE"],
-    }
-
-    for cat, keys in categories.items():
-        available = [k for k in keys if k in ALL_KEYS]
+    from .keys import ALL_KEYS_SET
+
+    lines = ["Available keys:", ""]
+
+    def add_group(title, keys):
+        lines.append(f"  {title}:")
+        lines.extend(f"    {k[4:].lower():20} ({k})" for k in keys)
+
+    for cat, keys in _KEY_CATEGORIES:
+        available = [k for k in keys if k in ALL_KEYS_SET]
         if available:
-            print(f"  {cat}:")
-            for k in available:
-                short = k.replace("KEY_", "").lower()
-                print(f"    {short:20} ({k})")
+            add_group(cat, available)
 
     # Show other keys
-    shown = set(k for keys in categories.values() for k in keys)
-    others = sorted([k for k in ALL_KEYS if k not in shown])
+    others = sorted(ALL_KEYS_SET - _CATEGORIZED_KEYS)
     if others:
-        print(f"  Other:")
-        for k in others:
-            short = k.replace("KEY_", "").lower()
-            print(f"    {short:20} ({k})")
+        add_group("Other", others)
+
+    print("\n".join(lines))
     return 0
 
 
@@ -253,23 +291,9 @@ def cmd_nav(args):
     tv = create_tv_client(getattr(args, 'tv', None), args.ip)
     if tv.connect(timeout=5):
         action = args.action
-        if action == "up":
-            tv.up()
-        elif action == "down":
-            tv.down()
-        elif action == "left":
-            tv.left()
-        elif action == "right":
-            tv.right()
-        elif action == "ok":
-            tv.ok()
-        elif action == "back":
-            tv.back()
-        elif action == "home":
-            tv.home()
-        elif action == "menu":
-            tv.menu()
-        time.sleep(0.3)
+        # argparse limits action to _NAV_ACTIONS, each named after its VidaaTV method
+        getattr(tv, action)()
+        tv.flush_publishes()
         tv.disconnect()
         print(f"Navigation: {action}")
     else:
@@ -296,7 +320,7 @@ def cmd_app(args):
                 print(f"Launching: {args.name}")
             else:
                 print(f"Failed to launch: {args.name}", file=sys.stderr)
-        time.sleep(0.5)
+        tv.flush_publishes()
         tv.disconnect()
     else:
         print("Failed to connect to TV", file=sys.stderr)
@@ -321,7 +345,7 @@ def cmd_source(args):
         else:
             tv.set_source(args.source)
             print(f"Switching to: {args.source}")
-        time.sleep(0.5)
+        tv.flush_publishes()
         tv.disconnect()
     else:
         print("Failed to connect to TV", file=sys.stderr)
@@ -333,7 +357,7 @@ def cmd_config(args):
     """View or set configuration."""
     if args.action == "show":
         config = load_config()
-        tvs = list_tvs()
+        tvs = config.get("tvs", {})
         default_tv_id = config.get("default_tv")
 
         if not tvs:
@@ -341,13 +365,12 @@ def cmd_config(args):
             return 0
 
         print("Configured TVs:")
-        for tv_id in tvs:
-            tv_config = get_tv_config(tv_id)
+        for tv_id, tv_config in tvs.items():
             if not tv_config:
                 continue
 
-            is_default = " (default)" if tv_id == default_tv_id else ""
             alias = tv_config.get("alias", "")
+            is_default = " (default)" if default_tv_id in (tv_id, alias) else ""
             alias_str = f" [{alias}]" if alias else ""
             name = tv_config.get("name", "")
             name_str = f" - {name}" if name else ""
@@ -361,13 +384,12 @@ def cmd_config(args):
                 print(f"    Device ID: {device_id}")
 
     elif args.action == "list":
-        tvs = list_tvs()
+        tvs = load_config().get("tvs", {})
         if not tvs:
             print("No TVs configured.")
             return 0
         print("Configured TVs:")
-        for tv_id in tvs:
-            tv_config = get_tv_config(tv_id)
+        for tv_id, tv_config in tvs.items():
             alias = tv_config.get("alias", "") if tv_config else ""
             alias_str = f" ({alias})" if alias else ""
             print(f"  {tv_id}{alias_str}")
@@ -381,6 +403,8 @@ def cmd_config(args):
 
         # Probe the TV so we can persist its MAC (needed for dynamic-auth
         # credentials), name and protocol version instead of just the IP.
+        from .discovery import probe_ip
+
         extra = {}
         try:
             device = probe_ip(ip, timeout=3.0)
@@ -439,11 +463,9 @@ def cmd_config(args):
 
 def cmd_status(args):
     """Get TV status."""
-    tv_id = getattr(args, 'tv', None)
-    tv = create_tv_client(tv_id, args.ip)
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
-    host = args.ip or (tv_config.get("host") if tv_config else "unknown")
-    print(f"Connecting to {host}...")
+    tv_id, tv_config, host, _ = _resolve_tv(args)
+    tv = create_tv_client(tv_id, args.ip, tv_config)
+    print(f"Connecting to {host or 'unknown'}...")
     if tv.connect(timeout=5):
         print("Connected!")
         state = tv.get_state()
@@ -462,66 +484,95 @@ def cmd_status(args):
 
 def cmd_discover(args):
     """Discover Hisense TVs on the network."""
+    from .discovery import discover_all, discover_ssdp, discover_udp, probe_ip
+
     timeout = getattr(args, 'timeout', 5.0)
     method = getattr(args, 'method', 'all')
     verbose = getattr(args, 'verbose', False)
 
+    if method == 'probe' and not args.ip:
+        print("The probe method needs an address: tv --ip 192.168.1.50 discover -m probe",
+              file=sys.stderr)
+        return 1
+
     print(f"Scanning for Hisense TVs (timeout: {timeout}s)...")
 
     if method == 'ssdp':
         devices = discover_ssdp(timeout=timeout)
     elif method == 'udp':
         devices = discover_udp(timeout=timeout)
-    elif method == 'probe' and args.ip:
+    elif method == 'probe':
         device = probe_ip(args.ip, timeout=timeout)
         devices = {args.ip: device} if device else {}
     else:
         devices = discover_all(timeout=timeout)
 
     if not devices:
-        print("No TVs found.")
-        print("\nTips:")
-        print("  - Make sure the TV is powered on")
-        print("  - Ensure TV and computer are on the same network")
-        print("  - Try: tv discover --method ssdp")
-        print("  - Try probing a specific IP: tv discover --ip 192.168.1.50")
+        print(
+            "No TVs found.\n"
+            "\nTips:\n"
+            "  - Make sure the TV is powered on\n"
+            "  - Ensure TV and computer are on the same network\n"
+            "  - Try: tv discover --method ssdp\n"
+            "  - Try probing a specific IP: tv --ip 192.168.1.50 discover -m probe"
+        )
         return 1
 
-    print(f"\nFound {len(devices)} TV(s):\n")
+    lines = [f"\nFound {len(devices)} TV(s):\n"]
 
     for ip, device in devices.items():
-        print(f"  {ip}")
+        lines.append(f"  {ip}")
         if device.name:
-            print(f"    Name:  {device.name}")
+            lines.append(f"    Name:  {device.name}")
         if device.model:
-            print(f"    Model: {device.model}")
+            lines.append(f"    Model: {device.model}")
         if device.brand:
-            print(f"    Brand: {device.brand}")
+            lines.append(f"    Brand: {device.brand}")
         if device.mac:
-            print(f"    MAC:   {device.mac}")
+            lines.append(f"    MAC:   {device.mac}")
         if verbose:
             if device.protocol_version:
-                print(f"    Protocol: {device.protocol_version}")
+                lines.append(f"    Protocol: {device.protocol_version}")
             if device.discovery_method:
-                print(f"    Via:      {device.discovery_method}")
-        print()
+                lines.append(f"    Via:      {device.discovery_method}")
+        lines.append("")
 
-    print("To add a TV: tv config add <IP>")
+    lines.append("To add a TV: tv config add <IP>")
+    print("\n".join(lines))
     return 0
 
 
+def _format_mac(mac: str) -> str:
+    """Colon-separate a MAC given as a bare device_id (12 hex digits)."""
+    if ":" not in mac and len(mac) == 12:
+        try:
+            return bytes.fromhex(mac).hex(":")
+        except ValueError:
+            pass
+    return mac
+
+
+def _subnet_of(host: Optional[str]) -> Optional[str]:
+    """Return the /24 prefix of an IPv4 host, for a directed broadcast."""
+    if not host:
+        return None
+    prefix, sep, _ = host.rpartition(".")
+    return prefix if sep else None
+
+
 def cmd_wake(args):
     """Wake TV using Wake-on-LAN."""
-    tv_id = getattr(args, 'tv', None)
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
+    from .wol import wake_tv
+
+    _, tv_config, host, _ = _resolve_tv(args)
 
     # Get MAC from command line or config
     mac = getattr(args, 'mac', None)
-    host = getattr(args, 'ip', None)
-
     if not mac and tv_config:
         mac = tv_config.get("device_id") or tv_config.get("mac")
-        host = host or tv_config.get("host")
+    elif not args.ip:
+        # An explicit --mac only gets a directed broadcast if --ip is given too
+        host = None
 
     if not mac:
         print("No MAC address specified.", file=sys.stderr)
@@ -529,15 +580,8 @@ def cmd_wake(args):
         print("Or configure a TV first: tv config add <ip>", file=sys.stderr)
         return 1
 
-    # Format MAC if it's a device_id (no colons)
-    if ":" not in mac and len(mac) == 12:
-        mac = ":".join(mac[i:i+2] for i in range(0, 12, 2))
-
-    # Get subnet from IP for directed broadcast
-    subnet = None
-    if host:
-        ip_parts = host.rsplit(".", 1)
-        subnet = ip_parts[0] if len(ip_parts) == 2 else None
+    mac = _format_mac(mac)
+    subnet = _subnet_of(host)
 
     print(f"Sending Wake-on-LAN to {mac}...")
     if wake_tv(mac, subnet):
@@ -551,22 +595,17 @@ def cmd_wake(args):
 
 def cmd_on(args):
     """Turn TV on (wake + smart power on)."""
-    tv_id = getattr(args, 'tv', None)
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
+    from .wol import wake_tv
+
+    tv_id, tv_config, _, _ = _resolve_tv(args)
 
     # First try to wake via WoL
     if tv_config:
         mac = tv_config.get("device_id") or tv_config.get("mac")
         host = tv_config.get("host")
         if mac:
-            # Format MAC if it's a device_id
-            if ":" not in mac and len(mac) == 12:
-                mac = ":".join(mac[i:i+2] for i in range(0, 12, 2))
-
-            subnet = None
-            if host:
-                ip_parts = host.rsplit(".", 1)
-                subnet = ip_parts[0] if len(ip_parts) == 2 else None
+            mac = _format_mac(mac)
+            subnet = _subnet_of(host)
 
             print(f"Sending Wake-on-LAN to {mac}...")
             wake_tv(mac, subnet)
@@ -574,12 +613,13 @@ def cmd_on(args):
             time.sleep(5)
 
     # Try to connect and use smart power on
-    tv = create_tv_client(tv_id, args.ip)
+    tv = create_tv_client(tv_id, args.ip, tv_config)
     for attempt in range(6):
         if tv.connect(timeout=3):
             # Use smart power_on which checks state first
             if tv.power_on():
                 print("TV is on!")
+            tv.flush_publishes()
             tv.disconnect()
             return 0
         if attempt < 5:
@@ -596,6 +636,7 @@ def cmd_off(args):
     if tv.connect(timeout=5):
         if tv.power_off():
             print("Power off command sent.")
+        tv.flush_publishes()
         tv.disconnect()
         return 0
     else:
@@ -606,23 +647,21 @@ def cmd_off(args):
 def cmd_monitor(args):
     """Monitor MQTT messages from TV."""
     import signal
-    import ssl
     from datetime import datetime
     import paho.mqtt.client as mqtt
 
-    tv_id = getattr(args, 'tv', None)
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
-    storage = get_storage()
+    # Same encoder as the client (orjson when installed), so the output
+    # format doesn't depend on which one is available
+    from .client import _json_dumps, _json_loads
 
-    if args.ip:
-        host = args.ip
-        port = DEFAULT_PORT
-    elif tv_config:
-        host = tv_config.get("host")
-        port = tv_config.get("port", DEFAULT_PORT)
-    else:
+    def compact_json(raw: bytes) -> str:
+        return _json_dumps(_json_loads(raw)).decode()
+
+    tv_id, tv_config, host, port = _resolve_tv(args)
+    if not (args.ip or tv_config):
         print("No TV configured. Use 'tv config add <ip>' first.", file=sys.stderr)
         return 1
+    storage = get_storage()
 
     # Try to get token by device_id first, then by host:port
     device_id = tv_config.get("device_id") if tv_config else None
@@ -669,15 +708,17 @@ def cmd_monitor(args):
             timestamp = datetime.now().strftime("%H:%M:%S")
             topic_short = msg.topic.split("/")[-1]
 
-            try:
-                payload = json.loads(msg.payload.decode())
-                payload_str = json.dumps(payload)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                payload_str = msg.payload.decode()[:200]
+            payload_str = msg.payload.decode("utf-8", errors="replace")
 
-            # Truncate long payloads
+            # Short payloads print as sent; long JSON is re-serialised first so
+            # the TV's whitespace doesn't eat into the truncated preview.
             if len(payload_str) > 100:
-                payload_str = payload_str[:100] + "..."
+                try:
+                    payload_str = compact_json(msg.payload)
+                except ValueError:
+                    pass
+                if len(payload_str) > 100:
+                    payload_str = payload_str[:100] + "..."
 
             print(f"{timestamp} [{topic_short}] {payload_str}")
         except Exception as e:
@@ -689,15 +730,11 @@ def cmd_monitor(args):
     client.on_subscribe = on_subscribe
     client.on_message = on_message
 
-    ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-    ssl_ctx.check_hostname = False
-    ssl_ctx.verify_mode = ssl.CERT_NONE
     certs = resolve_client_certs()
     if not certs:
         print(f"Error: {MISSING_CERT_HELP}")
         return
-    ssl_ctx.load_cert_chain(certs[0], certs[1])
-    client.tls_set_context(ssl_ctx)
+    client.tls_set_context(client_tls_context(*certs))
 
     print(f"Connecting to TV at {host}...")
     try:
@@ -713,19 +750,11 @@ def cmd_monitor(args):
 
 def cmd_auth(args):
     """View or manage authentication."""
-    tv_id = getattr(args, 'tv', None)
-    tv_config = get_tv_config(tv_id) if tv_id else get_default_tv()
-    storage = get_storage()
-
-    if args.ip:
-        host = args.ip
-        port = DEFAULT_PORT
-    elif tv_config:
-        host = tv_config.get("host")
-        port = tv_config.get("port", DEFAULT_PORT)
-    else:
+    tv_id, tv_config, host, port = _resolve_tv(args)
+    if not (args.ip or tv_config):
         print("No TV configured. Use 'tv config add <ip>' first.", file=sys.stderr)
         return 1
+    storage = get_storage()
 
     # Try to get token by device_id first, then by host:port
     device_id = tv_config.get("device_id") if tv_config else None
@@ -763,7 +792,7 @@ def cmd_auth(args):
 
     elif args.action == "pair":
         print(f"Starting pairing with {host}:{port} ...")
-        tv = create_tv_client(tv_id, args.ip)
+        tv = create_tv_client(tv_id, args.ip, tv_config)
 
         if tv.connect(timeout=10):
             # Trigger PIN dialog
@@ -803,7 +832,7 @@ def cmd_auth(args):
         print("Stored credentials cleared.")
 
     elif args.action == "refresh":
-        tv = create_tv_client(tv_id, args.ip)
+        tv = create_tv_client(tv_id, args.ip, tv_config)
         if tv.connect(timeout=10):
             if tv.refresh_token():
                 print("Token refreshed successfully!")
@@ -830,6 +859,8 @@ def _quiet_mqtt_thread_excepthook(args):
     certificate" alert from the TV surfaces there as an uncaught SSLError. For
     everything else, defer to the default hook.
     """
+    import ssl
+
     exc = args.exc_value
     msg = str(exc).upper()
     if isinstance(exc, ssl.SSLError) and "CERTIFICATE" in msg and "REQUIRED" in msg:
@@ -850,60 +881,61 @@ def _quiet_mqtt_thread_excepthook(args):
     _DEFAULT_THREAD_EXCEPTHOOK(args)
 
 
-def main():
-    """Main CLI entry point."""
-    # Keep expected TLS/cert failures from dumping a paho thread traceback.
-    threading.excepthook = _quiet_mqtt_thread_excepthook
+_NAV_ACTIONS = ("up", "down", "left", "right", "ok", "back", "home", "menu")
 
-    parser = argparse.ArgumentParser(
-        prog="tv",
-        description="Control your Hisense TV from the command line",
-    )
-    parser.add_argument("--tv", help="TV ID or alias (uses default TV if not specified)")
-    parser.add_argument("--ip", help="TV IP address (overrides --tv and config)")
-
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # Power
+def _add_power_parser(subparsers) -> None:
     p_power = subparsers.add_parser("power", help="Toggle TV power")
     p_power.set_defaults(func=cmd_power)
 
-    # Volume
+
+def _add_volume_parser(subparsers) -> None:
     p_vol = subparsers.add_parser("volume", aliases=["vol"], help="Volume control")
-    p_vol.add_argument("action", choices=["up", "down", "mute", "set", "get"], help="Volume action")
+    p_vol.add_argument("action", choices=[*_VOLUME_ACTIONS, "get"], help="Volume action")
     p_vol.add_argument("amount", type=int, nargs="?", default=1, help="Amount (default: 1)")
     p_vol.set_defaults(func=cmd_volume)
 
-    # Key
+
+def _add_key_parser(subparsers) -> None:
     p_key = subparsers.add_parser("key", help="Send a key press")
     p_key.add_argument("key", help="Key name (e.g., power, up, ok)")
     p_key.set_defaults(func=cmd_key)
 
-    # Keys list
+
+def _add_keys_parser(subparsers) -> None:
     p_keys = subparsers.add_parser("keys", help="List available keys")
     p_keys.set_defaults(func=cmd_keys)
 
-    # Navigation shortcuts
+
+def _add_nav_parser(subparsers) -> None:
     p_nav = subparsers.add_parser("nav", help="Navigation shortcuts")
-    p_nav.add_argument("action", choices=["up", "down", "left", "right", "ok", "back", "home", "menu"])
+    p_nav.add_argument("action", choices=list(_NAV_ACTIONS))
     p_nav.set_defaults(func=cmd_nav)
 
-    # Quick navigation aliases
-    for nav_cmd in ["up", "down", "left", "right", "ok", "back", "home", "menu"]:
+
+def _nav_alias_builder(nav_cmd: str):
+    """Return a builder for the quick navigation alias `nav_cmd`."""
+
+    def add_parser(subparsers) -> None:
         p = subparsers.add_parser(nav_cmd, help=f"Navigate {nav_cmd}")
         p.set_defaults(func=cmd_nav, action=nav_cmd)
 
-    # App
+    return add_parser
+
+
+def _add_app_parser(subparsers) -> None:
     p_app = subparsers.add_parser("app", help="Launch an app")
     p_app.add_argument("name", help="App name (netflix, youtube, amazon, disney, hulu) or 'list'")
     p_app.set_defaults(func=cmd_app)
 
-    # Source
+
+def _add_source_parser(subparsers) -> None:
     p_src = subparsers.add_parser("source", aliases=["input"], help="Change input source")
     p_src.add_argument("source", help="Source name (hdmi1, hdmi2, tv, av) or 'list'")
     p_src.set_defaults(func=cmd_source)
 
-    # Config
+
+def _add_config_parser(subparsers) -> None:
     p_cfg = subparsers.add_parser("config", help="View or set configuration")
     p_cfg.add_argument(
         "action",
@@ -916,11 +948,13 @@ def main():
     p_cfg.add_argument("--alias", help="Alias when adding a TV")
     p_cfg.set_defaults(func=cmd_config)
 
-    # Status
+
+def _add_status_parser(subparsers) -> None:
     p_status = subparsers.add_parser("status", help="Get TV status")
     p_status.set_defaults(func=cmd_status)
 
-    # Discovery
+
+def _add_discover_parser(subparsers) -> None:
     p_discover = subparsers.add_parser("discover", aliases=["scan"], help="Discover TVs on the network")
     p_discover.add_argument("--timeout", "-t", type=float, default=5.0, help="Discovery timeout in seconds")
     p_discover.add_argument("--method", "-m", choices=["all", "ssdp", "udp", "probe"], default="all",
@@ -928,24 +962,29 @@ def main():
     p_discover.add_argument("--verbose", "-v", action="store_true", help="Show more details")
     p_discover.set_defaults(func=cmd_discover)
 
-    # Wake-on-LAN
+
+def _add_wake_parser(subparsers) -> None:
     p_wake = subparsers.add_parser("wake", help="Wake TV using Wake-on-LAN")
     p_wake.add_argument("--mac", help="TV MAC address (e.g., AA:BB:CC:DD:EE:FF)")
     p_wake.set_defaults(func=cmd_wake)
 
-    # Turn on (wake + verify)
+
+def _add_on_parser(subparsers) -> None:
     p_on = subparsers.add_parser("on", help="Turn TV on (wake + wait)")
     p_on.set_defaults(func=cmd_on)
 
-    # Turn off (smart power off)
+
+def _add_off_parser(subparsers) -> None:
     p_off = subparsers.add_parser("off", help="Turn TV off (checks state first)")
     p_off.set_defaults(func=cmd_off)
 
-    # Monitor MQTT messages
+
+def _add_monitor_parser(subparsers) -> None:
     p_monitor = subparsers.add_parser("monitor", help="Monitor MQTT messages from TV")
     p_monitor.set_defaults(func=cmd_monitor)
 
-    # Authentication management
+
+def _add_auth_parser(subparsers) -> None:
     p_auth = subparsers.add_parser("auth", help="Manage TV authentication")
     p_auth.add_argument(
         "action",
@@ -956,6 +995,80 @@ def main():
     )
     p_auth.set_defaults(func=cmd_auth)
 
+
+# Subcommand name (and alias) -> builder, in help order
+_SUBCOMMAND_BUILDERS = {
+    "power": _add_power_parser,
+    "volume": _add_volume_parser,
+    "vol": _add_volume_parser,
+    "key": _add_key_parser,
+    "keys": _add_keys_parser,
+    "nav": _add_nav_parser,
+    **{nav_cmd: _nav_alias_builder(nav_cmd) for nav_cmd in _NAV_ACTIONS},
+    "app": _add_app_parser,
+    "source": _add_source_parser,
+    "input": _add_source_parser,
+    "config": _add_config_parser,
+    "status": _add_status_parser,
+    "discover": _add_discover_parser,
+    "scan": _add_discover_parser,
+    "wake": _add_wake_parser,
+    "on": _add_on_parser,
+    "off": _add_off_parser,
+    "monitor": _add_monitor_parser,
+    "auth": _add_auth_parser,
+}
+
+
+def _sniff_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, if it can be told without parsing.
+
+    Skips the global options (and the values of --tv/--ip). Returns None when
+    help is requested before the command, or no known command is given, so
+    the caller builds the full parser for help and error messages.
+    """
+    args = iter(argv)
+    for token in args:
+        if token in ("-h", "--help"):
+            return None
+        if token in ("--tv", "--ip"):
+            next(args, None)
+            continue
+        if token.startswith("-"):
+            continue
+        return token if token in _SUBCOMMAND_BUILDERS else None
+    return None
+
+
+def _build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser, with just the `only` subcommand if given."""
+    parser = argparse.ArgumentParser(
+        prog="tv",
+        description="Control your Hisense TV from the command line",
+    )
+    parser.add_argument("--tv", help="TV ID or alias (uses default TV if not specified)")
+    parser.add_argument("--ip", help="TV IP address (overrides --tv and config)")
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    if only is not None:
+        _SUBCOMMAND_BUILDERS[only](subparsers)
+    else:
+        # dict.fromkeys drops the repeat entries for aliases, keeping order
+        for add_parser in dict.fromkeys(_SUBCOMMAND_BUILDERS.values()):
+            add_parser(subparsers)
+
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    # Keep expected TLS/cert failures from dumping a paho thread traceback.
+    threading.excepthook = _quiet_mqtt_thread_excepthook
+
+    # Only the subparser being run is built; help and unknown commands
+    # get the full parser.
+    parser = _build_parser(_sniff_command(sys.argv[1:]))
     args = parser.parse_args()
 
     if not args.command:
@@ -9,11 +9,27 @@ import logging
 import ssl
 import threading
 import time
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import paho.mqtt.client as mqtt
 
-_LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+
+def _json_dumps_stdlib(obj: Any) -> bytes:
+    """Encode like orjson.dumps: compact separators, UTF-8 bytes."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+# orjson is an optional speedup for the MQTT payload hot path; it parses the
+# raw payload bytes and serialises straight to bytes, which paho accepts as-is.
+# Either way the same bytes go out.
+try:
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+    _json_dumps = _json_dumps_stdlib
 
 from .config import (
     DEFAULT_PORT,
@@ -23,10 +39,18 @@ from .config import (
     TokenStorage,
     get_storage,
 )
-from .certs import MISSING_CERT_HELP, bundled_ca_path, resolve_client_certs
-from .credentials import generate_credentials, generate_credentials_static
+from .certs import (
+    MISSING_CERT_HELP,
+    bundled_ca_path,
+    client_tls_context,
+    remember_tls_session,
+    resolve_client_certs,
+    server_tls_context,
+)
 from .keys import ALL_KEYS
-from .protocol import AuthMethod, detect_protocol, get_auth_method, get_auth_method_order
+# The credential generator and protocol detection are only needed for dynamic
+# auth; they're imported where used so clients with saved tokens skip them
+from .protocol import AuthMethod
 from .topics import (
     APPS,
     CLIENT_ID,
@@ -59,10 +83,64 @@ from .topics import (
     get_topic,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+# Volume change broadcasts (platform_service path)
+_VOLUME_CHANGE_TOPIC = "/remoteapp/mobile/broadcast/platform_service/actions/volumechange"
+
+# Token saves run on one shared thread instead of the MQTT network thread. A
+# single worker also keeps clients sharing tokens.json from interleaving writes.
+_STORAGE_EXECUTOR: Optional["ThreadPoolExecutor"] = None
+_STORAGE_EXECUTOR_LOCK = threading.Lock()
+
+# vidaa_app_connect request that opens the PIN dialog, serialised once
+_VIDAA_CONNECT_PAYLOAD = json.dumps({
+    "app_version": 2,
+    "connect_result": 0,
+    "device_type": "Mobile App"
+})
+
+
+def _get_storage_executor() -> "ThreadPoolExecutor":
+    """Get or create the executor that writes tokens to storage."""
+    global _STORAGE_EXECUTOR
+    if _STORAGE_EXECUTOR is None:
+        with _STORAGE_EXECUTOR_LOCK:
+            if _STORAGE_EXECUTOR is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                _STORAGE_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="pyvidaa_storage"
+                )
+    return _STORAGE_EXECUTOR
+
+
+# Topics the TV answers each request_nowait() request on, so concurrent
+# requests for different data each get their own reply. Requests not listed
+# take the next response, whatever its topic.
+_RESPONSE_TOPICS: Dict[str, Tuple[str, ...]] = {
+    TOPIC_GET_VOLUME: (TOPIC_VOLUME_RESPONSE, _VOLUME_CHANGE_TOPIC),
+    TOPIC_GET_STATE: (TOPIC_STATE_RESPONSE,),
+    TOPIC_GET_SOURCES: (TOPIC_SOURCES_RESPONSE,),
+    TOPIC_GET_APPS: (TOPIC_APPS_RESPONSE,),
+    TOPIC_GET_TV_INFO: (TOPIC_TV_INFO_RESPONSE,),
+    TOPIC_GET_DEVICE_INFO: (TOPIC_DEVICE_INFO_RESPONSE,),
+    TOPIC_GET_CAPABILITY: (TOPIC_CAPABILITY_RESPONSE,),
+}
+
 
 class VidaaTV:
     """Client to control Hisense TV via MQTT."""
 
+    # Seconds a state broadcast is trusted by the power and check_state
+    # paths before they ask the TV again
+    STATE_MAX_AGE = 0.5
+    # Seconds launch_app() trusts the installed-app list before fetching it
+    APPS_MAX_AGE = 300.0
+    # Seconds saved credentials are reused before storage is read again, so a
+    # re-pair written by another process (CLI, bridge) is picked up
+    CREDS_MAX_AGE = 60.0
+
     def __init__(
         self,
         host: str,
@@ -130,6 +208,8 @@ class VidaaTV:
 
         # Auto-detect protocol if needed and dynamic auth is enabled
         if use_dynamic_auth and auth_method is None and auto_detect_protocol:
+            from .protocol import detect_protocol, get_auth_method
+
             self._protocol_version = detect_protocol(host)
             self._auth_method = get_auth_method(self._protocol_version)
             if self._protocol_version is not None:
@@ -144,22 +224,58 @@ class VidaaTV:
         self._auth_required = False
 
         self._connected = False
+        # Set when the TV answers a CONNECT, accepted or not
+        self._connect_event = threading.Event()
         self._response_event = threading.Event()
+        # One blocking request at a time: _request() matches a reply to its
+        # request only through _response_event/_last_response
+        self._request_lock = threading.Lock()
         self._auth_event = threading.Event()
         # Set once the access token has actually been received and saved, so
         # pairing can wait for persistence instead of returning on PIN-accept.
         self._token_event = threading.Event()
         self._last_response: Optional[dict] = None
+        # Latest app list reply (see get_apps), plus its apps keyed by
+        # case-folded name and when it arrived (see launch_app)
+        self._apps_event = threading.Event()
+        self._apps_payload: Any = None
+        self._apps_by_name: Dict[str, dict] = {}
+        self._apps_time = 0.0
+        # (callback, response topics) pairs handed the reply instead of a
+        # thread blocking on _response_event (see request_nowait); None
+        # topics take the next response on any topic
+        self._response_waiters: List[Tuple[Callable[[Any], None], Optional[Tuple[str, ...]]]] = []
+        self._waiters_lock = threading.Lock()
+        # (callback, is_refresh) pairs told when a token arrives, and whether
+        # an accepted PIN should request the token itself (see
+        # authenticate_nowait / refresh_token_nowait)
+        self._token_waiters: List[Tuple[Callable[[bool], None], bool]] = []
+        self._pairing_nowait = False
+        # Formatted topics (see _topic), reset when client_id changes
+        self._topics: Dict[str, str] = {}
+        self._topics_client: Optional[str] = None
+        # Topics subscribed on connect, rebuilt when client_id changes
+        self._sub_topics: List[Tuple[str, int]] = []
+        self._sub_topics_client: Optional[str] = None
+        # Delivery handle of the most recent publish (see flush_publishes)
+        self._last_publish: Optional[mqtt.MQTTMessageInfo] = None
         self._state: dict = {}
+        # Set whenever a state broadcast arrives (see get_state)
+        self._state_updated = threading.Event()
+        self._state_time = 0.0  # time.monotonic() of the last state broadcast
         self._cached_volume: Optional[int] = None  # Cache volume from broadcasts
         self._cached_muted: bool = False  # Cache mute status from broadcasts
 
         # Track if we need to refresh token after connecting
         self._pending_token_refresh = False
         self._refresh_token: Optional[str] = None
+        # Saved credentials (see _get_saved_credentials), valid until the
+        # next token expiry would change their needs_refresh/needs_reauth flags
+        self._cached_creds: Optional[dict] = None
+        self._cached_creds_expire_at = 0.0
 
         # Check for saved credentials first (after successful pairing)
-        saved_creds = self._load_saved_credentials()
+        saved_creds = self._get_saved_credentials()
         if saved_creds:
             if saved_creds.get("needs_reauth"):
                 # Both tokens expired - need fresh pairing
@@ -208,6 +324,8 @@ class VidaaTV:
         if not saved_creds:
             # No saved credentials - need to generate or use static
             if use_dynamic_auth and mac_address:
+                from .credentials import generate_credentials
+
                 # Generate fresh credentials for new pairing
                 creds = generate_credentials(
                     mac_address=mac_address,
@@ -234,52 +352,49 @@ class VidaaTV:
                 self._username = username
                 self._password = password
 
-        # Create MQTT client with explicit configuration
-        self._client = mqtt.Client(
+        # Resolve the client certificate/key pair once, so the initial connect
+        # and any later reconnect use the same source (explicit args, env var,
+        # ~/.config/pyvidaa/certs, or a repo-local ./certs).
+        self._certs = resolve_client_certs(certfile, keyfile)
+        if use_ssl and not self._certs:
+            # Mutual TLS is required by some protocol versions, so warn (with
+            # guidance); the connection falls back to plain TLS.
+            _LOGGER.warning("%s", MISSING_CERT_HELP)
+
+        self._client = self._new_mqtt_client()
+
+    def _new_mqtt_client(self) -> mqtt.Client:
+        """Build a paho client for the current credentials.
+
+        The TLS contexts come from the certs module's per-process cache, so a
+        new client (e.g. for each auth fallback attempt) doesn't re-read the
+        cert files.
+        """
+        client = mqtt.Client(
             client_id=self._mqtt_client_id,
             clean_session=True,
             protocol=mqtt.MQTTv311,
             transport="tcp"
         )
-        self._client.on_connect = self._on_connect
-        self._client.on_disconnect = self._on_disconnect
-        self._client.on_message = self._on_message
-
-        # Resolve the client certificate/key pair once, so the initial connect
-        # and any later reconnect use the same source (explicit args, env var,
-        # ~/.config/pyvidaa/certs, or a repo-local ./certs).
-        self._certs = resolve_client_certs(certfile, keyfile)
+        client.on_connect = self._on_connect
+        client.on_disconnect = self._on_disconnect
+        client.on_message = self._on_message
+        client.username_pw_set(self._username, self._password)
 
-        # Configure SSL with client certificate for mutual TLS
-        if use_ssl:
+        self._tls_context = None
+        if self.use_ssl:
             if self._certs:
+                # Mutual TLS. Hostname checking is always off since the TV's
+                # cert CN is "RemoteCA", not its IP; when verifying, the chain
+                # is still validated.
                 cert, key = self._certs
-                # Using client certs - also need username/password
-                self._client.username_pw_set(self._username, self._password)
-                ca_certs, cert_reqs = self._server_verify_args()
-                self._client.tls_set(
-                    ca_certs=ca_certs,
-                    certfile=cert,
-                    keyfile=key,
-                    cert_reqs=cert_reqs,
-                    tls_version=ssl.PROTOCOL_TLS,
+                self._tls_context = client_tls_context(
+                    cert, key, self._server_verify_args()[0]
                 )
-                # Always skip hostname checking: the TV's cert CN is "RemoteCA",
-                # not its IP. When verifying, the chain is still validated.
-                self._client.tls_insecure_set(True)
             else:
-                # No client cert found. Mutual TLS is required by some protocol
-                # versions, so warn (with guidance) and fall back to plain TLS.
-                _LOGGER.warning("%s", MISSING_CERT_HELP)
-                self._client.username_pw_set(self._username, self._password)
-                context = ssl.create_default_context()
-                if not verify_ssl:
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                self._client.tls_set_context(context)
-        else:
-            # No SSL - use username/password
-            self._client.username_pw_set(self._username, self._password)
+                self._tls_context = server_tls_context(self.verify_ssl)
+            client.tls_set_context(self._tls_context)
+        return client
 
     def _server_verify_args(self):
         """Return (ca_certs, cert_reqs) for the mutual-TLS handshake.
@@ -298,6 +413,30 @@ class VidaaTV:
             )
         return None, ssl.CERT_NONE
 
+    def _get_saved_credentials(self) -> Optional[dict]:
+        """Return saved credentials, reading storage only when needed.
+
+        Usable credentials are reused for up to CREDS_MAX_AGE seconds, and
+        never past the access token's expiry, so reconnects don't read the
+        token file again. Misses and records that need a refresh or re-pair
+        aren't cached, so a new token from another process is seen at once.
+        """
+        if self._cached_creds is not None and time.time() < self._cached_creds_expire_at:
+            return self._cached_creds
+        creds = self._load_saved_credentials()
+        self._cached_creds = None
+        if creds and creds["access_token"] and not (creds["needs_refresh"] or creds["needs_reauth"]):
+            # TokenStorage treats tokens as expired 5 minutes early
+            lifetime = min(creds["access_expires_in"] - 300, self.CREDS_MAX_AGE)
+            if lifetime > 0:
+                self._cached_creds = creds
+                self._cached_creds_expire_at = time.time() + lifetime
+        return creds
+
+    def _forget_saved_credentials(self) -> None:
+        """Drop the cached credentials after the stored token changed."""
+        self._cached_creds = None
+
     def _load_saved_credentials(self) -> Optional[dict]:
         """Load saved credentials from storage for reconnection.
 
@@ -308,7 +447,7 @@ class VidaaTV:
         if not self._storage:
             return None
 
-        token_data = self._storage.get_token(host=self.host, port=self.port)
+        token_data, status = self._storage.get_token_and_status(host=self.host, port=self.port)
         if not token_data:
             return None
 
@@ -321,9 +460,6 @@ class VidaaTV:
         if not (client_id and mqtt_username):
             return None
 
-        # Get token status
-        status = self._storage.get_token_status(host=self.host, port=self.port)
-
         return {
             "client_id": client_id,
             "mqtt_username": mqtt_username,
@@ -344,12 +480,9 @@ class VidaaTV:
         Returns:
             True if valid token was loaded
         """
-        if not self._storage:
-            return False
-
-        token_data = self._storage.get_token(host=self.host, port=self.port)
-        if token_data and not token_data.get("needs_refresh"):
-            self._access_token = token_data.get("access_token")
+        creds = self._get_saved_credentials()
+        if creds and creds["access_token"] and not (creds["needs_refresh"] or creds["needs_reauth"]):
+            self._access_token = creds["access_token"]
             self._authenticated = True
             return True
 
@@ -376,18 +509,13 @@ class VidaaTV:
             except Exception:
                 pass
             self._connected = False
+            self._connect_event.clear()
 
             self._client.connect(self.host, self.port, keepalive=60)
-            self._client.loop_start()
-
-            # Wait for connection
-            start = time.time()
-            while not self._connected and (time.time() - start) < timeout:
-                time.sleep(0.1)
 
-            if not self._connected:
-                # Connection failed - stop loop and try fallback if enabled
-                self._client.loop_stop()
+            if not self._await_connack(timeout):
+                # Connection failed - try fallback if enabled
+                self._client.disconnect()
                 if try_fallback and self._protocol_version is None and self.use_dynamic_auth and self.mac_address:
                     return self._connect_with_fallback(timeout=timeout, auto_refresh=auto_refresh)
                 return False
@@ -423,6 +551,9 @@ class VidaaTV:
         Returns:
             True if connected successfully with any auth method
         """
+        from .credentials import generate_credentials
+        from .protocol import get_auth_method_order
+
         auth_methods = get_auth_method_order()
 
         # Skip the method we already tried
@@ -440,62 +571,27 @@ class VidaaTV:
                 auth_method=method,
             )
 
-            # Create new MQTT client with new credentials
+            # New MQTT client with new credentials (paho fixes the client_id
+            # at construction)
             self._mqtt_client_id = creds.client_id
             self._username = creds.username
             self._password = creds.password
             self.client_id = creds.client_id
 
-            self._client = mqtt.Client(
-                client_id=self._mqtt_client_id,
-                clean_session=True,
-                protocol=mqtt.MQTTv311,
-                transport="tcp"
-            )
-            self._client.on_connect = self._on_connect
-            self._client.on_disconnect = self._on_disconnect
-            self._client.on_message = self._on_message
-
-            # Reconfigure SSL (reuse the cert pair resolved at init)
-            if self.use_ssl:
-                if self._certs:
-                    cert, key = self._certs
-                    self._client.username_pw_set(self._username, self._password)
-                    ca_certs, cert_reqs = self._server_verify_args()
-                    self._client.tls_set(
-                        ca_certs=ca_certs,
-                        certfile=cert,
-                        keyfile=key,
-                        cert_reqs=cert_reqs,
-                        tls_version=ssl.PROTOCOL_TLS,
-                    )
-                    self._client.tls_insecure_set(True)
-                else:
-                    self._client.username_pw_set(self._username, self._password)
-                    context = ssl.create_default_context()
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    self._client.tls_set_context(context)
-            else:
-                self._client.username_pw_set(self._username, self._password)
+            self._client = self._new_mqtt_client()
 
             # Try connecting
             try:
+                self._connect_event.clear()
                 self._client.connect(self.host, self.port, keepalive=60)
-                self._client.loop_start()
-
-                start = time.time()
-                while not self._connected and (time.time() - start) < timeout:
-                    time.sleep(0.1)
 
-                if self._connected:
+                if self._await_connack(timeout):
                     _LOGGER.info("Connected successfully with %s authentication!", method.value)
                     if auto_refresh and self._pending_token_refresh:
                         if not self.refresh_token(timeout=timeout):
                             _LOGGER.warning("Token refresh failed")
                     return True
                 else:
-                    self._client.loop_stop()
                     self._client.disconnect()
             except Exception as e:
                 _LOGGER.debug("  %s auth failed: %s", method.value, e)
@@ -508,35 +604,80 @@ class VidaaTV:
         _LOGGER.error("All authentication methods failed")
         return False
 
+    def _await_connack(self, timeout: float) -> bool:
+        """Run the network loop on this thread until the TV answers CONNECT.
+
+        The background network thread is only started once the connection
+        is accepted, so a refused attempt (e.g. each auth fallback) doesn't
+        spawn and join a thread of its own.
+
+        Returns:
+            True if connected; the network thread is running in that case
+        """
+        deadline = time.monotonic() + timeout
+        while not self._connect_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._client.loop(min(remaining, 1.0)) != mqtt.MQTT_ERR_SUCCESS:
+                break
+        if self._connected:
+            self._client.loop_start()
+        return self._connected
+
     def disconnect(self):
         """Disconnect from the TV."""
         self._client.loop_stop()
         self._client.disconnect()
         self._connected = False
 
+    def _topic(self, template: str) -> str:
+        """Return a topic template filled in for the current client_id.
+
+        Formatted topics are cached until client_id changes (the credential
+        refresh and auth fallback paths reassign it).
+        """
+        if self._topics_client != self.client_id:
+            self._topics = {}
+            self._topics_client = self.client_id
+        topic = self._topics.get(template)
+        if topic is None:
+            topic = self._topics[template] = get_topic(template, self.client_id)
+        return topic
+
+    def _subscription_topics(self) -> List[Tuple[str, int]]:
+        """Return the (topic, qos) pairs to subscribe to, cached per client_id."""
+        if self._sub_topics_client != self.client_id:
+            self._sub_topics = [(topic, 0) for topic in (
+                # State and volume broadcasts
+                TOPIC_STATE_RESPONSE,
+                TOPIC_VOLUME_RESPONSE,
+                # Volume change broadcasts (platform_service path)
+                _VOLUME_CHANGE_TOPIC,
+                self._topic(TOPIC_SOURCES_RESPONSE),
+                self._topic(TOPIC_APPS_RESPONSE),
+                # Authentication and token topics
+                self._topic(TOPIC_AUTH_RESPONSE),
+                self._topic(TOPIC_AUTH_CODE_RESPONSE),
+                self._topic(TOPIC_TOKEN_RESPONSE),
+                # Device info topics
+                self._topic(TOPIC_TV_INFO_RESPONSE),
+                self._topic(TOPIC_DEVICE_INFO_RESPONSE),
+                self._topic(TOPIC_CAPABILITY_RESPONSE),
+            )]
+            self._sub_topics_client = self.client_id
+        return self._sub_topics
+
     def _on_connect(self, client, userdata, flags, rc):
         """Handle connection callback."""
         if rc == 0:
             self._connected = True
             _LOGGER.info("Connected to TV at %s:%s", self.host, self.port)
-            # Subscribe to response topics
-            self._client.subscribe(TOPIC_STATE_RESPONSE)
-            self._client.subscribe(TOPIC_VOLUME_RESPONSE)
-            # Volume change broadcasts (platform_service path)
-            self._client.subscribe("/remoteapp/mobile/broadcast/platform_service/actions/volumechange")
-            self._client.subscribe(get_topic(TOPIC_SOURCES_RESPONSE, self.client_id))
-            self._client.subscribe(get_topic(TOPIC_APPS_RESPONSE, self.client_id))
-
-            # Subscribe to authentication and token topics
-            self._client.subscribe(get_topic(TOPIC_AUTH_RESPONSE, self.client_id))
-            self._client.subscribe(get_topic(TOPIC_AUTH_CODE_RESPONSE, self.client_id))
-            self._client.subscribe(get_topic(TOPIC_TOKEN_RESPONSE, self.client_id))
-            self._client.subscribe(f"/remoteapp/mobile/broadcast/ui_service/state")
-
-            # Subscribe to device info topics
-            self._client.subscribe(get_topic(TOPIC_TV_INFO_RESPONSE, self.client_id))
-            self._client.subscribe(get_topic(TOPIC_DEVICE_INFO_RESPONSE, self.client_id))
-            self._client.subscribe(get_topic(TOPIC_CAPABILITY_RESPONSE, self.client_id))
+            if self._tls_context is not None:
+                # Let the next connect to this TV resume the TLS session
+                remember_tls_session(self._tls_context, self.host, self._client.socket())
+            # One SUBSCRIBE packet for every response topic
+            self._client.subscribe(self._subscription_topics())
 
             # If we have a saved token, we're already authenticated
             if self._access_token:
@@ -556,37 +697,53 @@ class VidaaTV:
             _LOGGER.error("Connection to %s:%s failed with code %s (%s)",
                           self.host, self.port, rc, detail)
 
+        # Wake connect() either way; a refused CONNECT needn't wait out the timeout
+        self._connect_event.set()
+
     def _on_disconnect(self, client, userdata, rc):
         """Handle disconnection callback."""
         self._connected = False
 
     def _on_message(self, client, userdata, msg):
         """Handle incoming messages."""
+        # Every subscription is an exact topic, so route on its last segment
+        # (or the broadcast prefix) rather than scanning for words
+        topic = msg.topic
         try:
-            payload = json.loads(msg.payload.decode())
+            payload = _json_loads(msg.payload)
+
+            # The app list gets its own slot, so broadcasts arriving while
+            # get_apps() waits can't take its place in _last_response
+            if topic.endswith("/applist"):
+                self._apps_payload = payload
+                if isinstance(payload, list):
+                    by_name: Dict[str, dict] = {}
+                    for app in payload:
+                        if isinstance(app, dict) and app.get("name"):
+                            by_name.setdefault(app["name"].casefold(), app)
+                    self._apps_by_name = by_name
+                    self._apps_time = time.monotonic()
+                self._apps_event.set()
 
             # The TV occasionally publishes bare JSON scalars (e.g. a string)
             # instead of an object. Record it and unblock any waiter, but never
             # pass it to the dict-expecting handlers below (they call .get()).
             if not isinstance(payload, dict):
-                _LOGGER.debug("Non-dict payload on %s: %r", msg.topic, payload)
-                self._last_response = payload
-                self._response_event.set()
+                _LOGGER.debug("Non-dict payload on %s: %r", topic, payload)
+                self._set_response(payload, topic)
                 return
 
             # Handle token issuance response
-            if "tokenissuance" in msg.topic:
-                self._last_response = payload
-                self._response_event.set()
+            if topic.endswith("/tokenissuance"):
+                self._set_response(payload, topic)
                 self._handle_token_response(payload)
             # Handle authentication responses (PIN verification)
-            elif "authentication" in msg.topic:
-                self._last_response = payload
-                self._response_event.set()
+            elif topic.endswith(("/authentication", "/authenticationcode")):
+                self._set_response(payload, topic)
                 self._handle_auth_response(payload)
             # Handle volume response (broadcast topic but needs response event)
-            elif "/volume" in msg.topic or "volumechange" in msg.topic:
-                _LOGGER.debug("Volume response on %s: %s", msg.topic, payload)
+            elif topic.endswith(("/volume", "/volumechange")):
+                _LOGGER.debug("Volume response on %s: %s", topic, payload)
                 volume_type = payload.get("volume_type", 0)
                 if volume_type == 0:  # Main speaker volume
                     for field in ["volume_value", "volume", "value"]:
@@ -599,11 +756,14 @@ class VidaaTV:
                 elif volume_type == 2:  # Mute status (0=unmuted, 1=muted)
                     mute_val = payload.get("volume_value", 0)
                     self._cached_muted = (mute_val == 1)
-                self._last_response = payload
-                self._response_event.set()
+                self._set_response(payload, topic)
             # Handle broadcast state updates (don't trigger response event)
-            elif "broadcast" in msg.topic:
+            elif topic.startswith("/remoteapp/mobile/broadcast/"):
                 self._state = payload
+                self._state_time = time.monotonic()
+                self._state_updated.set()
+                if self._response_waiters:
+                    self._wake_waiters(payload, topic, any_topic=False)
                 # Check if auth is required from state
                 if payload.get("statetype") == "authentication":
                     self._auth_required = True
@@ -613,11 +773,37 @@ class VidaaTV:
                     self.on_state_change(payload)
             # All other responses (device info, sources, apps, etc)
             else:
-                self._last_response = payload
-                self._response_event.set()
-        except json.JSONDecodeError:
-            self._last_response = {"raw": msg.payload.decode()}
-            self._response_event.set()
+                self._set_response(payload, topic)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self._set_response({"raw": msg.payload.decode("utf-8", errors="replace")}, topic)
+
+    def _set_response(self, payload: Any, topic: Optional[str] = None) -> None:
+        """Record a response and wake whoever is waiting for it."""
+        self._last_response = payload
+        self._response_event.set()
+        if self._response_waiters:
+            self._wake_waiters(payload, topic, any_topic=True)
+
+    def _wake_waiters(self, payload: Any, topic: Optional[str], any_topic: bool) -> None:
+        """Hand payload to the request_nowait() callbacks waiting for topic.
+
+        Callbacks registered without response topics only take it when
+        any_topic is set (i.e. for responses, not state broadcasts).
+        """
+        with self._waiters_lock:
+            ready = []
+            waiting = []
+            for waiter in self._response_waiters:
+                topics = waiter[1]
+                if (any_topic and topics is None) or (topics is not None and topic in topics):
+                    ready.append(waiter)
+                else:
+                    waiting.append(waiter)
+            if not ready:
+                return
+            self._response_waiters = waiting
+        for callback, _topics in ready:
+            callback(payload)
 
     def _handle_auth_response(self, payload: dict):
         """Handle authentication response from TV.
@@ -634,6 +820,9 @@ class VidaaTV:
             self._authenticated = True
             self._auth_required = False
             self._auth_event.set()
+            if self._pairing_nowait:
+                self._pairing_nowait = False
+                self._request_token()
 
         # Check if auth is required
         elif payload.get("statetype") == "authenticationcode":
@@ -660,7 +849,9 @@ class VidaaTV:
             # Save full credentials if persistence enabled
             # Important: mqtt_username and client_id are needed for reconnection
             if self._storage:
-                self._storage.save_token(
+                # The file write runs on the storage thread so this MQTT
+                # callback returns at once; waiters are woken once it's saved
+                _get_storage_executor().submit(self._save_token, dict(
                     # Key by host:port to match the legacy format the CLI
                     # lookups fall back to (storage matches by key, not by the
                     # host field inside entries).
@@ -676,19 +867,60 @@ class VidaaTV:
                     uuid=self.mac_address,           # Store UUID for reference
                     auth_method=self._auth_method.value if self._auth_method else None,
                     protocol_version=self._protocol_version,
-                )
+                ))
+            else:
+                self._token_saved()
 
-            _LOGGER.info("Token received and saved!")
-            self._auth_event.set()
-            self._token_event.set()
+    def _save_token(self, token: dict) -> None:
+        """Persist a received token (storage thread), then wake the waiters."""
+        try:
+            self._storage.save_token(**token)
+        except Exception:
+            # Waiters aren't woken: pairing must not report an unsaved token
+            _LOGGER.exception("Failed to save token for %s", token["device_id"])
+            return
+        self._forget_saved_credentials()
+        self._token_saved()
+
+    def _token_saved(self) -> None:
+        """Wake everyone waiting for the token that was just received."""
+        _LOGGER.info("Token received and saved!")
+        self._auth_event.set()
+        self._token_event.set()
+        if self._token_waiters:
+            with self._waiters_lock:
+                waiters, self._token_waiters = self._token_waiters, []
+            for callback, is_refresh in waiters:
+                if is_refresh:
+                    self._token_refreshed()
+                callback(True)
 
     def _publish(self, topic: str, payload: Any = "") -> bool:
         """Publish a message to the TV.
 
+        Safe to call from any thread (paho queues the packet under its own
+        lock); waiting for a reply is serialised separately by _request().
+
         Args:
             topic: MQTT topic
             payload: Message payload (will be JSON encoded if dict)
 
+        Returns:
+            True if published successfully
+        """
+        if isinstance(payload, dict):
+            payload = _json_dumps(payload)
+        return self._publish_raw(topic, payload)
+
+    def _publish_raw(self, topic: str, payload: Any) -> bool:
+        """Publish a payload that is already a str or bytes.
+
+        Used by the key and volume paths, whose payloads are never dicts.
+
+        Args:
+            topic: MQTT topic
+            payload: Message payload, sent as-is
+
         Returns:
             True if published successfully
         """
@@ -696,12 +928,31 @@ class VidaaTV:
             _LOGGER.warning("Not connected to TV")
             return False
 
-        if isinstance(payload, dict):
-            payload = json.dumps(payload)
-
         result = self._client.publish(topic, payload)
+        self._last_publish = result
         return result.rc == mqtt.MQTT_ERR_SUCCESS
 
+    def flush_publishes(self, timeout: float = 1.0) -> bool:
+        """Wait until the most recent publish has been written to the TV.
+
+        Publishes go out in order, so this covers everything sent before it
+        too. Use it before disconnect() instead of sleeping a fixed amount.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if nothing is pending, False on timeout or a failed publish
+        """
+        info = self._last_publish
+        if info is None:
+            return True
+        try:
+            info.wait_for_publish(timeout)
+        except (ValueError, RuntimeError):
+            return False
+        return info.is_published()
+
     def _request(self, topic: str, payload: Any = "", timeout: float = 5.0) -> Optional[dict]:
         """Send a request and wait for response.
 
@@ -713,15 +964,51 @@ class VidaaTV:
         Returns:
             Response dict or None if timeout
         """
-        self._response_event.clear()
-        self._last_response = None
+        # Concurrent callers would otherwise clear each other's event and
+        # take each other's reply, turning a slow answer into a timeout
+        with self._request_lock:
+            self._response_event.clear()
+            self._last_response = None
 
-        if not self._publish(topic, payload):
+            if not self._publish(topic, payload):
+                return None
+
+            if self._response_event.wait(timeout):
+                return self._last_response
             return None
 
-        if self._response_event.wait(timeout):
-            return self._last_response
-        return None
+    def request_nowait(self, topic_template: str, callback: Callable[[Any], None]) -> bool:
+        """Send a request and pass its response to callback.
+
+        Unlike the blocking getters this returns as soon as the request is
+        published, so no thread is held while the TV answers. The callback
+        runs on the MQTT network thread. Requests with a known response
+        topic (see _RESPONSE_TOPICS) only take replies on it, so several
+        can be in flight at once.
+
+        Args:
+            topic_template: Request topic template (e.g. TOPIC_GET_SOURCES)
+            callback: Called once with the response payload
+
+        Returns:
+            True if the request was published
+        """
+        topics = _RESPONSE_TOPICS.get(topic_template)
+        if topics is not None:
+            topics = tuple(self._topic(template) for template in topics)
+        with self._waiters_lock:
+            self._response_waiters.append((callback, topics))
+        if self._publish(self._topic(topic_template)):
+            return True
+        self.cancel_request(callback)
+        return False
+
+    def cancel_request(self, callback: Callable[[Any], None]) -> None:
+        """Forget a request_nowait() callback that is no longer wanted."""
+        with self._waiters_lock:
+            self._response_waiters = [
+                waiter for waiter in self._response_waiters if waiter[0] is not callback
+            ]
 
     # Authentication
     def authenticate(self, pin: str, wait_for_response: bool = True, timeout: float = 10.0) -> bool:
@@ -735,19 +1022,7 @@ class VidaaTV:
         Returns:
             True if authentication successful (or sent if not waiting)
         """
-        self._auth_event.clear()
-        self._token_event.clear()
-        topic = get_topic(TOPIC_AUTH, self.client_id)
-
-        # PIN must be sent as integer, not string!
-        try:
-            pin_int = int(pin)
-        except ValueError:
-            _LOGGER.error("Invalid PIN: %s", pin)
-            return False
-
-        # Send PIN as integer in JSON (critical for auth to work)
-        if not self._publish(topic, {"authNum": pin_int}):
+        if not self._send_pin(pin):
             return False
 
         if not wait_for_response:
@@ -769,6 +1044,56 @@ class VidaaTV:
         _LOGGER.warning("PIN accepted but no access token received within %ss", timeout)
         return False
 
+    def authenticate_nowait(self, pin: str, callback: Callable[[bool], None]) -> bool:
+        """Send the PIN and pass True to callback once the token is saved.
+
+        The non-blocking counterpart of authenticate(): the token is requested
+        from the MQTT network thread as soon as the PIN is accepted. A wrong
+        PIN gets no answer, so the caller applies its own timeout and then
+        calls cancel_token_wait().
+
+        Args:
+            pin: 4-digit PIN shown on TV screen
+            callback: Called once with True on the MQTT network thread
+
+        Returns:
+            True if the PIN was sent
+        """
+        with self._waiters_lock:
+            self._token_waiters.append((callback, False))
+        self._pairing_nowait = True
+        if self._send_pin(pin):
+            return True
+        self._pairing_nowait = False
+        self.cancel_token_wait(callback)
+        return False
+
+    def cancel_token_wait(self, callback: Callable[[bool], None]) -> None:
+        """Forget a token callback that is no longer wanted."""
+        with self._waiters_lock:
+            self._token_waiters = [
+                waiter for waiter in self._token_waiters if waiter[0] is not callback
+            ]
+            # A timed-out pairing must not make a later PIN request the token
+            if not any(not is_refresh for _, is_refresh in self._token_waiters):
+                self._pairing_nowait = False
+
+    def _send_pin(self, pin: str) -> bool:
+        """Publish the pairing PIN, resetting the auth events first."""
+        self._auth_event.clear()
+        self._token_event.clear()
+        topic = self._topic(TOPIC_AUTH)
+
+        # PIN must be sent as integer, not string!
+        try:
+            pin_int = int(pin)
+        except ValueError:
+            _LOGGER.error("Invalid PIN: %s", pin)
+            return False
+
+        # Send PIN as integer in JSON (critical for auth to work)
+        return self._publish(topic, {"authNum": pin_int})
+
     def _request_token(self, refresh_token: str = ""):
         """Request access token (new or refreshed).
 
@@ -776,12 +1101,12 @@ class VidaaTV:
             refresh_token: If provided, requests a refreshed token.
                           If empty, requests initial token after PIN auth.
         """
-        topic = get_topic(TOPIC_GET_TOKEN, self.client_id)
+        topic = self._topic(TOPIC_GET_TOKEN)
         self._publish(topic, {"refreshtoken": refresh_token})
 
         if not refresh_token:
             # Close authentication dialog (only for initial auth)
-            close_topic = get_topic(TOPIC_AUTH_CLOSE, self.client_id)
+            close_topic = self._topic(TOPIC_AUTH_CLOSE)
             self._publish(close_topic, "")
 
     def refresh_token(self, timeout: float = 10.0) -> bool:
@@ -805,15 +1130,38 @@ class VidaaTV:
         # Wait for new token
         if self._auth_event.wait(timeout):
             if self._access_token:
-                _LOGGER.info("Token refreshed successfully!")
-                # Update password for future reconnections
-                self._password = self._access_token
-                self._pending_token_refresh = False
+                self._token_refreshed()
                 return True
 
         _LOGGER.warning("Token refresh failed")
         return False
 
+    def refresh_token_nowait(self, callback: Callable[[bool], None]) -> bool:
+        """Request a refreshed token and pass True to callback once it arrives.
+
+        The non-blocking counterpart of refresh_token(). The caller applies
+        its own timeout and then calls cancel_token_wait().
+
+        Args:
+            callback: Called once with True on the MQTT network thread
+
+        Returns:
+            True if the refresh request was sent
+        """
+        if not self._refresh_token or not self._connected:
+            return self.refresh_token()  # logs why and returns False
+        with self._waiters_lock:
+            self._token_waiters.append((callback, True))
+        _LOGGER.info("Refreshing access token...")
+        self._request_token(self._refresh_token)
+        return True
+
+    def _token_refreshed(self) -> None:
+        """Adopt a refreshed access token for future reconnections."""
+        _LOGGER.info("Token refreshed successfully!")
+        self._password = self._access_token
+        self._pending_token_refresh = False
+
     def start_pairing(self) -> bool:
         """Start the pairing process to show PIN on TV.
 
@@ -823,17 +1171,13 @@ class VidaaTV:
             True if pairing request sent successfully
         """
         # Subscribe to auth topics
-        self._client.subscribe(get_topic(TOPIC_AUTH_RESPONSE, self.client_id))
-        self._client.subscribe(get_topic(TOPIC_AUTH_CODE_RESPONSE, self.client_id))
-        self._client.subscribe(get_topic(TOPIC_TOKEN_RESPONSE, self.client_id))
+        self._client.subscribe(self._topic(TOPIC_AUTH_RESPONSE))
+        self._client.subscribe(self._topic(TOPIC_AUTH_CODE_RESPONSE))
+        self._client.subscribe(self._topic(TOPIC_TOKEN_RESPONSE))
 
         # Send vidaa_app_connect to trigger PIN dialog
-        topic = get_topic(TOPIC_VIDAA_CONNECT, self.client_id)
-        return self._publish(topic, {
-            "app_version": 2,
-            "connect_result": 0,
-            "device_type": "Mobile App"
-        })
+        topic = self._topic(TOPIC_VIDAA_CONNECT)
+        return self._publish(topic, _VIDAA_CONNECT_PAYLOAD)
 
     def is_authenticated(self) -> bool:
         """Check if currently authenticated with the TV."""
@@ -847,6 +1191,7 @@ class VidaaTV:
         """Clear saved authentication token for this TV."""
         if self._storage:
             self._storage.delete_token(self.host, self.port)
+            self._forget_saved_credentials()
         self._access_token = None
         self._authenticated = False
 
@@ -870,11 +1215,21 @@ class VidaaTV:
         Returns:
             True if TV is on, False if off or unreachable
         """
-        state = self.get_state(timeout=timeout)
+        state = self._recent_state(timeout)
         if state and state.get("statetype") == "fake_sleep_0":
             return False
         return state is not None
 
+    def _recent_state(self, timeout: float = 3.0) -> Optional[dict]:
+        """Return the last state broadcast if it is fresh, else query the TV.
+
+        A broadcast younger than STATE_MAX_AGE is reused, so bursts of
+        state-checked commands don't each wait a round trip for it.
+        """
+        if self._state and time.monotonic() - self._state_time < self.STATE_MAX_AGE:
+            return self._state
+        return self.get_state(timeout=timeout)
+
     def is_on(self) -> bool:
         """Check if TV is currently powered on.
 
@@ -900,8 +1255,52 @@ class VidaaTV:
                 _LOGGER.debug("TV is off. Command not sent.")
                 return False
 
-        topic = get_topic(TOPIC_SEND_KEY, self.client_id)
-        return self._publish(topic, key)
+        if key == "KEY_POWER":
+            # The cached state no longer says whether the TV is on
+            self._state_time = 0.0
+        topic = self._topic(TOPIC_SEND_KEY)
+        return self._publish_raw(topic, key)
+
+    def send_keys(self, keys: List[str], check_state: bool = False, interval: float = 0.0) -> bool:
+        """Send several remote key presses back to back.
+
+        Args:
+            keys: Key constants to send, in order
+            check_state: If True, check TV is on once for the whole batch
+                (power keys are sent regardless, as in send_key)
+            interval: Seconds to pause between presses, for menus that drop
+                presses arriving too quickly (default 0, no pause)
+
+        Returns:
+            True if every key was sent successfully
+        """
+        return all(self.send_keys_each(keys, check_state, interval))
+
+    def send_keys_each(
+        self, keys: List[str], check_state: bool = False, interval: float = 0.0
+    ) -> List[bool]:
+        """Send several remote key presses, reporting each one separately.
+
+        Same as send_keys, but returns one result per key, in order.
+        """
+        tv_on = True
+        if check_state and any(key != "KEY_POWER" for key in keys):
+            tv_on = self._is_tv_on()
+            if not tv_on:
+                _LOGGER.debug("TV is off. Commands not sent.")
+
+        if "KEY_POWER" in keys:
+            self._state_time = 0.0
+        topic = self._topic(TOPIC_SEND_KEY)
+        results = []
+        for index, key in enumerate(keys):
+            if not tv_on and key != "KEY_POWER":
+                results.append(False)
+                continue
+            if interval and index:
+                time.sleep(interval)
+            results.append(self._publish_raw(topic, key))
+        return results
 
     def power(self) -> bool:
         """Toggle power."""
@@ -913,7 +1312,7 @@ class VidaaTV:
         Returns:
             True if command sent or TV already on
         """
-        state = self.get_state(timeout=3.0)
+        state = self._recent_state()
         if state and state.get("statetype") == "fake_sleep_0":
             return self.send_key("KEY_POWER")
         elif state:
@@ -929,7 +1328,7 @@ class VidaaTV:
         Returns:
             True if command sent or TV already off
         """
-        state = self.get_state(timeout=3.0)
+        state = self._recent_state()
         if state and state.get("statetype") != "fake_sleep_0":
             return self.send_key("KEY_POWER")
         elif state:
@@ -940,33 +1339,45 @@ class VidaaTV:
             _LOGGER.warning("Could not determine TV state.")
             return False
 
-    def volume_up(self) -> bool:
-        """Increase volume."""
-        return self.send_key("KEY_VOLUMEUP")
+    def volume_up(self, count: int = 1) -> bool:
+        """Increase volume by `count` steps, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_VOLUMEUP")
+        return self.send_keys(["KEY_VOLUMEUP"] * count)
 
-    def volume_down(self) -> bool:
-        """Decrease volume."""
-        return self.send_key("KEY_VOLUMEDOWN")
+    def volume_down(self, count: int = 1) -> bool:
+        """Decrease volume by `count` steps, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_VOLUMEDOWN")
+        return self.send_keys(["KEY_VOLUMEDOWN"] * count)
 
     def mute(self) -> bool:
         """Toggle mute."""
         return self.send_key("KEY_MUTE")
 
-    def up(self) -> bool:
-        """Navigate up."""
-        return self.send_key("KEY_UP")
-
-    def down(self) -> bool:
-        """Navigate down."""
-        return self.send_key("KEY_DOWN")
-
-    def left(self) -> bool:
-        """Navigate left."""
-        return self.send_key("KEY_LEFT")
-
-    def right(self) -> bool:
-        """Navigate right."""
-        return self.send_key("KEY_RIGHT")
+    def up(self, count: int = 1) -> bool:
+        """Navigate up `count` times, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_UP")
+        return self.send_keys(["KEY_UP"] * count)
+
+    def down(self, count: int = 1) -> bool:
+        """Navigate down `count` times, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_DOWN")
+        return self.send_keys(["KEY_DOWN"] * count)
+
+    def left(self, count: int = 1) -> bool:
+        """Navigate left `count` times, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_LEFT")
+        return self.send_keys(["KEY_LEFT"] * count)
+
+    def right(self, count: int = 1) -> bool:
+        """Navigate right `count` times, publishing the presses back to back."""
+        if count == 1:
+            return self.send_key("KEY_RIGHT")
+        return self.send_keys(["KEY_RIGHT"] * count)
 
     def ok(self) -> bool:
         """Press OK/Enter."""
@@ -1007,9 +1418,16 @@ class VidaaTV:
         Returns:
             Volume level (0-100) or None if failed
         """
-        topic = get_topic(TOPIC_GET_VOLUME, self.client_id)
-        response = self._request(topic, timeout=timeout)
-        if response:
+        topic = self._topic(TOPIC_GET_VOLUME)
+        return self.parse_volume(self._request(topic, timeout=timeout))
+
+    def parse_volume(self, response: Optional[dict]) -> Optional[int]:
+        """Extract the main speaker volume from a volume response.
+
+        Falls back to the last broadcast volume when the response is missing
+        or is for another volume type.
+        """
+        if isinstance(response, dict):
             # Only use main speaker volume (volume_type 0)
             volume_type = response.get("volume_type", 0)
             if volume_type == 0:
@@ -1049,12 +1467,12 @@ class VidaaTV:
             True if sent successfully
         """
         if check_state and not self._is_tv_on():
-            print("TV is off. Command not sent.")
+            _LOGGER.debug("TV is off. Command not sent.")
             return False
 
         level = max(0, min(100, level))
-        topic = get_topic(TOPIC_SET_VOLUME, self.client_id)
-        return self._publish(topic, str(level))
+        topic = self._topic(TOPIC_SET_VOLUME)
+        return self._publish_raw(topic, str(level))
 
     # Source control
     def get_sources(self, timeout: float = 5.0) -> Optional[list]:
@@ -1063,7 +1481,7 @@ class VidaaTV:
         Returns:
             List of source dicts or None if failed
         """
-        topic = get_topic(TOPIC_GET_SOURCES, self.client_id)
+        topic = self._topic(TOPIC_GET_SOURCES)
         return self._request(topic, timeout=timeout)
 
     def set_source(self, source: str, check_state: bool = False) -> bool:
@@ -1077,11 +1495,11 @@ class VidaaTV:
             True if sent successfully
         """
         if check_state and not self._is_tv_on():
-            print("TV is off. Command not sent.")
+            _LOGGER.debug("TV is off. Command not sent.")
             return False
 
         source_id = SOURCE_MAP.get(source.lower(), source)
-        topic = get_topic(TOPIC_SET_SOURCE, self.client_id)
+        topic = self._topic(TOPIC_SET_SOURCE)
         return self._publish(topic, {"sourceid": source_id})
 
     # State
@@ -1094,21 +1512,16 @@ class VidaaTV:
         Returns:
             State dict or None if failed
         """
-        # Clear current state to detect fresh update
-        old_state = self._state
-
-        # Send request to trigger state broadcast
-        topic = get_topic(TOPIC_GET_STATE, self.client_id)
-        self._publish(topic, "")
+        # Cleared before publishing so an earlier broadcast can't satisfy
+        # the wait below
+        self._state_updated.clear()
 
-        # Wait for state to be updated via broadcast
-        start = time.time()
-        while time.time() - start < timeout:
-            if self._state and self._state != old_state:
-                return self._state
-            time.sleep(0.1)
+        # Send request to trigger state broadcast, then wait for it
+        topic = self._topic(TOPIC_GET_STATE)
+        if self._publish(topic, ""):
+            self._state_updated.wait(timeout)
 
-        # Return whatever state we have (might be stale)
+        # Return whatever state we have (stale if the TV didn't answer)
         return self._state
 
     # Device Info
@@ -1118,7 +1531,7 @@ class VidaaTV:
         Returns:
             Dict with: brand, chipplatform, deviceid, fake_sleep, uVersion, etc.
         """
-        topic = get_topic(TOPIC_GET_TV_INFO, self.client_id)
+        topic = self._topic(TOPIC_GET_TV_INFO)
         return self._request(topic, timeout=timeout)
 
     def get_device_info(self, timeout: float = 5.0) -> Optional[dict]:
@@ -1127,7 +1540,7 @@ class VidaaTV:
         Returns:
             Dict with: model_name, tv_name, tv_version, country, ip, etc.
         """
-        topic = get_topic(TOPIC_GET_DEVICE_INFO, self.client_id)
+        topic = self._topic(TOPIC_GET_DEVICE_INFO)
         return self._request(topic, timeout=timeout)
 
     def get_capability(self, timeout: float = 5.0) -> Optional[dict]:
@@ -1136,7 +1549,7 @@ class VidaaTV:
         Returns:
             Dict with: softwareVersion, devicemsg, resolution, etc.
         """
-        topic = get_topic(TOPIC_GET_CAPABILITY, self.client_id)
+        topic = self._topic(TOPIC_GET_CAPABILITY)
         return self._request(topic, timeout=timeout)
 
     # Apps
@@ -1146,33 +1559,17 @@ class VidaaTV:
         Returns:
             List of app dicts or None if failed
         """
-        # Use a dedicated response capture for apps since broadcast messages
-        # can interfere with the generic _request() method
-        apps_response = []
-        apps_received = threading.Event()
-
-        def on_apps_message(client, userdata, msg):
-            nonlocal apps_response
-            if "applist" in msg.topic:
-                try:
-                    apps_response = json.loads(msg.payload.decode())
-                    apps_received.set()
-                except json.JSONDecodeError:
-                    pass
-
-        # Temporarily add callback for app list
-        apps_topic = get_topic(TOPIC_APPS_RESPONSE, self.client_id)
-        self._client.message_callback_add(apps_topic, on_apps_message)
-
-        try:
-            topic = get_topic(TOPIC_GET_APPS, self.client_id)
-            self._publish(topic, "")
-
-            if apps_received.wait(timeout):
-                return apps_response if isinstance(apps_response, list) else None
+        # _on_message stores the app list in its own slot, since broadcast
+        # messages can interfere with the generic _request() method
+        self._apps_event.clear()
+        self._apps_payload = None
+        if not self._publish(self._topic(TOPIC_GET_APPS), ""):
             return None
-        finally:
-            self._client.message_callback_remove(apps_topic)
+
+        if self._apps_event.wait(timeout):
+            apps = self._apps_payload
+            return apps if isinstance(apps, list) else None
+        return None
 
     def launch_app(self, app_name: str, check_state: bool = False) -> bool:
         """Launch an app.
@@ -1186,35 +1583,37 @@ class VidaaTV:
             True if sent successfully
         """
         if check_state and not self._is_tv_on():
-            print("TV is off. Command not sent.")
+            _LOGGER.debug("TV is off. Command not sent.")
             return False
 
         # If passed a dict, use it directly
         if isinstance(app_name, dict):
             app_data = app_name
         # Check hardcoded common apps first (faster)
-        elif app_name.lower() in APPS:
-            app_data = APPS[app_name.lower()]
+        elif app_name.casefold() in APPS:
+            app_data = APPS[app_name.casefold()]
         else:
-            # Query TV for app list and find by name
-            app_list = self.get_apps()
-            if app_list:
-                for app in app_list:
-                    if app.get("name", "").upper() == app_name.upper():
-                        app_data = {
-                            "appId": app.get("appId"),
-                            "name": app.get("name"),
-                            "url": app.get("url")
-                        }
-                        break
-                else:
+            # Find by name in the TV's app list, fetching it unless a recent
+            # list already has the app
+            name = app_name.casefold()
+            app = None
+            if time.monotonic() - self._apps_time < self.APPS_MAX_AGE:
+                app = self._apps_by_name.get(name)
+            if app is None:
+                if not self.get_apps():
+                    _LOGGER.warning("Could not get app list. Try one of: netflix, youtube, amazon, disney, hulu")
+                    return False
+                app = self._apps_by_name.get(name)
+                if app is None:
                     _LOGGER.warning("App '%s' not found. Use get_apps() to see available apps.", app_name)
                     return False
-            else:
-                _LOGGER.warning("Could not get app list. Try one of: netflix, youtube, amazon, disney, hulu")
-                return False
+            app_data = {
+                "appId": app.get("appId"),
+                "name": app.get("name"),
+                "url": app.get("url")
+            }
 
-        topic = get_topic(TOPIC_LAUNCH_APP, self.client_id)
+        topic = self._topic(TOPIC_LAUNCH_APP)
         return self._publish(topic, app_data)
 
     @property
@@ -65,6 +65,7 @@ from .loader import (
     update_tv_config,
     add_tv,
     set_default_tv,
+    batch_config_updates,
     CONFIG_SEARCH_PATHS,
     # Backwards compatibility
     get_tv_ip,
@@ -129,6 +130,7 @@ __all__ = [
     "update_tv_config",
     "add_tv",
     "set_default_tv",
+    "batch_config_updates",
     "CONFIG_SEARCH_PATHS",
     "get_tv_ip",
     "get_tv_port",
@@ -1,16 +1,13 @@
 """Configuration loading with YAML support, env overrides, and migration."""
 
+import importlib.util
 import json
 import logging
 import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .schema import (
     DEFAULT_CONFIG,
@@ -20,6 +17,10 @@ from .schema import (
     get_device_id_by_alias,
 )
 
+# PyYAML is only imported when a config file is actually read or written, so
+# commands that never touch the config don't pay for it.
+HAS_YAML = importlib.util.find_spec("yaml") is not None
+
 _LOGGER = logging.getLogger(__name__)
 
 # Config search paths (in priority order)
@@ -64,6 +65,61 @@ ENV_MAPPINGS = {
 # Module-level cached config
 _cached_config: Optional[Dict] = None
 _cached_path: Optional[Path] = None
+_cached_mtime: Optional[int] = None
+
+# Parsed YAML keyed by (path, st_mtime_ns), so uncached loads of an unchanged
+# file skip the parse and only redo the merge and env overrides
+_parsed_files: Dict[Tuple[Path, int], Dict] = {}
+
+
+class _BatchState(threading.local):
+    """Per-thread batch_config_updates() nesting depth and deferred saves."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.pending: Dict[Path, Dict] = {}
+
+
+# Saves requested inside batch_config_updates(), written when it exits
+_batch = _BatchState()
+
+
+def _file_mtime(path: Optional[Path]) -> Optional[int]:
+    """Return the modification time of a config file, or None."""
+    if path is None:
+        return None
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _yaml_load(stream) -> Any:
+    """safe_load, using the LibYAML loader when PyYAML was built with it."""
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+def _yaml_dump(data: Any, stream) -> None:
+    """safe_dump, using the LibYAML dumper when PyYAML was built with it."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    yaml.dump(data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
+def _read_yaml(path: Path) -> Dict:
+    """Parse a YAML config file, reusing the result while its mtime holds."""
+    key = (path, path.stat().st_mtime_ns)
+    parsed = _parsed_files.get(key)
+    if parsed is None:
+        with open(path) as f:
+            parsed = _yaml_load(f) or {}
+        _parsed_files.clear()
+        _parsed_files[key] = parsed
+    return _deep_copy_config(parsed)
 
 
 def load_config(config_path: Optional[str] = None, use_cache: bool = True) -> Dict[str, Any]:
@@ -71,15 +127,16 @@ def load_config(config_path: Optional[str] = None, use_cache: bool = True) -> Di
 
     Args:
         config_path: Explicit path to config file, or None to search
-        use_cache: Use cached config if available
+        use_cache: Use cached config if available and the file is unchanged
 
     Returns:
         Merged configuration dictionary
     """
-    global _cached_config, _cached_path
+    global _cached_config, _cached_path, _cached_mtime
 
     if use_cache and _cached_config is not None:
-        return _cached_config
+        if _file_mtime(_cached_path) == _cached_mtime:
+            return _cached_config
 
     config = _deep_copy_config(DEFAULT_CONFIG)
     loaded_path = None
@@ -95,9 +152,7 @@ def load_config(config_path: Optional[str] = None, use_cache: bool = True) -> Di
         for path in search_paths:
             if path.suffix in ('.yaml', '.yml') and path.exists():
                 try:
-                    with open(path) as f:
-                        user_config = yaml.safe_load(f) or {}
-                    config = deep_merge(config, user_config)
+                    config = deep_merge(config, _read_yaml(path))
                     loaded_path = path
                     _LOGGER.info("Loaded config from %s", path)
                     break
@@ -117,18 +172,26 @@ def load_config(config_path: Optional[str] = None, use_cache: bool = True) -> Di
     # Cache the config
     _cached_config = config
     _cached_path = loaded_path
+    _cached_mtime = _file_mtime(loaded_path)
 
     return config
 
 
 def _deep_copy_config(config: Dict) -> Dict:
-    """Create a deep copy of the config dict."""
+    """Create a deep copy of the config dict.
+
+    Config values are only dicts, lists and scalars, so this plain walk is
+    several times faster than copy.deepcopy and its memo bookkeeping.
+    """
     result = {}
     for key, value in config.items():
         if isinstance(value, dict):
             result[key] = _deep_copy_config(value)
         elif isinstance(value, list):
-            result[key] = value.copy()
+            result[key] = [
+                _deep_copy_config(item) if isinstance(item, dict) else item
+                for item in value
+            ]
         else:
             result[key] = value
     return result
@@ -168,7 +231,7 @@ def _migrate_legacy_config(config: Dict) -> Dict:
             if legacy_path.exists():
                 try:
                     with open(legacy_path) as f:
-                        legacy = yaml.safe_load(f) or {}
+                        legacy = _yaml_load(f) or {}
 
                     # Migrate old single-TV format to new multi-TV format
                     if "tv" in legacy and "tvs" not in legacy:
@@ -241,7 +304,8 @@ def save_config(config: Dict, path: Optional[Path] = None) -> bool:
         path: Destination path, or None for current directory
 
     Returns:
-        True if saved successfully
+        True if saved successfully. Inside batch_config_updates() the write
+        is only queued; a failure then raises when the block exits.
     """
     if not HAS_YAML:
         _LOGGER.error("PyYAML not installed. Cannot save YAML config.")
@@ -250,20 +314,63 @@ def save_config(config: Dict, path: Optional[Path] = None) -> bool:
     if path is None:
         path = Path("config.yaml")
 
+    if _batch.depth:
+        _batch.pending[path] = config
+        return True
+
     # Remove internal metadata before saving
     save_data = {k: v for k, v in config.items() if not k.startswith("_")}
 
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, 'w') as f:
-            yaml.safe_dump(save_data, f, default_flow_style=False, sort_keys=False)
+            _yaml_dump(save_data, f)
         _LOGGER.info("Saved config to %s", path)
+        _note_saved(config, path)
         return True
     except Exception as e:
         _LOGGER.error("Failed to save config: %s", e)
         return False
 
 
+@contextmanager
+def batch_config_updates() -> Iterator[None]:
+    """Defer save_config until the block exits, then write each file once.
+
+    Batches are per thread; other threads keep saving immediately.
+
+    Example:
+        with batch_config_updates():
+            for device_id, host in discovered.items():
+                add_tv(device_id, host)
+
+    Raises:
+        OSError: If a deferred write fails
+    """
+    failed: List[Path] = []
+    _batch.depth += 1
+    try:
+        yield
+    finally:
+        _batch.depth -= 1
+        if not _batch.depth:
+            pending = list(_batch.pending.items())
+            _batch.pending.clear()
+            failed = [path for path, config in pending if not save_config(config, path)]
+    if failed:
+        raise OSError(f"Failed to save config: {', '.join(map(str, failed))}")
+
+
+def _note_saved(config: Dict, path: Path) -> None:
+    """Keep the cache valid after writing the cached config back to disk."""
+    global _cached_path, _cached_mtime
+    if config is not _cached_config:
+        return
+    if _cached_path is None or _cached_path.resolve() == path.resolve():
+        _cached_path = path
+        _cached_mtime = _file_mtime(path)
+
+
 def get_config(use_cache: bool = True) -> Dict:
     """Get current configuration (cached)."""
     return load_config(use_cache=use_cache)
@@ -271,9 +378,11 @@ def get_config(use_cache: bool = True) -> Dict:
 
 def reload_config() -> Dict:
     """Force reload configuration from disk."""
-    global _cached_config, _cached_path
+    global _cached_config, _cached_path, _cached_mtime
     _cached_config = None
     _cached_path = None
+    _cached_mtime = None
+    _parsed_files.clear()
     return load_config(use_cache=False)
 
 
@@ -292,7 +401,11 @@ def get_tv_config(tv_id: Optional[str] = None) -> Optional[Dict]:
     Returns:
         TV config dict if found, None otherwise
     """
-    config = get_config()
+    return _select_tv(get_config(), tv_id)
+
+
+def _select_tv(config: Dict, tv_id: Optional[str]) -> Optional[Dict]:
+    """Pick a TV out of config, or the default TV when tv_id is None."""
     tvs = config.get("tvs", {})
 
     if not tvs:
@@ -446,19 +559,21 @@ def get_tv_mac() -> Optional[str]:
     return tv.get("mac") if tv else None
 
 
+def _set_default_tv_field(field: str, value: str) -> bool:
+    """Set one field on the default TV and save the config."""
+    config = get_config()
+    tv = _select_tv(config, None)
+    if tv is None:
+        return False
+    tv[field] = value
+    return save_config(config)
+
+
 def set_tv_ip(ip: str) -> bool:
     """Set TV IP address (default TV)."""
-    tv = get_default_tv()
-    if tv:
-        tv["host"] = ip
-        return save_config(get_config())
-    return False
+    return _set_default_tv_field("host", ip)
 
 
 def set_tv_mac(mac: str) -> bool:
     """Set TV MAC address (default TV)."""
-    tv = get_default_tv()
-    if tv:
-        tv["mac"] = mac.upper().replace("-", ":")
-        return save_config(get_config())
-    return False
+    return _set_default_tv_field("mac", mac.upper().replace("-", ":"))
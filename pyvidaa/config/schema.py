@@ -117,12 +117,31 @@ def get_tv_by_id_or_alias(config: Dict, id_or_alias: str) -> Optional[Dict]:
     if id_or_alias in tvs:
         return tvs[id_or_alias]
 
-    # Search by alias
-    for device_id, tv_config in tvs.items():
-        if tv_config.get("alias") == id_or_alias:
-            return tv_config
+    device_id = get_device_id_by_alias(config, id_or_alias)
+    return tvs[device_id] if device_id is not None else None
+
+
+# id(tvs dict) -> (tvs dict, {alias: device_id}); kept off the config itself
+# so lookups never add keys to the caller's data
+_alias_indexes: Dict[int, tuple] = {}
+_ALIAS_INDEX_CACHE_SIZE = 8
 
-    return None
+
+def _alias_index(tvs: Dict, rebuild: bool = False) -> Dict[str, str]:
+    """Return the {alias: device_id} map for this tvs dict."""
+    entry = _alias_indexes.get(id(tvs))
+    if entry is not None and entry[0] is tvs and not rebuild:
+        return entry[1]
+
+    index = {}
+    for device_id, tv_config in tvs.items():
+        alias = tv_config.get("alias")
+        if alias is not None:
+            index.setdefault(alias, device_id)
+    if len(_alias_indexes) >= _ALIAS_INDEX_CACHE_SIZE:
+        _alias_indexes.clear()
+    _alias_indexes[id(tvs)] = (tvs, index)
+    return index
 
 
 def get_device_id_by_alias(config: Dict, alias: str) -> Optional[str]:
@@ -137,9 +156,14 @@ def get_device_id_by_alias(config: Dict, alias: str) -> Optional[str]:
     """
     tvs = config.get("tvs", {})
 
+    device_id = _alias_index(tvs).get(alias)
+    if device_id is not None and tvs.get(device_id, {}).get("alias") == alias:
+        return device_id
+
+    # Not indexed, or the TVs were edited since: only rebuild on a real match
     for device_id, tv_config in tvs.items():
         if tv_config.get("alias") == alias:
-            return device_id
+            return _alias_index(tvs, rebuild=True).get(alias)
 
     return None
 
@@ -159,4 +183,7 @@ def device_id_to_mac(device_id: str) -> str:
     if len(clean_id) != 12:
         return device_id  # Return as-is if not valid MAC length
 
-    return ":".join(clean_id[i:i+2] for i in range(0, 12, 2))
+    try:
+        return bytes.fromhex(clean_id).hex(":").upper()
+    except ValueError:
+        return ":".join(clean_id[i:i+2] for i in range(0, 12, 2))
@@ -8,7 +8,7 @@ import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .constants import DEFAULT_ACCESS_TOKEN_DAYS, DEFAULT_REFRESH_TOKEN_DAYS, DEFAULT_PORT
 
@@ -96,7 +96,10 @@ class TokenStorage:
             or None if no token stored or token expired.
         """
         key, token_data = self._find_token(device_id, host, port)
+        return self._usable_token(token_data)
 
+    def _usable_token(self, token_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Flag a found token as needing refresh, or drop it if both expired."""
         if token_data is None:
             return None
 
@@ -245,7 +248,27 @@ class TokenStorage:
                 - needs_reauth: bool - both tokens expired
         """
         key, token_data = self._find_token(device_id, host, port)
+        return self._token_status(token_data)
 
+    def get_token_and_status(
+        self,
+        device_id: Optional[str] = None,
+        host: Optional[str] = None,
+        port: int = DEFAULT_PORT,
+    ) -> Tuple[Optional[Dict[str, Any]], dict]:
+        """Get the stored token and its status from a single read.
+
+        Equivalent to calling get_token() and get_token_status(), but the
+        storage file is read and parsed once.
+
+        Returns:
+            Tuple of (token dict or None, status dict)
+        """
+        key, token_data = self._find_token(device_id, host, port)
+        return self._usable_token(token_data), self._token_status(token_data)
+
+    def _token_status(self, token_data: Optional[Dict[str, Any]]) -> dict:
+        """Build the get_token_status() dict for a found token (or None)."""
         if token_data is None:
             return {
                 "has_token": False,
@@ -259,8 +282,9 @@ class TokenStorage:
 
         now = time.time()
 
-        access_expires = token_data.get("access_token_expires_at", 0)
-        refresh_expires = token_data.get("refresh_token_expires_at", 0)
+        # Tokens saved without a refresh token store None for its expiry
+        access_expires = token_data.get("access_token_expires_at") or 0
+        refresh_expires = token_data.get("refresh_token_expires_at") or 0
 
         access_valid = not self._is_expired(access_expires)
         refresh_valid = not self._is_expired(refresh_expires)
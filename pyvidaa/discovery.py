@@ -120,30 +120,17 @@ def _parse_ssdp_headers(message: str) -> Dict[str, str]:
     return headers
 
 
-def discover_ssdp(
-    timeout: float = 5.0,
-    interface: Optional[str] = None,
-) -> Dict[str, DiscoveredTV]:
-    """Discover devices via SSDP M-SEARCH multicast query.
-
-    Sends an M-SEARCH request to the SSDP multicast address and
-    collects responses from devices on the network.
+def _open_msearch_socket(interface: Optional[str] = None) -> Optional[socket.socket]:
+    """Open a UDP socket set up for sending SSDP M-SEARCH queries.
 
     Args:
-        timeout: How long to wait for responses in seconds.
         interface: Interface IP to bind to (e.g., "10.0.0.50").
 
     Returns:
-        Dictionary mapping IP addresses to DiscoveredTV objects.
+        The bound socket, or None if it could not be bound.
     """
-    _LOGGER.debug("Starting SSDP M-SEARCH discovery (timeout=%s)", timeout)
-
-    found_devices: Dict[str, DiscoveredTV] = {}
-    local_ips = get_local_ips()
-
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
     sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.settimeout(1.0)
 
     # Bind to specific interface or any
     bind_ip = interface if interface else ""
@@ -152,7 +139,7 @@ def discover_ssdp(
     except OSError as e:
         _LOGGER.warning("Failed to bind socket: %s", e)
         sock.close()
-        return found_devices
+        return None
 
     # Set multicast TTL
     sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
@@ -164,6 +151,110 @@ def discover_ssdp(
             socket.IP_MULTICAST_IF,
             socket.inet_aton(interface),
         )
+    return sock
+
+
+def _parse_msearch_response(data: bytes, ip: str) -> Optional[DiscoveredTV]:
+    """Build a DiscoveredTV from an M-SEARCH response datagram.
+
+    Returns:
+        The device, or None if the datagram is not an HTTP response.
+    """
+    message = data.decode("utf-8", errors="ignore")
+
+    # Only process HTTP responses (not requests)
+    if not message.startswith("HTTP"):
+        return None
+
+    headers = _parse_ssdp_headers(message)
+    return DiscoveredTV(
+        ip=ip,
+        location=headers.get("LOCATION"),
+        usn=headers.get("USN"),
+        server=headers.get("SERVER"),
+        source="ssdp_msearch",
+        raw_data=headers,
+    )
+
+
+def _parse_udp_response(data: bytes, ip: str) -> DiscoveredTV:
+    """Build a DiscoveredTV from a UDP broadcast discovery reply."""
+    try:
+        response = json.loads(data.decode())
+        return DiscoveredTV(
+            ip=ip,
+            name=response.get(
+                "devicename",
+                response.get("name", response.get("device_name")),
+            ),
+            model=response.get("model", response.get("model_name")),
+            mac=response.get("mac", response.get("macaddress")),
+            source="udp",
+            raw_data=response,
+        )
+    except json.JSONDecodeError:
+        raw = data.decode() if data else ""
+        return DiscoveredTV(
+            ip=ip,
+            source="udp",
+            raw_data={"raw": raw},
+        )
+
+
+def _open_udp_socket(interface: Optional[str] = None) -> Optional[socket.socket]:
+    """Open a broadcast-capable UDP socket for Hisense discovery.
+
+    Binds to the discovery port if it is free, otherwise an ephemeral one.
+
+    Args:
+        interface: Interface IP to bind to (e.g., "10.0.0.50").
+
+    Returns:
+        The bound socket, or None if it could not be bound.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    bind_ip = interface if interface else ""
+
+    try:
+        sock.bind((bind_ip, DISCOVERY_PORT))
+    except OSError:
+        try:
+            sock.bind((bind_ip, 0))
+        except OSError as e:
+            _LOGGER.warning("Failed to bind socket: %s", e)
+            sock.close()
+            return None
+    return sock
+
+
+def discover_ssdp(
+    timeout: float = 5.0,
+    interface: Optional[str] = None,
+) -> Dict[str, DiscoveredTV]:
+    """Discover devices via SSDP M-SEARCH multicast query.
+
+    Sends an M-SEARCH request to the SSDP multicast address and
+    collects responses from devices on the network.
+
+    Args:
+        timeout: How long to wait for responses in seconds.
+        interface: Interface IP to bind to (e.g., "10.0.0.50").
+
+    Returns:
+        Dictionary mapping IP addresses to DiscoveredTV objects.
+    """
+    _LOGGER.debug("Starting SSDP M-SEARCH discovery (timeout=%s)", timeout)
+
+    found_devices: Dict[str, DiscoveredTV] = {}
+    local_ips = get_local_ips()
+
+    sock = _open_msearch_socket(interface)
+    if sock is None:
+        return found_devices
+    sock.settimeout(1.0)
 
     start_time = time.time()
 
@@ -182,26 +273,11 @@ def discover_ssdp(
             data, addr = sock.recvfrom(4096)
             ip = addr[0]
 
-            if ip in local_ips:
+            if ip in local_ips or ip in found_devices:
                 continue
 
-            message = data.decode("utf-8", errors="ignore")
-
-            # Only process HTTP responses (not requests)
-            if not message.startswith("HTTP"):
-                continue
-
-            headers = _parse_ssdp_headers(message)
-
-            if ip not in found_devices:
-                device = DiscoveredTV(
-                    ip=ip,
-                    location=headers.get("LOCATION"),
-                    usn=headers.get("USN"),
-                    server=headers.get("SERVER"),
-                    source="ssdp_msearch",
-                    raw_data=headers,
-                )
+            device = _parse_msearch_response(data, ip)
+            if device is not None:
                 found_devices[ip] = device
                 _LOGGER.info("Found device via SSDP M-SEARCH: %s", ip)
 
@@ -338,23 +414,11 @@ def discover_udp(
     found_devices: Dict[str, DiscoveredTV] = {}
     local_ips = get_local_ips()
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock = _open_udp_socket(interface)
+    if sock is None:
+        return found_devices
     sock.settimeout(1.0)
 
-    bind_ip = interface if interface else ""
-
-    try:
-        sock.bind((bind_ip, DISCOVERY_PORT))
-    except OSError:
-        try:
-            sock.bind((bind_ip, 0))
-        except OSError as e:
-            _LOGGER.warning("Failed to bind socket: %s", e)
-            sock.close()
-            return found_devices
-
     start_time = time.time()
 
     for i in range(retries):
@@ -376,28 +440,7 @@ def discover_udp(
                     continue
 
                 if ip not in found_devices:
-                    try:
-                        response = json.loads(data.decode())
-                        device = DiscoveredTV(
-                            ip=ip,
-                            name=response.get(
-                                "devicename",
-                                response.get("name", response.get("device_name")),
-                            ),
-                            model=response.get("model", response.get("model_name")),
-                            mac=response.get("mac", response.get("macaddress")),
-                            source="udp",
-                            raw_data=response,
-                        )
-                    except json.JSONDecodeError:
-                        raw = data.decode() if data else ""
-                        device = DiscoveredTV(
-                            ip=ip,
-                            source="udp",
-                            raw_data={"raw": raw},
-                        )
-
-                    found_devices[ip] = device
+                    found_devices[ip] = _parse_udp_response(data, ip)
                     _LOGGER.info("Found device via UDP broadcast: %s", ip)
 
             except socket.timeout:
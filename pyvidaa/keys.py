@@ -102,6 +102,9 @@ ALL_KEYS = [
     KEY_LEFT_MOUSE, KEY_UDD_LEFT_MOUSE, KEY_UDU_LEFT_MOUSE, KEY_ZOOM_IN, KEY_ZOOM_OUT,
 ]
 
+# Same keys as a set, for membership checks (ALL_KEYS keeps the order)
+ALL_KEYS_SET = frozenset(ALL_KEYS)
+
 # Key name mapping for CLI
 KEY_NAME_MAP = {
     "power": KEY_POWER,
@@ -185,7 +188,7 @@ def get_key(name: str) -> str:
 
     # Try with KEY_ prefix
     key_name = f"KEY_{name.upper()}"
-    if key_name in ALL_KEYS:
+    if key_name in ALL_KEYS_SET:
         return key_name
 
     # Return as-is if already a KEY_ constant
@@ -9,7 +9,6 @@ import re
 import time
 import urllib.request
 import urllib.error
-import xml.etree.ElementTree as ET
 from enum import Enum
 from typing import List, Optional
 
@@ -94,6 +93,9 @@ def _detect_protocol_port(
     if xml_content is None:
         return None
 
+    # Imported here so that importing AuthMethod doesn't load the XML parser
+    import xml.etree.ElementTree as ET
+
     try:
         # Parse XML and find transport_protocol
         root = ET.fromstring(xml_content)
@@ -0,0 +1,428 @@
+"""Tests for the asyncio wrapper around the pyvidaa client (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from pyvidaa.async_client import AsyncVidaaTV
+
+
+def _connected_tv():
+    tv = AsyncVidaaTV("10.0.0.50", enable_persistence=False, prewarm=False)
+    tv._client = MagicMock()
+    tv._client.is_connected = True
+    return tv
+
+
+async def test_publish_only_commands_skip_the_executor(monkeypatch):
+    tv = _connected_tv()
+    tv._client.up.return_value = True
+    tv._client.send_key.return_value = True
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("executor should not be used")
+
+    monkeypatch.setattr(tv, "_run_in_executor", fail)
+
+    assert await tv.async_up() is True
+    assert await tv.async_send_key("KEY_MENU") is True
+    tv._client.up.assert_called_once_with()
+    tv._client.send_key.assert_called_once_with("KEY_MENU")
+
+
+async def test_state_checked_commands_still_use_the_executor():
+    tv = _connected_tv()
+    tv._client.set_volume.return_value = False
+
+    assert await tv.async_set_volume(20, check_state=True) is False
+    tv._client.set_volume.assert_called_once_with(20, True)
+
+
+async def test_state_checked_presses_are_batched():
+    tv = _connected_tv()
+    tv._client.send_keys_each.return_value = [True, False, True, True, True]
+
+    results = await asyncio.gather(
+        *(tv.async_send_key("KEY_VOLUMEUP", check_state=True) for _ in range(5))
+    )
+
+    # One failed press doesn't fail the rest of its batch
+    assert results == [True, False, True, True, True]
+    tv._client.send_keys_each.assert_called_once_with(["KEY_VOLUMEUP"] * 5, True)
+
+
+async def test_lone_press_is_sent_without_waiting_and_later_presses_queue_behind_it(monkeypatch):
+    tv = _connected_tv()
+    calls = []
+    release = asyncio.Event()
+
+    async def send(method, keys, check_state):
+        calls.append(keys)
+        if len(calls) == 1:
+            await release.wait()
+        return [True] * len(keys)
+
+    monkeypatch.setattr(tv, "_call", send)
+    first = asyncio.ensure_future(tv.async_send_key("KEY_UP", check_state=True))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert calls == [["KEY_UP"]]
+
+    rest = [
+        asyncio.ensure_future(tv.async_send_key(key, check_state=True))
+        for key in ("KEY_DOWN", "KEY_OK")
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(first, *rest) == [True, True, True]
+    assert calls == [["KEY_UP"], ["KEY_DOWN", "KEY_OK"]]
+    assert tv._batch_task is None
+
+
+async def test_executor_errors_propagate_to_the_caller():
+    tv = _connected_tv()
+    tv._client.is_on.side_effect = RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await tv.async_is_on()
+
+
+async def test_each_tv_gets_its_own_worker_until_disconnect():
+    first = _connected_tv()
+    second = _connected_tv()
+    first._client.is_on.return_value = True
+    second._client.is_on.return_value = False
+
+    assert await first.async_is_on() is True
+    assert await second.async_is_on() is False
+    assert first._worker is not second._worker
+
+    client = first._client
+    await first.async_disconnect()
+    client.disconnect.assert_called_once_with()
+    assert first._worker is None
+
+    first._client = client
+    assert await first.async_is_on() is True
+
+
+async def test_workers_stop_on_sync_disconnect_and_collection():
+    import gc
+
+    kept = _connected_tv()
+    await kept._run_in_executor(int)
+    worker = kept._worker
+    kept.disconnect()
+    worker.join(1)
+    assert not worker.is_alive()
+
+    handles = [_connected_tv() for _ in range(10)]
+    for tv in handles:
+        await tv._run_in_executor(int)
+    workers = [tv._worker for tv in handles]
+    del handles, tv
+    gc.collect()
+    for worker in workers:
+        worker.join(1)
+    assert not any(worker.is_alive() for worker in workers)
+
+
+async def test_cancelled_key_batch_still_settles_its_callers(monkeypatch):
+    tv = _connected_tv()
+    in_flight = asyncio.Event()
+
+    async def hang(*args):
+        in_flight.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(tv, "_call", hang)
+    presses = [
+        asyncio.ensure_future(tv.async_send_key("KEY_VOLUMEUP", check_state=True))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    flush = tv._batch_task
+    await in_flight.wait()
+    flush.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*presses, return_exceptions=True), 1)
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+async def test_custom_executor_is_used_instead_of_the_worker():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tv = AsyncVidaaTV(
+            "10.0.0.50", enable_persistence=False, executor=executor, prewarm=False
+        )
+        tv._client = MagicMock()
+        tv._client.is_on.return_value = True
+
+        assert await tv.async_is_on() is True
+        assert tv._worker is None
+
+
+def test_async_module_defers_the_sync_client_import():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, pyvidaa.async_client\n"
+        "assert 'pyvidaa.client' not in sys.modules\n"
+        "assert 'pyvidaa.protocol' not in sys.modules\n"
+        "assert 'paho' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class _FakeClient:
+    """Stand-in sync client that records connects and disconnects."""
+
+    def __init__(self, **kwargs):
+        self.is_connected = False
+        self.connects = 0
+        self.disconnects = 0
+
+    def connect(self, **kwargs):
+        self.connects += 1
+        self.is_connected = True
+        return True
+
+    def disconnect(self):
+        self.disconnects += 1
+        self.is_connected = False
+
+
+async def test_handles_with_the_same_settings_share_one_client(monkeypatch):
+    import pyvidaa.client
+
+    monkeypatch.setattr(pyvidaa.client, "VidaaTV", _FakeClient)
+    first = AsyncVidaaTV("10.0.0.60", enable_persistence=False)
+    second = AsyncVidaaTV("10.0.0.60", enable_persistence=False)
+    other = AsyncVidaaTV("10.0.0.60", enable_persistence=False, brand="vidaa")
+
+    assert await first.async_connect() is True
+    assert await second.async_connect() is True
+    await other.async_connect()
+
+    client = first._client
+    assert second._client is client
+    assert other._client is not client
+    assert client.connects == 1
+
+    await first.async_disconnect()
+    assert client.is_connected
+    await second.async_disconnect()
+    assert client.disconnects == 1
+    await other.async_disconnect()
+
+
+async def test_concurrent_connects_on_a_shared_client_connect_once(monkeypatch):
+    import time
+
+    import pyvidaa.client
+
+    class SlowClient(_FakeClient):
+        def connect(self, **kwargs):
+            time.sleep(0.05)
+            return super().connect(**kwargs)
+
+    monkeypatch.setattr(pyvidaa.client, "VidaaTV", SlowClient)
+    first = AsyncVidaaTV("10.0.0.64", enable_persistence=False)
+    second = AsyncVidaaTV("10.0.0.64", enable_persistence=False)
+
+    assert await asyncio.gather(first.async_connect(), second.async_connect()) == [True, True]
+    assert first._client is second._client
+    assert first._client.connects == 1
+
+    await first.async_disconnect()
+    await second.async_disconnect()
+
+
+async def test_reset_evicts_the_pooled_client_and_dropped_handles_release_it(monkeypatch):
+    import gc
+
+    import pyvidaa.async_client
+    import pyvidaa.client
+
+    monkeypatch.setattr(pyvidaa.client, "VidaaTV", _FakeClient)
+    first = AsyncVidaaTV("10.0.0.63", enable_persistence=False)
+    second = AsyncVidaaTV("10.0.0.63", enable_persistence=False)
+    await first.async_connect()
+    await second.async_connect()
+    old = first._client
+
+    await first.async_reset()
+    await first.async_connect()
+    assert first._client is not old
+    assert old.is_connected
+
+    # Dropping the last holder without disconnecting still closes the session
+    del second
+    gc.collect()
+    assert old.disconnects == 1
+    await first.async_disconnect()
+    assert not any(key[0] == "10.0.0.63" for key in pyvidaa.async_client._CLIENT_POOL)
+
+
+def test_host_and_port_are_read_only():
+    tv = AsyncVidaaTV("10.0.0.65", port=1234, enable_persistence=False, prewarm=False)
+
+    assert (tv.host, tv.port) == ("10.0.0.65", 1234)
+    with pytest.raises(AttributeError):
+        tv.host = "10.0.0.66"
+    with pytest.raises(AttributeError):
+        tv.port = 4321
+
+
+async def test_handles_are_not_prewarmed_by_default(monkeypatch):
+    import pyvidaa.async_client
+    import pyvidaa.client
+
+    monkeypatch.setattr(pyvidaa.client, "VidaaTV", _FakeClient)
+    tv = AsyncVidaaTV("10.0.0.62", enable_persistence=False)
+
+    assert tv._prewarm is None
+    assert tv._worker is None
+    assert not any(key[0] == "10.0.0.62" for key in pyvidaa.async_client._CLIENT_POOL)
+
+
+async def test_client_is_prewarmed_inside_a_running_loop(monkeypatch):
+    import pyvidaa.client
+
+    monkeypatch.setattr(pyvidaa.client, "VidaaTV", _FakeClient)
+    tv = AsyncVidaaTV("10.0.0.61", enable_persistence=False, prewarm=True)
+
+    await tv._prewarm
+    assert isinstance(tv._client, _FakeClient)
+    assert await tv.async_connect() is True
+    assert tv._prewarm is None
+    await tv.async_disconnect()
+
+
+async def test_queries_await_the_reply_without_a_worker(monkeypatch):
+    tv = _connected_tv()
+    replies = {}
+
+    def request_nowait(topic_template, callback):
+        replies[topic_template] = callback
+        return True
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("executor should not be used")
+
+    tv._client.request_nowait.side_effect = request_nowait
+    tv._client.parse_volume.side_effect = lambda response: response["volume_value"]
+    monkeypatch.setattr(tv, "_run_in_executor", fail)
+    monkeypatch.setattr(tv, "_call", fail)
+
+    pending = asyncio.ensure_future(tv.async_get_volume())
+    await asyncio.sleep(0)
+    (callback,) = replies.values()
+    callback({"volume_type": 0, "volume_value": 17})
+
+    assert await pending == 17
+    tv._client.cancel_request.assert_called_once_with(callback)
+    assert await tv.async_get_tv_info(timeout=0.01) is None
+
+
+async def test_pairing_awaits_the_token_without_a_worker(monkeypatch):
+    tv = _connected_tv()
+    started = []
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("executor should not be used")
+
+    tv._client.authenticate_nowait.side_effect = lambda pin, callback: started.append(callback) or True
+    monkeypatch.setattr(tv, "_run_in_executor", fail)
+
+    pending = asyncio.ensure_future(tv.async_authenticate("1234"))
+    await asyncio.sleep(0)
+    (callback,) = started
+    callback(True)
+
+    assert await pending is True
+    tv._client.cancel_token_wait.assert_called_once_with(callback)
+    tv._client.refresh_token_nowait.return_value = True
+    assert await tv.async_refresh_token(timeout=0.01) is False
+
+
+async def test_concurrent_queries_pipeline_without_a_worker(monkeypatch):
+    from pyvidaa.client import VidaaTV
+
+    tv = AsyncVidaaTV("10.0.0.50", enable_persistence=False, prewarm=False)
+    client = VidaaTV("10.0.0.50", use_ssl=False, enable_persistence=False)
+    client._connected = True
+    client._publish = lambda topic, payload="": True
+    tv._client = client
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("executor should not be used")
+
+    monkeypatch.setattr(tv, "_run_in_executor", fail)
+    monkeypatch.setattr(tv, "_call", fail)
+
+    pending = asyncio.ensure_future(asyncio.gather(
+        tv.async_get_apps(), tv.async_get_tv_info(), tv.async_get_state()
+    ))
+    await asyncio.sleep(0)
+    # Replies arrive out of order; each goes to the request it answers
+    for topic, payload in (
+        (f"/remoteapp/mobile/{client.client_id}/platform_service/data/gettvinfo", b'{"brand": "his"}'),
+        ("/remoteapp/mobile/broadcast/ui_service/state", b'{"statetype": "remote_launcher"}'),
+        (f"/remoteapp/mobile/{client.client_id}/ui_service/data/applist", b'[{"name": "Netflix"}]'),
+    ):
+        client._on_message(None, None, MagicMock(topic=topic, payload=payload))
+
+    apps, info, state = await asyncio.wait_for(pending, 1)
+    assert apps == [{"name": "Netflix"}]
+    assert info == {"brand": "his"}
+    assert state == {"statetype": "remote_launcher"}
+    assert client._response_waiters == []
+
+
+async def test_probe_subnet_keeps_only_answering_addresses(monkeypatch):
+    import pyvidaa.discovery
+    from pyvidaa.async_client import async_probe_subnet
+
+    monkeypatch.setattr(
+        pyvidaa.discovery, "probe_ip",
+        lambda ip, port, timeout: f"tv@{ip}" if ip.endswith(".7") else None,
+    )
+    ips = [f"10.0.0.{n}" for n in range(1, 20)]
+
+    assert await async_probe_subnet(ips, timeout=0.1) == {"10.0.0.7": "tv@10.0.0.7"}
+
+
+async def test_ssdp_discovery_collects_replies_on_the_loop(monkeypatch):
+    import pyvidaa.config
+    import pyvidaa.discovery
+    from pyvidaa.async_client import async_discover_ssdp
+
+    class Responder(asyncio.DatagramProtocol):
+        def connection_made(self, transport):
+            self.transport = transport
+
+        def datagram_received(self, data, addr):
+            assert data.startswith(b"M-SEARCH")
+            self.transport.sendto(b"HTTP/1.1 200 OK\r\nLOCATION: http://tv/desc.xml\r\n\r\n", addr)
+
+    loop = asyncio.get_running_loop()
+    responder, _ = await loop.create_datagram_endpoint(Responder, local_addr=("127.0.0.1", 0))
+    monkeypatch.setattr(pyvidaa.config, "SSDP_ADDR", "127.0.0.1")
+    monkeypatch.setattr(pyvidaa.config, "SSDP_PORT", responder.get_extra_info("sockname")[1])
+    monkeypatch.setattr(pyvidaa.discovery, "get_local_ips", set)
+
+    try:
+        found = await async_discover_ssdp(timeout=0.2)
+    finally:
+        responder.close()
+
+    assert list(found) == ["127.0.0.1"]
+    assert found["127.0.0.1"].location == "http://tv/desc.xml"
+    assert found["127.0.0.1"].source == "ssdp_msearch"
@@ -22,6 +22,7 @@ from pyvidaa.protocol import (
     get_auth_method,
     get_auth_method_order,
 )
+from pyvidaa.topics import TOPIC_GET_VOLUME
 
 
 # --- credentials -----------------------------------------------------------
@@ -213,6 +214,239 @@ def test_on_message_tolerates_non_dict_payload(raw):
     assert client._response_event.is_set()
 
 
+@pytest.mark.parametrize("topic, handler", [
+    ("/remoteapp/mobile/{client}/platform_service/data/tokenissuance", "_handle_token_response"),
+    ("/remoteapp/mobile/{client}/ui_service/data/authentication", "_handle_auth_response"),
+    ("/remoteapp/mobile/{client}/ui_service/data/authenticationcode", "_handle_auth_response"),
+    ("/remoteapp/mobile/{client}/ui_service/data/capability", None),
+])
+def test_on_message_routes_on_the_topic_suffix(topic, handler):
+    client = _make_client()
+    for name in ("_handle_token_response", "_handle_auth_response"):
+        setattr(client, name, MagicMock())
+    msg = MagicMock()
+    msg.topic = topic.format(client=client.client_id)
+    msg.payload = b'{"result": 1}'
+
+    client._on_message(None, None, msg)
+
+    for name in ("_handle_token_response", "_handle_auth_response"):
+        assert getattr(client, name).called == (name == handler)
+    assert client._last_response == {"result": 1}
+
+    msg.topic = "/remoteapp/mobile/broadcast/ui_service/state"
+    msg.payload = b'{"statetype": "sourceswitch"}'
+    client._on_message(None, None, msg)
+    assert client.state == {"statetype": "sourceswitch"}
+
+
+def test_on_message_keeps_undecodable_payloads_as_raw_text():
+    client = _make_client()
+    msg = MagicMock()
+    msg.topic = "/remoteapp/mobile/broadcast/ui_service/state"
+    msg.payload = b"\xff\xfe not json"
+
+    client._on_message(None, None, msg)
+
+    assert client._last_response == {"raw": "\ufffd\ufffd not json"}
+
+
+def test_stdlib_json_fallback_encodes_like_orjson():
+    orjson = pytest.importorskip("orjson")
+    from pyvidaa.client import _json_dumps_stdlib
+
+    payload = {"name": "Wohnzimmer \u00e9", "volume": 12, "apps": [{"id": "a", "ok": True}], "x": None}
+
+    assert _json_dumps_stdlib(payload) == orjson.dumps(payload)
+
+
+def test_request_nowait_hands_the_next_response_to_the_callback():
+    client = _make_client()
+    client._connected = True
+    client._publish = lambda topic, payload="": True
+    received = []
+
+    assert client.request_nowait(TOPIC_GET_VOLUME, received.append)
+    msg = MagicMock()
+    msg.topic = "/remoteapp/mobile/broadcast/platform_service/actions/volumechange"
+    msg.payload = b'{"volume_type": 0, "volume_value": 12}'
+    client._on_message(None, None, msg)
+    client._on_message(None, None, msg)
+
+    assert received == [{"volume_type": 0, "volume_value": 12}]
+    assert client.parse_volume(received[0]) == 12
+
+
+def test_concurrent_requests_each_get_their_own_reply():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = _make_client()
+
+    def fake_publish(topic, payload=""):
+        # The TV answers shortly after, on another thread
+        threading.Timer(0.02, client._set_response, ({"topic": topic},)).start()
+        return True
+
+    client._publish = fake_publish
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        replies = list(pool.map(lambda topic: client._request(topic, timeout=2), "abcd"))
+
+    assert replies == [{"topic": topic} for topic in "abcd"]
+
+
+def test_get_state_returns_as_soon_as_the_broadcast_arrives():
+    import threading
+    import time
+
+    client = _make_client()
+    client._state = {"statetype": "sourceswitch"}
+    msg = MagicMock()
+    msg.topic = "/remoteapp/mobile/broadcast/ui_service/state"
+    msg.payload = b'{"statetype": "sourceswitch"}'
+
+    def fake_publish(topic, payload=""):
+        threading.Timer(0.01, client._on_message, (None, None, msg)).start()
+        return True
+
+    client._publish = fake_publish
+    start = time.monotonic()
+    # An unchanged state still counts as the answer
+    assert client.get_state(timeout=5) == {"statetype": "sourceswitch"}
+    assert time.monotonic() - start < 1
+
+
+def test_state_checked_keys_reuse_a_fresh_state_broadcast():
+    import time
+
+    client = _make_client()
+    published = []
+    client._publish_raw = lambda topic, payload: published.append(payload) or True
+    client.get_state = MagicMock(return_value={"statetype": "sourceswitch"})
+    client._state = {"statetype": "sourceswitch"}
+    client._state_time = time.monotonic()
+
+    assert client.send_key("KEY_UP", check_state=True)
+    assert client.send_key("KEY_DOWN", check_state=True)
+    client.get_state.assert_not_called()
+
+    # A power press makes the cached state meaningless
+    assert client.power()
+    assert client.power_on()
+    client.get_state.assert_called_once()
+
+    client._state_time -= client.STATE_MAX_AGE
+    assert client.send_key("KEY_UP", check_state=True)
+    assert client.get_state.call_count == 2
+    assert published == ["KEY_UP", "KEY_DOWN", "KEY_POWER", "KEY_UP"]
+
+
+def test_get_apps_reads_the_reply_without_a_per_call_callback():
+    import threading
+
+    client = _make_client()
+    client._client = MagicMock()
+    apps = MagicMock()
+    apps.topic = f"/remoteapp/mobile/{client.client_id}/ui_service/data/applist"
+    apps.payload = b'[{"name": "Netflix"}]'
+    state = MagicMock()
+    state.topic = "/remoteapp/mobile/broadcast/ui_service/state"
+    state.payload = b'{"statetype": "remote_launcher"}'
+
+    def fake_publish(topic, payload=""):
+        # A broadcast lands first and must not be mistaken for the reply
+        client._on_message(None, None, state)
+        threading.Timer(0.01, client._on_message, (None, None, apps)).start()
+        return True
+
+    client._publish = fake_publish
+
+    assert client.get_apps(timeout=2) == [{"name": "Netflix"}]
+    client._client.message_callback_add.assert_not_called()
+
+
+def test_launch_app_reuses_the_fetched_app_list():
+    client = _make_client()
+    apps = MagicMock()
+    apps.topic = f"/remoteapp/mobile/{client.client_id}/ui_service/data/applist"
+    apps.payload = b'[{"name": "Prime Video", "appId": "7", "url": "pv"}]'
+    published = []
+
+    def fake_publish(topic, payload=""):
+        published.append(topic.rsplit("/", 1)[-1])
+        if topic.endswith("/applist"):
+            client._on_message(None, None, apps)
+        return True
+
+    client._publish = fake_publish
+
+    assert client.launch_app("Prime Video")
+    assert client.launch_app("PRIME VIDEO")
+    assert not client.launch_app("Kodi")
+    assert published == ["applist", "launchapp", "launchapp", "applist"]
+
+
+def test_state_checked_commands_to_an_off_tv_stay_quiet(capsys):
+    client = _make_client()
+    client._publish = MagicMock(return_value=True)
+    client._publish_raw = MagicMock(return_value=True)
+    client._recent_state = MagicMock(return_value={"statetype": "fake_sleep_0"})
+
+    assert client.set_volume(10, check_state=True) is False
+    assert client.set_source("hdmi1", check_state=True) is False
+    assert client.launch_app("netflix", check_state=True) is False
+
+    assert capsys.readouterr().out == ""
+    client._publish.assert_not_called()
+    client._publish_raw.assert_not_called()
+
+
+def test_volume_steps_are_published_back_to_back():
+    client = _make_client()
+    published = []
+    client._publish_raw = lambda topic, payload: published.append(payload) or True
+
+    assert client.volume_up(count=3)
+    assert client.volume_down()
+
+    assert published == ["KEY_VOLUMEUP"] * 3 + ["KEY_VOLUMEDOWN"]
+
+
+def test_navigation_repeats_and_paces_key_presses(monkeypatch):
+    import pyvidaa.client
+
+    client = _make_client()
+    published = []
+    sleeps = []
+    client._publish_raw = lambda topic, payload: published.append(payload) or True
+    monkeypatch.setattr(pyvidaa.client.time, "sleep", sleeps.append)
+
+    assert client.down(count=3)
+    assert sleeps == []
+    assert client.send_keys(["KEY_RIGHT", "KEY_RIGHT", "KEY_OK"], interval=0.1)
+
+    assert published == ["KEY_DOWN"] * 3 + ["KEY_RIGHT", "KEY_RIGHT", "KEY_OK"]
+    assert sleeps == [0.1, 0.1]
+
+
+def test_flush_publishes_waits_on_the_last_publish():
+    client = _make_client()
+    assert client.flush_publishes() is True
+
+    client._connected = True
+    client._client = MagicMock()
+    info = MagicMock(rc=0)
+    info.is_published.return_value = True
+    client._client.publish.return_value = info
+
+    assert client.send_key("KEY_OK")
+    assert client.flush_publishes(timeout=0.5) is True
+    info.wait_for_publish.assert_called_once_with(0.5)
+
+    info.wait_for_publish.side_effect = RuntimeError("publish failed")
+    assert client.flush_publishes() is False
+
+
 def test_handle_auth_response_ignores_non_dict():
     client = _make_client()
     client._handle_auth_response("not a dict")  # must not raise
@@ -263,6 +497,25 @@ def test_authenticate_returns_true_only_after_token_received():
     assert client._access_token == "ACCESS"
 
 
+def test_authenticate_nowait_requests_token_from_the_auth_reply():
+    client = _make_client()
+    client._connected = True
+    published = []
+    outcomes = []
+    client._publish = lambda topic, payload="": published.append(payload) or True
+
+    assert client.authenticate_nowait("1234", outcomes.append) is True
+    assert published == [{"authNum": 1234}]
+
+    client._handle_auth_response({"result": 1})
+    assert {"refreshtoken": ""} in published
+    assert outcomes == []
+
+    client._handle_token_response({"accesstoken": "ACCESS", "refreshtoken": "REFRESH"})
+    assert outcomes == [True]
+    assert client._token_waiters == []
+
+
 def test_handle_token_response_persists_and_is_retrievable(tmp_path):
     """The saved token must be written with the right key so the CLI can find it.
 
@@ -284,6 +537,8 @@ def test_handle_token_response_persists_and_is_retrievable(tmp_path):
         "accesstoken_duration_day": 7,
         "refreshtoken_duration_day": 30,
     })
+    # The write happens off the MQTT thread; the event fires once it's done
+    assert client._token_event.wait(5)
 
     # Retrievable both by the host:port the CLI uses and verifiably persisted.
     saved = storage.get_token(host="10.0.0.50", port=36669)
@@ -315,6 +570,99 @@ def test_get_token_requires_keyword_host_port(tmp_path):
     assert storage.get_token("10.0.0.50", 36669) is None
 
 
+def test_get_token_and_status_reads_storage_once(tmp_path, monkeypatch):
+    storage = TokenStorage(tmp_path / "tokens.json")
+    storage.save_token(device_id="10.0.0.50:36669", host="10.0.0.50", port=36669, access_token="ACCESS")
+    reads = []
+    load_all = storage._load_all
+    monkeypatch.setattr(storage, "_load_all", lambda: reads.append(1) or load_all())
+
+    token, status = storage.get_token_and_status(host="10.0.0.50", port=36669)
+
+    assert reads == [1]
+    assert token["access_token"] == "ACCESS"
+    assert status == storage.get_token_status(host="10.0.0.50", port=36669)
+    # No refresh token was saved, so its expiry is None
+    assert status["refresh_expires_in"] == 0
+
+
+def test_saved_credentials_are_read_once_until_the_token_changes(tmp_path, monkeypatch):
+    storage = TokenStorage(tmp_path / "tokens.json")
+    storage.save_token(
+        device_id="10.0.0.50:36669", host="10.0.0.50", port=36669,
+        access_token="ACCESS", refresh_token="REFRESH",
+        client_id="client", mqtt_username="user",
+    )
+    client = VidaaTV(host="10.0.0.50", port=36669, use_ssl=False, storage=storage)
+    assert client._access_token == "ACCESS"
+
+    reads = []
+    lookup = storage.get_token_and_status
+    monkeypatch.setattr(
+        storage, "get_token_and_status", lambda **kw: reads.append(1) or lookup(**kw)
+    )
+    assert client._load_saved_token() is True
+    assert reads == []
+
+    client._handle_token_response({"accesstoken": "NEW", "refreshtoken": "REFRESH"})
+    assert client._token_event.wait(5)
+    assert client._get_saved_credentials()["access_token"] == "NEW"
+    assert reads == [1]
+
+
+def test_unusable_saved_credentials_are_not_cached(tmp_path, monkeypatch):
+    storage = TokenStorage(tmp_path / "tokens.json")
+    storage.save_token(
+        device_id="10.0.0.50:36669", host="10.0.0.50", port=36669,
+        access_token="OLD", refresh_token="REFRESH",
+        access_token_duration_days=0,
+        client_id="client", mqtt_username="user",
+    )
+    client = VidaaTV(host="10.0.0.50", port=36669, use_ssl=False, storage=storage)
+    assert client._get_saved_credentials()["needs_refresh"] is True
+    assert client._cached_creds is None
+
+    # Another process re-pairs; the next lookup sees it
+    storage.save_token(
+        device_id="10.0.0.50:36669", host="10.0.0.50", port=36669,
+        access_token="NEW", refresh_token="REFRESH",
+        client_id="client", mqtt_username="user",
+    )
+    assert client._get_saved_credentials()["access_token"] == "NEW"
+
+    # Usable credentials are cached, but only for CREDS_MAX_AGE
+    monkeypatch.setattr(VidaaTV, "CREDS_MAX_AGE", 0.0)
+    client._forget_saved_credentials()
+    client._get_saved_credentials()
+    assert client._cached_creds is None
+
+
+def test_token_is_saved_off_the_mqtt_thread(tmp_path, monkeypatch):
+    import threading
+
+    storage = TokenStorage(tmp_path / "tokens.json")
+    client = VidaaTV(host="10.0.0.50", port=36669, use_ssl=False, storage=storage)
+    writers = []
+    save_token = storage.save_token
+    release = threading.Event()
+
+    def slow_save(**token):
+        writers.append(threading.current_thread())
+        release.wait(5)
+        save_token(**token)
+
+    monkeypatch.setattr(storage, "save_token", slow_save)
+    client._handle_token_response({"accesstoken": "ACCESS", "refreshtoken": "REFRESH"})
+
+    # The callback returned before the write finished, and nobody was told yet
+    assert client._access_token == "ACCESS"
+    assert not client._token_event.is_set()
+    release.set()
+    assert client._token_event.wait(5)
+    assert writers[0] is not threading.current_thread()
+    assert storage.get_token(host="10.0.0.50", port=36669)["access_token"] == "ACCESS"
+
+
 def test_bundled_remote_ca_is_loadable_public_cert():
     """The shipped RemoteCA must exist and be a usable CA cert (no private key)."""
     import ssl
@@ -340,7 +688,7 @@ def test_server_verify_args_opt_in(monkeypatch):
     from pyvidaa.certs import bundled_ca_path
 
     # Avoid any real network/protocol detection during construction.
-    monkeypatch.setattr("pyvidaa.client.detect_protocol", lambda *a, **k: None)
+    monkeypatch.setattr("pyvidaa.protocol.detect_protocol", lambda *a, **k: None)
 
     off = VidaaTV("10.0.0.50", use_ssl=False, enable_persistence=False, verify_ssl=False)
     assert off._server_verify_args() == (None, ssl.CERT_NONE)
@@ -383,3 +731,384 @@ def test_cli_quiet_excepthook_handles_cert_required(monkeypatch, capsys):
 
     cli._quiet_mqtt_thread_excepthook(OtherArgs())
     assert len(seen) == 1
+
+
+def test_package_import_is_lazy():
+    """Importing pyvidaa (or one of its constants) must not load the client."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, pyvidaa\n"
+        "assert pyvidaa.DEFAULT_PORT == 36669\n"
+        "assert 'pyvidaa.client' not in sys.modules\n"
+        "assert 'paho' not in sys.modules\n"
+        "assert pyvidaa.VidaaTV is pyvidaa.client.VidaaTV\n"
+        # Only dynamic auth needs the credential generator and XML parser
+        "assert 'pyvidaa.credentials' not in sys.modules\n"
+        "assert 'xml.etree.ElementTree' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_package_still_exposes_its_submodules():
+    """Submodules bound by the old eager imports stay reachable as attributes."""
+    import subprocess
+    import sys
+
+    code = (
+        "import types, pyvidaa\n"
+        "for name in ('async_client', 'certs', 'client', 'config', 'credentials',\n"
+        "             'discovery', 'keys', 'protocol', 'topics'):\n"
+        "    assert isinstance(getattr(pyvidaa, name), types.ModuleType), name\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_cli_sniffs_the_subcommand_and_skips_heavy_imports():
+    import subprocess
+    import sys
+
+    from pyvidaa.cli import _sniff_command
+
+    assert _sniff_command(["--ip", "10.0.0.5", "vol", "up"]) == "vol"
+    assert _sniff_command(["--tv=bedroom", "keys"]) == "keys"
+    assert _sniff_command(["--help", "power"]) is None
+    assert _sniff_command(["bogus"]) is None
+
+    heavy = ("paho", "ssl", "yaml", "pyvidaa.client", "pyvidaa.discovery", "pyvidaa.wol")
+    for argv in (["tv", "keys"], ["tv", "--help"]):
+        code = (
+            "import sys\n"
+            "from pyvidaa import cli\n"
+            f"sys.argv = {argv!r}\n"
+            "try:\n"
+            "    assert cli.main() == 0\n"
+            "except SystemExit as exc:\n"
+            "    assert exc.code == 0\n"
+            f"loaded = [m for m in {heavy!r} if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+
+def test_config_cache_follows_the_file_mtime(tmp_path, monkeypatch):
+    import os
+
+    from pyvidaa.config import loader
+
+    path = tmp_path / "config.yaml"
+    path.write_text("tvs:\n  tv1:\n    host: 10.0.0.1\n")
+    monkeypatch.setattr(loader, "CONFIG_SEARCH_PATHS", [])
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(loader, "_cached_config", None)
+    monkeypatch.setattr(loader, "_cached_path", None)
+    monkeypatch.setattr(loader, "_cached_mtime", None)
+
+    config = loader.load_config(str(path))
+    assert loader.load_config() is config
+
+    # Our own writes keep the cache warm
+    assert loader.add_tv("tv2", "10.0.0.2")
+    assert loader.load_config() is config
+
+    path.write_text("tvs:\n  tv3:\n    host: 10.0.0.3\n")
+    os.utime(path, ns=(0, 0))
+    assert list(loader.load_config(str(path))["tvs"]) == ["tv3"]
+
+
+def test_uncached_loads_skip_the_parse_of_an_unchanged_file(tmp_path, monkeypatch):
+    from pyvidaa.config import loader
+
+    path = tmp_path / "config.yaml"
+    path.write_text("mqtt:\n  host: broker.local\n")
+    monkeypatch.setattr(loader, "CONFIG_SEARCH_PATHS", [path])
+    monkeypatch.setattr(loader, "_parsed_files", {})
+    monkeypatch.setattr(loader, "_cached_config", None)
+    monkeypatch.setattr(loader, "_cached_path", None)
+    monkeypatch.setattr(loader, "_cached_mtime", None)
+    parses = []
+    real_load = loader._yaml_load
+    monkeypatch.setattr(loader, "_yaml_load", lambda f: parses.append(f) or real_load(f))
+
+    first = loader.get_config(use_cache=False)
+    monkeypatch.setenv("MQTT_PORT", "1884")
+    second = loader.get_config(use_cache=False)
+
+    assert len(parses) == 1
+    assert second is not first
+    assert second["mqtt"]["host"] == "broker.local"
+    assert second["mqtt"]["port"] == 1884
+    loader.reload_config()
+    assert len(parses) == 2
+
+
+def test_batched_config_updates_write_the_file_once(tmp_path, monkeypatch):
+    from pyvidaa.config import loader
+
+    path = tmp_path / "config.yaml"
+    path.write_text("tvs: {}\n")
+    monkeypatch.setattr(loader, "CONFIG_SEARCH_PATHS", [path])
+    monkeypatch.setattr(loader, "_cached_config", None)
+    monkeypatch.setattr(loader, "_cached_path", None)
+    monkeypatch.setattr(loader, "_cached_mtime", None)
+    monkeypatch.chdir(tmp_path)
+    dumps = []
+    real_dump = loader._yaml_dump
+    monkeypatch.setattr(loader, "_yaml_dump", lambda data, f: dumps.append(data) or real_dump(data, f))
+
+    with loader.batch_config_updates():
+        for n in range(1, 4):
+            assert loader.add_tv(f"tv{n}", f"10.0.0.{n}")
+        assert loader.set_default_tv("tv2")
+        assert dumps == []
+
+    assert len(dumps) == 1
+    config = loader.reload_config()
+    assert list(config["tvs"]) == ["tv1", "tv2", "tv3"]
+    assert config["default_tv"] == "tv2"
+
+
+def test_batched_config_updates_raise_when_a_deferred_write_fails(tmp_path):
+    import threading
+
+    from pyvidaa.config import loader
+
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    bad_path = blocker / "config.yaml"
+    good_path = tmp_path / "other.yaml"
+
+    with pytest.raises(OSError, match="not_a_dir"):
+        with loader.batch_config_updates():
+            assert loader.save_config({"tvs": {}}, bad_path)
+            # Another thread's saves are not swept into this batch
+            worker = threading.Thread(target=loader.save_config, args=({"tvs": {}}, good_path))
+            worker.start()
+            worker.join()
+            assert good_path.exists()
+
+
+def test_alias_lookups_use_an_index_that_follows_edits():
+    from pyvidaa.config.schema import get_device_id_by_alias, get_tv_by_id_or_alias
+
+    config = {"tvs": {
+        "tv1": {"host": "10.0.0.1", "alias": "living"},
+        "tv2": {"host": "10.0.0.2", "alias": "bedroom"},
+    }}
+
+    assert get_device_id_by_alias(config, "bedroom") == "tv2"
+    assert list(config) == ["tvs"]
+    assert get_tv_by_id_or_alias(config, "living")["host"] == "10.0.0.1"
+
+    config["tvs"]["tv2"]["alias"] = "office"
+    config["tvs"]["tv3"] = {"host": "10.0.0.3", "alias": "bedroom"}
+    assert get_device_id_by_alias(config, "bedroom") == "tv3"
+    assert get_tv_by_id_or_alias(config, "office")["host"] == "10.0.0.2"
+    assert get_device_id_by_alias(config, "kitchen") is None
+
+
+def test_config_copies_do_not_share_nested_list_entries():
+    from pyvidaa.config.loader import _deep_copy_config
+
+    original = {"mqtt": {"host": "broker"}, "sources": [{"name": "HDMI1"}, "TV"]}
+    copied = _deep_copy_config(original)
+    copied["mqtt"]["host"] = "other"
+    copied["sources"][0]["name"] = "Game"
+
+    assert original == {"mqtt": {"host": "broker"}, "sources": [{"name": "HDMI1"}, "TV"]}
+
+
+def _self_signed_pair(tmp_path):
+    import subprocess
+
+    cert, key = tmp_path / "client.crt", tmp_path / "client.key"
+    try:
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+             "-subj", "/CN=test", "-keyout", str(key), "-out", str(cert)],
+            check=True, capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        pytest.skip("openssl not available")
+    return str(cert), str(key)
+
+
+def test_client_tls_context_is_built_once_per_cert_pair(tmp_path):
+    import ssl
+
+    from pyvidaa.certs import client_tls_context
+
+    cert, key = _self_signed_pair(tmp_path)
+
+    context = client_tls_context(cert, key)
+    assert client_tls_context(cert, key) is context
+    assert context.verify_mode == ssl.CERT_NONE
+    assert not context.check_hostname
+
+
+def test_tls_sessions_are_resumed_on_reconnect(tmp_path):
+    import socket
+    import ssl
+    import threading
+
+    from pyvidaa.certs import _resuming_context_class, remember_tls_session
+
+    cert, key = _self_signed_pair(tmp_path)
+    server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_ctx.load_cert_chain(cert, key)
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def serve():
+        for _ in range(2):
+            conn, _addr = listener.accept()
+            with server_ctx.wrap_socket(conn, server_side=True) as tls:
+                tls.sendall(b"ok")
+                tls.recv(1)
+
+    server = threading.Thread(target=serve, daemon=True)
+    server.start()
+
+    context = _resuming_context_class()(ssl.PROTOCOL_TLS_CLIENT)
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    reused = []
+    try:
+        for _ in range(2):
+            raw = socket.create_connection(("127.0.0.1", port), timeout=5)
+            with context.wrap_socket(raw, server_hostname="127.0.0.1") as tls:
+                assert tls.recv(2) == b"ok"
+                reused.append(tls.session_reused)
+                remember_tls_session(context, "127.0.0.1", tls)
+                tls.sendall(b"x")
+    finally:
+        server.join(5)
+        listener.close()
+
+    assert reused == [False, True]
+
+
+def test_cli_config_show_and_list_read_the_loaded_tvs(tmp_path, monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    from pyvidaa import cli
+    from pyvidaa.config import loader
+
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "default_tv: den\n"
+        "tvs:\n"
+        "  aabbccddeeff:\n    host: 10.0.0.1\n    alias: den\n"
+        "  112233445566:\n    host: 10.0.0.2\n"
+    )
+    monkeypatch.setattr(loader, "CONFIG_SEARCH_PATHS", [path])
+    monkeypatch.setattr(loader, "_cached_config", None)
+    monkeypatch.setattr(loader, "_cached_path", None)
+    monkeypatch.setattr(loader, "_cached_mtime", None)
+
+    assert cli.cmd_config(SimpleNamespace(action="list", value=None)) == 0
+    assert capsys.readouterr().out.splitlines()[1:] == [
+        "  aabbccddeeff (den)",
+        "  112233445566",
+    ]
+
+    cli.cmd_config(SimpleNamespace(action="show", value=None))
+    out = capsys.readouterr().out
+    assert "aabbccddeeff [den] (default)" in out
+    assert "Host:  10.0.0.2" in out
+
+
+def test_on_connect_subscribes_in_one_batch():
+    client = _make_client()
+    client._client = MagicMock()
+
+    client._on_connect(None, None, {}, 0)
+
+    client._client.subscribe.assert_called_once()
+    (topics,), _ = client._client.subscribe.call_args
+    names = [topic for topic, _qos in topics]
+    assert len(names) == len(set(names))
+    assert f"/remoteapp/mobile/{client.client_id}/ui_service/data/sourcelist" in names
+    assert client._subscription_topics() is topics
+    assert client._connect_event.is_set()
+
+
+def test_refused_connect_wakes_the_waiter_without_connecting():
+    client = _make_client()
+    client._client = MagicMock()
+
+    client._on_connect(None, None, {}, 5)
+
+    assert client._connect_event.is_set()
+    assert not client.is_connected
+    client._client.subscribe.assert_not_called()
+
+
+def test_auth_fallback_starts_the_network_thread_only_once_accepted(monkeypatch):
+    import socket
+    import threading
+
+    import paho.mqtt.client as mqtt
+
+    from pyvidaa.protocol import AuthMethod
+
+    listener = socket.create_server(("127.0.0.1", 0))
+    port = listener.getsockname()[1]
+
+    def broker():
+        # Refuse the first two CONNECTs (bad credentials), accept the third
+        for return_code in (5, 5, 0):
+            conn, _addr = listener.accept()
+            with conn:
+                conn.recv(1024)
+                conn.sendall(bytes([0x20, 0x02, 0x00, return_code]))
+                if return_code == 0:
+                    conn.recv(1024)
+
+    server = threading.Thread(target=broker, daemon=True)
+    server.start()
+    started = []
+    loop_start = mqtt.Client.loop_start
+    monkeypatch.setattr(
+        mqtt.Client, "loop_start", lambda self: started.append(self) or loop_start(self)
+    )
+
+    client = VidaaTV(
+        host="127.0.0.1",
+        port=port,
+        mac_address=KNOWN_UUID,
+        use_ssl=False,
+        enable_persistence=False,
+        use_dynamic_auth=True,
+        auth_method=AuthMethod.MODERN,
+    )
+    try:
+        assert client.connect(timeout=5) is True
+        assert client._auth_method == AuthMethod.LEGACY
+        assert started == [client._client]
+    finally:
+        client.disconnect()
+        server.join(5)
+        listener.close()
+
+
+def test_found_cert_pair_is_reused_without_searching_again(tmp_path, monkeypatch):
+    from pyvidaa import certs
+
+    monkeypatch.setenv(certs.ENV_CERT_DIR, str(tmp_path))
+    monkeypatch.setattr(certs, "USER_CERT_DIR", tmp_path / "user")
+    monkeypatch.setattr(certs, "_DEV_CERT_DIR", tmp_path / "dev")
+    monkeypatch.setattr(certs, "_SEARCH_HITS", {})
+    # A miss is not remembered
+    assert certs.resolve_client_certs() is None
+
+    cert = tmp_path / certs.DEFAULT_CERT_FILENAME
+    key = tmp_path / certs.DEFAULT_KEY_FILENAME
+    cert.write_text("cert")
+    key.write_text("key")
+    found = certs.resolve_client_certs()
+    assert found == (str(cert), str(key))
+
+    cert.unlink()
+    assert certs.resolve_client_certs() == found
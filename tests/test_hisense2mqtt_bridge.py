@@ -106,3 +106,18 @@ def test_maybe_refresh_token(monkeypatch, status, expect_refresh):
     bridge._maybe_refresh_token()
 
     assert bridge._tv.refresh_token.called is expect_refresh
+
+
+def test_publish_discovery_sends_retained_entity_configs():
+    """Home Assistant only reads the per-entity config topics."""
+    from hisense2mqtt.discovery import generate_all_discoveries
+
+    bridge = _bridge()
+    bridge._broker_client = MagicMock()
+
+    bridge._publish_discovery()
+
+    expected = [topic for topic, _ in generate_all_discoveries(bridge.config, bridge.device_id)]
+    calls = bridge._broker_client.publish.call_args_list
+    assert [c.args[0] for c in calls] == expected
+    assert all(c.kwargs["retain"] is True for c in calls)
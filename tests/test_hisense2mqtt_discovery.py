@@ -0,0 +1,41 @@
+"""Tests for hisense2mqtt Home Assistant discovery payloads."""
+
+from __future__ import annotations
+
+import json
+
+from hisense2mqtt.discovery import (
+    generate_all_discoveries,
+    remove_all_discoveries,
+)
+
+
+def _config():
+    return {
+        "mqtt": {"host": "broker.local", "discovery_prefix": "homeassistant"},
+        "tv": {"host": "10.0.0.50", "name": "Living Room"},
+    }
+
+
+def test_remove_all_discoveries_covers_generated_topics():
+    config = _config()
+    generated = [topic for topic, _ in generate_all_discoveries(config, "10_0_0_51")]
+
+    topics = remove_all_discoveries(config, "10_0_0_51")
+
+    assert topics == [
+        *generated,
+        "homeassistant/binary_sensor/hisense_10_0_0_51_power/config",
+    ]
+
+
+def test_serialized_discoveries_match_generated_payloads():
+    from hisense2mqtt.discovery import generate_serialized_discoveries
+
+    config = _config()
+    for device_id in ("10_0_0_50", "192_168_100_200"):
+        expected = generate_all_discoveries(config, device_id)
+        serialized = generate_serialized_discoveries(config, device_id)
+        assert [t for t, _ in serialized] == [t for t, _ in expected]
+        assert [json.loads(p) for _, p in serialized] == [p for _, p in expected]
+